@@ -3,6 +3,10 @@ from typing import List, Optional
 import pytest
 
 from protostar.cli.command import Command
+from protostar.starkware_patches import apply_starkware_patches
+
+# Tests import cairo-lang modules directly instead of running commands through `ProtostarCLI`
+apply_starkware_patches()
 
 
 class BaseTestCommand(Command):
@@ -1,4 +1,5 @@
-from protostar.commands.build import BuildCommand
+from protostar.commands.build import BuildCommand, ExportJsonCommand
+from protostar.commands.daemon import DaemonCommand
 from protostar.commands.deploy import DeployCommand
 from protostar.commands.init import InitCommand, init
 from protostar.commands.install import InstallCommand, handle_install_command
@@ -7,6 +8,6 @@ from protostar.commands.remove import (
     handle_remove_command,
     removal_exceptions,
 )
-from protostar.commands.test import TestCommand
+from protostar.commands.test import MergeTestResultsCommand, TestCommand
 from protostar.commands.update import UpdateCommand, handle_update_command
 from protostar.commands.upgrade import UpgradeCommand, upgrade
@@ -1 +1,2 @@
-from .build_project import BuildCommand, build_project
+from protostar.commands.build.build_command import BuildCommand
+from protostar.commands.build.export_json_command import ExportJsonCommand
@@ -0,0 +1,158 @@
+from contextlib import nullcontext
+from functools import partial
+from multiprocessing import cpu_count
+from pathlib import Path
+from typing import List, Optional, Set
+
+from protostar.cli.command import Command
+from protostar.commands.build.build_watcher import BuildWatcher
+from protostar.utils.config.project import Project
+from protostar.utils.protostar_directory import VersionManager
+from protostar.utils.python_profiler import PROFILE_PYTHON_ARG, profile_python
+
+
+class BuildCommand(Command):
+    def __init__(
+        self, project: Project, version_manager: Optional[VersionManager] = None
+    ) -> None:
+        super().__init__()
+        self._project = project
+        self._version_manager = version_manager
+
+    @property
+    def name(self) -> str:
+        return "build"
+
+    @property
+    def description(self) -> str:
+        return "Compile contracts."
+
+    @property
+    def example(self) -> Optional[str]:
+        return "$ protostar build main token"
+
+    @property
+    def arguments(self) -> List[Command.Argument]:
+        return [
+            Command.Argument(
+                name="cairo-path",
+                description="Additional directories to look for sources.",
+                type="directory",
+                is_array=True,
+            ),
+            Command.Argument(
+                name="compact",
+                description=(
+                    "Save compiled contracts in a compact binary format, which is compressed minified JSON "
+                    "many times smaller than the standard format. `protostar deploy` accepts both formats. "
+                    "Use `protostar export-json` to convert them for other tools."
+                ),
+                type="bool",
+            ),
+            Command.Argument(
+                name="contracts",
+                description=(
+                    'Names of contracts from `protostar.toml::["protostar.contracts"]` to build. '
+                    "Builds all contracts by default."
+                ),
+                type="str",
+                is_array=True,
+                is_positional=True,
+            ),
+            Command.Argument(
+                name="disable-hint-validation",
+                description="Disable validation of hints when building the contracts.",
+                type="bool",
+            ),
+            Command.Argument(
+                name="output",
+                short_name="o",
+                description="An output directory used to put the compiled contracts in.",
+                type="path",
+                default="build",
+            ),
+            PROFILE_PYTHON_ARG,
+            Command.Argument(
+                name="watch",
+                description=(
+                    "Keep running and rebuild contracts affected by changes of their files "
+                    "or modules they import. Changes of `protostar.toml` require a restart."
+                ),
+                type="bool",
+            ),
+        ]
+
+    async def run(self, args):
+        # pylint: disable=import-outside-toplevel
+        from protostar.commands.build.build_project import (
+            build_project,
+            create_build_pool,
+        )
+        from protostar.utils.parsed_module_cache import (
+            get_parsed_modules_cache_dir,
+            parsed_module_cache,
+        )
+
+        build = partial(
+            build_project,
+            self._project,
+            args.output,
+            args.cairo_path,
+            args.disable_hint_validation,
+            python_profile_dir=args.profile_python,
+            compact=args.compact,
+            contract_names=args.contracts,
+        )
+        with profile_python(args.profile_python), parsed_module_cache.use_disk_cache(
+            get_parsed_modules_cache_dir(),
+            str(
+                self._version_manager.protostar_version
+                if self._version_manager
+                else None
+            ),
+        ):
+            if args.watch:
+                # Workers are started once, instead of in each rebuild
+                processes_count = min(
+                    len(args.contracts or self._project.config.contracts), cpu_count()
+                )
+                with (
+                    create_build_pool(processes_count, args.profile_python)
+                    if processes_count > 1
+                    else nullcontext()
+                ) as pool:
+                    BuildWatcher(
+                        build=partial(build, pool=pool),
+                        get_watched_paths=partial(
+                            self._get_watched_paths,
+                            args.output,
+                            args.cairo_path,
+                            args.disable_hint_validation,
+                            args.compact,
+                        ),
+                    ).watch()
+            else:
+                build()
+
+    def _get_watched_paths(
+        self,
+        output_dir: Path,
+        cairo_path: List[Path],
+        disable_hint_validation: bool,
+        compact: bool,
+    ) -> Set[Path]:
+        # pylint: disable=import-outside-toplevel
+        from protostar.commands.build.build_project import load_build_manifest
+
+        build_manifest = load_build_manifest(
+            self._project, output_dir, cairo_path, disable_hint_validation, compact
+        )
+        # Components of contracts which failed to compile aren't in the manifest
+        return {
+            *build_manifest.get_source_paths(),
+            *[
+                Path(component)
+                for contract_components in self._project.config.contracts.values()
+                for component in contract_components
+            ],
+        }
@@ -3,3 +3,7 @@ from protostar.protostar_exception import ProtostarException
 
 class CairoCompilationException(ProtostarException):
     pass
+
+
+class UnknownContractException(ProtostarException):
+    pass
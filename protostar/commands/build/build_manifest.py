@@ -0,0 +1,157 @@
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from protostar.utils.compact_contract import COMPACT_CONTRACT_SUFFIX
+
+BUILD_MANIFEST_FILENAME = ".protostar_build_manifest.json"
+
+
+def compute_file_hash(path: Path) -> Optional[str]:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def compute_source_hashes(paths: Iterable[Path]) -> Dict[str, Optional[str]]:
+    return {str(path): compute_file_hash(path) for path in sorted(set(paths))}
+
+
+def get_contract_output_paths(
+    output_dir: Path, contract_name: str, compact: bool = False
+) -> List[Path]:
+    return [
+        Path(
+            output_dir,
+            f"{contract_name}{COMPACT_CONTRACT_SUFFIX if compact else '.json'}",
+        ),
+        Path(output_dir, f"{contract_name}_abi.json"),
+    ]
+
+
+@dataclass(frozen=True)
+class BuildSettings:
+    include_paths: List[str]
+    disable_hint_validation: bool
+    cairo_lang_version: str
+    compact: bool = False
+
+
+@dataclass(frozen=True)
+class ContractBuildInputs:
+    """
+    Main files of a contract with hashes of them and all transitively imported modules.
+    """
+
+    components: List[str]
+    source_hashes: Dict[str, Optional[str]]
+
+    def is_up_to_date(self, components: List[str]) -> bool:
+        return self.components == components and all(
+            compute_file_hash(Path(path)) == source_hash
+            for path, source_hash in self.source_hashes.items()
+        )
+
+
+class BuildManifest:
+    """
+    Inputs of contracts compiled in the previous build. Contracts with unchanged inputs aren't compiled again,
+    and their outputs are left untouched. The manifest is discarded when the build settings change.
+    """
+
+    VERSION = 1
+
+    def __init__(
+        self,
+        settings: BuildSettings,
+        contracts: Optional[Dict[str, ContractBuildInputs]] = None,
+    ) -> None:
+        self._settings = settings
+        self._contracts: Dict[str, ContractBuildInputs] = contracts or {}
+
+    @classmethod
+    def load(cls, path: Path, settings: BuildSettings) -> "BuildManifest":
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                raw_manifest = json.load(file)
+            if (
+                raw_manifest.get("version") != cls.VERSION
+                or raw_manifest.get("include_paths") != settings.include_paths
+                or raw_manifest.get("disable_hint_validation")
+                != settings.disable_hint_validation
+                or raw_manifest.get("cairo_lang_version") != settings.cairo_lang_version
+                or raw_manifest.get("compact", False) != settings.compact
+            ):
+                return cls(settings)
+            return cls(
+                settings,
+                {
+                    contract_name: ContractBuildInputs(
+                        components=list(raw_inputs["components"]),
+                        source_hashes=dict(raw_inputs["source_hashes"]),
+                    )
+                    for contract_name, raw_inputs in raw_manifest["contracts"].items()
+                },
+            )
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            # A missing or corrupted manifest only results in compiling all contracts
+            return cls(settings)
+
+    def save(self, path: Path) -> None:
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "version": self.VERSION,
+                    "include_paths": self._settings.include_paths,
+                    "disable_hint_validation": self._settings.disable_hint_validation,
+                    "cairo_lang_version": self._settings.cairo_lang_version,
+                    "compact": self._settings.compact,
+                    "contracts": {
+                        contract_name: {
+                            "components": inputs.components,
+                            "source_hashes": inputs.source_hashes,
+                        }
+                        for contract_name, inputs in self._contracts.items()
+                    },
+                },
+                file,
+                indent=4,
+                sort_keys=True,
+            )
+            file.write("\n")
+
+    def is_up_to_date(
+        self, output_dir: Path, contract_name: str, components: List[str]
+    ) -> bool:
+        inputs = self._contracts.get(contract_name)
+        return (
+            inputs is not None
+            and inputs.is_up_to_date(components)
+            and all(
+                path.exists()
+                for path in get_contract_output_paths(
+                    output_dir, contract_name, self._settings.compact
+                )
+            )
+        )
+
+    def get_source_paths(self) -> Set[Path]:
+        return {
+            Path(path)
+            for inputs in self._contracts.values()
+            for path in inputs.source_hashes
+        }
+
+    def update(self, contract_name: str, inputs: ContractBuildInputs) -> None:
+        self._contracts[contract_name] = inputs
+
+    def retain(self, contract_names: Iterable[str]) -> None:
+        contract_names = set(contract_names)
+        self._contracts = {
+            contract_name: inputs
+            for contract_name, inputs in self._contracts.items()
+            if contract_name in contract_names
+        }
@@ -0,0 +1,98 @@
+from pathlib import Path
+
+from protostar.commands.build.build_manifest import (
+    BuildManifest,
+    BuildSettings,
+    ContractBuildInputs,
+    compute_source_hashes,
+)
+
+SETTINGS = BuildSettings(
+    include_paths=["lib"], disable_hint_validation=False, cairo_lang_version="0.9.0"
+)
+
+
+def make_built_contract(tmp_path: Path):
+    source_path = tmp_path / "main.cairo"
+    source_path.write_text("func main():\n    return ()\nend\n")
+    imported_path = tmp_path / "utils.cairo"
+    imported_path.write_text("func util():\n    return ()\nend\n")
+    output_dir = tmp_path / "build"
+    output_dir.mkdir()
+    (output_dir / "main.json").write_text("{}")
+    (output_dir / "main_abi.json").write_text("[]")
+
+    build_manifest = BuildManifest(SETTINGS)
+    build_manifest.update(
+        "main",
+        ContractBuildInputs(
+            components=[str(source_path)],
+            source_hashes=compute_source_hashes([source_path, imported_path]),
+        ),
+    )
+    return build_manifest, output_dir, source_path, imported_path
+
+
+def test_unchanged_contract_is_up_to_date(tmp_path: Path):
+    build_manifest, output_dir, source_path, _ = make_built_contract(tmp_path)
+
+    assert build_manifest.is_up_to_date(output_dir, "main", [str(source_path)])
+
+
+def test_changing_imported_module_invalidates_contract(tmp_path: Path):
+    build_manifest, output_dir, source_path, imported_path = make_built_contract(
+        tmp_path
+    )
+
+    imported_path.write_text("func util():\n    return ()\nend\n\n")
+
+    assert not build_manifest.is_up_to_date(output_dir, "main", [str(source_path)])
+
+
+def test_changing_components_or_removing_outputs_invalidates_contract(
+    tmp_path: Path,
+):
+    build_manifest, output_dir, source_path, imported_path = make_built_contract(
+        tmp_path
+    )
+
+    assert not build_manifest.is_up_to_date(
+        output_dir, "main", [str(source_path), str(imported_path)]
+    )
+    (output_dir / "main_abi.json").unlink()
+    assert not build_manifest.is_up_to_date(output_dir, "main", [str(source_path)])
+
+
+def test_manifest_is_discarded_when_settings_change(tmp_path: Path):
+    build_manifest, output_dir, source_path, _ = make_built_contract(tmp_path)
+    manifest_path = output_dir / "manifest.json"
+    build_manifest.save(manifest_path)
+
+    assert BuildManifest.load(manifest_path, SETTINGS).is_up_to_date(
+        output_dir, "main", [str(source_path)]
+    )
+    assert not BuildManifest.load(
+        manifest_path,
+        BuildSettings(
+            include_paths=["lib"],
+            disable_hint_validation=True,
+            cairo_lang_version="0.9.0",
+        ),
+    ).is_up_to_date(output_dir, "main", [str(source_path)])
+    assert not BuildManifest.load(
+        manifest_path,
+        BuildSettings(
+            include_paths=["lib"],
+            disable_hint_validation=False,
+            cairo_lang_version="0.10.0",
+        ),
+    ).is_up_to_date(output_dir, "main", [str(source_path)])
+
+
+def test_loading_corrupted_manifest(tmp_path: Path):
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text("{")
+
+    assert not BuildManifest.load(manifest_path, SETTINGS).is_up_to_date(
+        tmp_path, "main", []
+    )
@@ -1,104 +1,290 @@
 import json
+import multiprocessing
+import signal
+from contextlib import nullcontext
+from dataclasses import dataclass
+from functools import partial
+from multiprocessing.pool import Pool
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
+from starkware.cairo.lang.compiler.error_handling import LocationError
 from starkware.cairo.lang.compiler.preprocessor.preprocessor_error import (
     PreprocessorError,
 )
+from starkware.cairo.lang.version import __version__ as cairo_lang_version
 from starkware.cairo.lang.vm.vm_exceptions import VmException
 from starkware.starkware_utils.error_handling import StarkException
 
-from protostar.cli.command import Command
-from protostar.commands.build.build_exceptions import CairoCompilationException
+from protostar.commands.build.build_exceptions import (
+    CairoCompilationException,
+    UnknownContractException,
+)
+from protostar.commands.build.build_manifest import (
+    BUILD_MANIFEST_FILENAME,
+    BuildManifest,
+    BuildSettings,
+    ContractBuildInputs,
+    compute_source_hashes,
+    get_contract_output_paths,
+)
 from protostar.utils.config.project import Project
+from protostar.starkware_patches import apply_starkware_patches
+from protostar.utils.compact_contract import dump_compact_contract, dump_contract_json
+from protostar.utils.python_profiler import PythonProfiler
 from protostar.utils.starknet_compilation import StarknetCompiler
 
 
-class BuildCommand(Command):
-    def __init__(self, project: Project) -> None:
-        super().__init__()
-        self._project = project
+def build_project(
+    project: Project,
+    output_dir: Path,
+    cairo_path: List[Path],
+    disable_hint_validation: bool,
+    python_profile_dir: Optional[Path] = None,
+    compact: bool = False,
+    contract_names: Optional[List[str]] = None,
+    pool: Optional[Pool] = None,
+) -> List[str]:
+    """
+    Compiles contracts whose inputs changed since the previous build and returns their names.
+    If `contract_names` are provided, only these contracts are considered.
+    Contracts with the same components are compiled once.
+    If `compact` is set, contracts are saved in the compact format instead of JSON.
+    If `pool` is provided, contracts are compiled by its workers instead of a pool created for the build.
+    """
+    # pylint: disable=too-many-arguments, too-many-locals
+    project_paths = _get_include_paths(project, cairo_path)
+    selected_contracts = _select_contracts(project, contract_names)
+    output_dir.mkdir(exist_ok=True)
+
+    build_manifest_path = output_dir / BUILD_MANIFEST_FILENAME
+    build_manifest = load_build_manifest(
+        project, output_dir, cairo_path, disable_hint_validation, compact
+    )
+    build_manifest.retain(project.config.contracts.keys())
 
-    @property
-    def name(self) -> str:
-        return "build"
+    contracts = _group_by_components(
+        (contract_name, contract_components)
+        for contract_name, contract_components in selected_contracts.items()
+        if not build_manifest.is_up_to_date(
+            output_dir, contract_name, contract_components
+        )
+    )
+    compile_contract = partial(
+        _compile_contract,
+        project_paths,
+        disable_hint_validation,
+        compact,
+    )
+    processes_count = min(len(contracts), multiprocessing.cpu_count())
 
-    @property
-    def description(self) -> str:
-        return "Compile contracts."
+    try:
+        if processes_count <= 1:
+            compiled_contracts: Iterable[_CompiledContract] = map(
+                compile_contract, contracts
+            )
+            _save_compiled_contracts(
+                output_dir, compiled_contracts, build_manifest, compact
+            )
+        else:
+            with (
+                nullcontext(pool)
+                if pool
+                else create_build_pool(processes_count, python_profile_dir)
+            ) as build_pool:
+                # `imap` yields results in the config order, so the exception of the first failing
+                # contract is raised, after saving contracts preceding it, as if they were compiled one by one
+                _save_compiled_contracts(
+                    output_dir,
+                    build_pool.imap(compile_contract, contracts),
+                    build_manifest,
+                    compact,
+                )
+    finally:
+        # Contracts compiled before a failure aren't compiled again in the next build
+        build_manifest.save(build_manifest_path)
 
-    @property
-    def example(self) -> Optional[str]:
-        return "$ protostar build"
+    return [
+        contract_name
+        for contract_names, _ in contracts
+        for contract_name in contract_names
+    ]
 
-    @property
-    def arguments(self) -> List[Command.Argument]:
-        return [
-            Command.Argument(
-                name="cairo-path",
-                description="Additional directories to look for sources.",
-                type="directory",
-                is_array=True,
-            ),
-            Command.Argument(
-                name="disable-hint-validation",
-                description="Disable validation of hints when building the contracts.",
-                type="bool",
-            ),
-            Command.Argument(
-                name="output",
-                short_name="o",
-                description="An output directory used to put the compiled contracts in.",
-                type="path",
-                default="build",
-            ),
-        ]
 
-    async def run(self, args):
-        build_project(
-            self._project, args.output, args.cairo_path, args.disable_hint_validation
-        )
+def create_build_pool(
+    processes_count: int, python_profile_dir: Optional[Path] = None
+) -> Pool:
+    """
+    Creates a pool of workers compiling contracts. A pool can be shared by many builds,
+    so workers are started once and keep their compilation caches warm.
+    """
+    return multiprocessing.Pool(
+        processes_count,
+        initializer=_init_worker,
+        initargs=(python_profile_dir,),
+    )
 
 
-def build_project(
+def load_build_manifest(
     project: Project,
     output_dir: Path,
     cairo_path: List[Path],
     disable_hint_validation: bool,
-):
-    project_paths = [*project.get_include_paths(), *[str(pth) for pth in cairo_path]]
-    output_dir.mkdir(exist_ok=True)
+    compact: bool = False,
+) -> BuildManifest:
+    return BuildManifest.load(
+        output_dir / BUILD_MANIFEST_FILENAME,
+        BuildSettings(
+            include_paths=_get_include_paths(project, cairo_path),
+            disable_hint_validation=disable_hint_validation,
+            cairo_lang_version=cairo_lang_version,
+            compact=compact,
+        ),
+    )
+
+
+def _select_contracts(
+    project: Project, contract_names: Optional[List[str]]
+) -> Dict[str, List[str]]:
+    contracts = project.config.contracts
+    if not contract_names:
+        return contracts
+    unknown_contract_names = [
+        contract_name
+        for contract_name in contract_names
+        if contract_name not in contracts
+    ]
+    if unknown_contract_names:
+        raise UnknownContractException(
+            f"Unknown contracts: {', '.join(unknown_contract_names)}\n"
+            'Contracts defined in protostar.toml::["protostar.contracts"]: '
+            + ", ".join(contracts)
+        )
+    return {
+        contract_name: contract_components
+        for contract_name, contract_components in contracts.items()
+        if contract_name in contract_names
+    }
+
 
-    for contract_name, contract_components in project.config.contracts.items():
-        try:
-            contract = StarknetCompiler(
-                include_paths=project_paths,
-                disable_hint_validation=disable_hint_validation,
-            ).compile_contract(
-                *[Path(component) for component in contract_components],
+def _group_by_components(
+    contracts: Iterable[Tuple[str, List[str]]],
+) -> List[Tuple[List[str], List[str]]]:
+    """
+    Groups names of contracts with the same components, preserving the config order.
+    """
+    grouped_contracts: Dict[Tuple[str, ...], List[str]] = {}
+    for contract_name, contract_components in contracts:
+        grouped_contracts.setdefault(tuple(contract_components), []).append(
+            contract_name
+        )
+    return [
+        (contract_names, list(contract_components))
+        for contract_components, contract_names in grouped_contracts.items()
+    ]
+
+
+def _format_contract_names(contract_names: List[str]) -> str:
+    quoted_names = ", ".join(f"'{contract_name}'" for contract_name in contract_names)
+    return f"{quoted_names} contract{'s' if len(contract_names) > 1 else ''}"
+
+
+def _get_include_paths(project: Project, cairo_path: List[Path]) -> List[str]:
+    return [*project.get_include_paths(), *[str(pth) for pth in cairo_path]]
+
+
+@dataclass
+class _CompiledContract:
+    contract_names: List[str]
+    contract_artifact: bytes
+    abi_json: str
+    inputs: ContractBuildInputs
+
+
+_worker_python_profiler: Optional[PythonProfiler] = None
+
+
+def _init_worker(python_profile_dir: Optional[Path]):
+    # pylint: disable=global-statement, invalid-name
+    global _worker_python_profiler
+    # Workers started with `spawn` don't inherit patches applied in the main process
+    apply_starkware_patches()
+    if python_profile_dir:
+        _worker_python_profiler = PythonProfiler(python_profile_dir, "build-worker")
+        _worker_python_profiler.start()
+    # prevents showing a stacktrace on cmd/ctrl + c
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def _compile_contract(
+    include_paths: List[str],
+    disable_hint_validation: bool,
+    compact: bool,
+    contract: Tuple[List[str], List[str]],
+) -> _CompiledContract:
+    contract_names, contract_components = contract
+    imported_module_paths: List[str] = []
+    try:
+        compiled_contract = StarknetCompiler(
+            include_paths=include_paths,
+            disable_hint_validation=disable_hint_validation,
+        ).compile_contract(
+            *[Path(component) for component in contract_components],
+            on_module_read=imported_module_paths.append,
+        )
+    except StarknetCompiler.FileNotFoundException as err:
+        raise StarknetCompiler.FileNotFoundException(
+            message=(
+                err.message
+                + '\nDid you forget to update protostar.toml::["protostar.contracts"]?'
             )
-        except StarknetCompiler.FileNotFoundException as err:
-            raise StarknetCompiler.FileNotFoundException(
-                message=(
-                    err.message
-                    + '\nDid you forget to update protostar.toml::["protostar.contracts"]?'
-                )
-            ) from err
-        except (StarkException, VmException, PreprocessorError) as err:
-            raise CairoCompilationException(
-                f"Protostar couldn't compile '{contract_name}' contract\n{str(err)}"
-            ) from err
-
-        with open(
-            Path(output_dir, f"{contract_name}.json"), mode="w", encoding="utf-8"
-        ) as output_file:
-            json.dump(
-                contract.Schema().dump(contract), output_file, indent=4, sort_keys=True
+        ) from err
+    except (StarkException, VmException, PreprocessorError, LocationError) as err:
+        raise CairoCompilationException(
+            f"Protostar couldn't compile {_format_contract_names(contract_names)}\n{str(err)}"
+        ) from err
+    finally:
+        # Workers are terminated with the pool, so stats are saved after each task
+        if _worker_python_profiler:
+            _worker_python_profiler.stop()
+            _worker_python_profiler.save()
+            _worker_python_profiler.start()
+
+    # Contracts are serialized in workers, as sending bytes to the main process is cheaper
+    # than pickling contract classes
+    return _CompiledContract(
+        contract_names=contract_names,
+        contract_artifact=(
+            dump_compact_contract(compiled_contract)
+            if compact
+            else (dump_contract_json(compiled_contract) + "\n").encode("utf-8")
+        ),
+        abi_json=json.dumps(compiled_contract.abi, indent=4, sort_keys=True),
+        inputs=ContractBuildInputs(
+            components=list(contract_components),
+            source_hashes=compute_source_hashes(
+                Path(path) for path in [*contract_components, *imported_module_paths]
+            ),
+        ),
+    )
+
+
+def _save_compiled_contracts(
+    output_dir: Path,
+    compiled_contracts: Iterable[_CompiledContract],
+    build_manifest: BuildManifest,
+    compact: bool,
+):
+    for compiled_contract in compiled_contracts:
+        for contract_name in compiled_contract.contract_names:
+            output_path, abi_output_path = get_contract_output_paths(
+                output_dir, contract_name, compact
             )
-            output_file.write("\n")
+            with open(output_path, mode="wb") as output_file:
+                output_file.write(compiled_contract.contract_artifact)
+
+            with open(abi_output_path, mode="w", encoding="utf-8") as output_abi_file:
+                output_abi_file.write(compiled_contract.abi_json)
+                output_abi_file.write("\n")
 
-        with open(
-            Path(output_dir, f"{contract_name}_abi.json"), mode="w", encoding="utf-8"
-        ) as output_abi_file:
-            json.dump(contract.abi, output_abi_file, indent=4, sort_keys=True)
-            output_abi_file.write("\n")
+            build_manifest.update(contract_name, compiled_contract.inputs)
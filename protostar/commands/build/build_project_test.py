@@ -1,10 +1,17 @@
 import json
+import multiprocessing
+import shutil
 from pathlib import Path
 
 import pytest
 
-from protostar.commands.build import build_project
-from protostar.commands.build.build_exceptions import CairoCompilationException
+from protostar.commands.build.build_manifest import BUILD_MANIFEST_FILENAME
+from protostar.commands.build.build_project import build_project, create_build_pool
+from protostar.commands.build.build_exceptions import (
+    CairoCompilationException,
+    UnknownContractException,
+)
+from protostar.commands.build.export_json_command import export_json
 from protostar.utils.config.project_test import make_mock_project
 from protostar.utils.starknet_compilation import StarknetCompiler
 
@@ -75,3 +82,224 @@ def test_handling_not_existing_main_files(mocker, tmp_path):
             project=project_mock,
             disable_hint_validation=False,
         )
+
+
+def test_building_many_contracts(mocker, tmp_path):
+    libs_path = str(Path(current_directory, "mock_lib_root"))
+    contract_names = [f"main_{index}" for index in range(3)]
+    contracts = {
+        contract_name: [f"{str(current_directory)}/mock_sources/mock_entry_point.cairo"]
+        for contract_name in contract_names
+    }
+    project_mock = make_mock_project(mocker, contracts, libs_path, current_directory)
+
+    build_project(
+        output_dir=tmp_path,
+        cairo_path=[],
+        project=project_mock,
+        disable_hint_validation=False,
+    )
+
+    for contract_name in contract_names:
+        assert Path(tmp_path, f"{contract_name}.json").read_text("utf-8") == Path(
+            tmp_path, "main_0.json"
+        ).read_text("utf-8")
+        assert Path(tmp_path, f"{contract_name}_abi.json").exists()
+
+
+def test_reporting_first_failing_contract_in_config_order(mocker, tmp_path):
+    libs_path = str(Path(current_directory, "mock_lib_root"))
+    contracts = {
+        "valid": [f"{str(current_directory)}/mock_sources/mock_entry_point.cairo"],
+        "first_invalid": [
+            f"{str(current_directory)}/mock_sources/compilation_error.cairo"
+        ],
+        "second_invalid": [
+            f"{str(current_directory)}/mock_sources/compilation_error.cairo"
+        ],
+    }
+    project_mock = make_mock_project(mocker, contracts, libs_path, current_directory)
+
+    with pytest.raises(CairoCompilationException, match="'first_invalid'"):
+        build_project(
+            output_dir=tmp_path,
+            cairo_path=[],
+            project=project_mock,
+            disable_hint_validation=False,
+        )
+
+    assert Path(tmp_path, "valid.json").exists()
+
+
+def test_rebuilding_only_changed_contracts(mocker, tmp_path):
+    libs_path = str(Path(current_directory, "mock_lib_root"))
+    sources_dir = tmp_path / "src"
+    shutil.copytree(Path(current_directory, "mock_sources"), sources_dir)
+    shutil.copy(sources_dir / "mock_entry_point.cairo", sources_dir / "other.cairo")
+    contracts = {
+        "main": [str(sources_dir / "mock_entry_point.cairo")],
+        "other": [str(sources_dir / "other.cairo")],
+    }
+    project_mock = make_mock_project(mocker, contracts, libs_path, current_directory)
+    output_dir = tmp_path / "build"
+
+    def build():
+        build_project(
+            output_dir=output_dir,
+            cairo_path=[],
+            project=project_mock,
+            disable_hint_validation=False,
+        )
+
+    def get_mtimes():
+        return {
+            path.name: path.stat().st_mtime_ns
+            for path in output_dir.glob("*.json")
+            if path.name != BUILD_MANIFEST_FILENAME
+        }
+
+    build()
+    initial_mtimes = get_mtimes()
+
+    build()
+    assert get_mtimes() == initial_mtimes
+
+    with open(sources_dir / "other.cairo", mode="a", encoding="utf-8") as file:
+        file.write("\n")
+    compile_contract_spy = mocker.spy(StarknetCompiler, "compile_contract")
+    build()
+    compile_contract_spy.assert_called_once()
+    assert compile_contract_spy.call_args[0][1] == sources_dir / "other.cairo"
+    assert get_mtimes()["main.json"] == initial_mtimes["main.json"]
+
+
+def test_reusing_pool_between_builds(mocker, tmp_path):
+    libs_path = str(Path(current_directory, "mock_lib_root"))
+    sources_dir = tmp_path / "src"
+    shutil.copytree(Path(current_directory, "mock_sources"), sources_dir)
+    contract_paths = [sources_dir / f"main_{index}.cairo" for index in range(2)]
+    for contract_path in contract_paths:
+        shutil.copy(sources_dir / "mock_entry_point.cairo", contract_path)
+    project_mock = make_mock_project(
+        mocker,
+        {contract_path.stem: [str(contract_path)] for contract_path in contract_paths},
+        libs_path,
+        current_directory,
+    )
+
+    mocker.patch.object(multiprocessing, "cpu_count", return_value=2)
+    compile_contract_spy = mocker.spy(StarknetCompiler, "compile_contract")
+
+    with create_build_pool(2) as pool:
+        pool_spy = mocker.spy(multiprocessing, "Pool")
+        built_contract_names = []
+        for _ in range(2):
+            for contract_path in contract_paths:
+                with open(contract_path, mode="a", encoding="utf-8") as file:
+                    file.write("\n")
+            built_contract_names.append(
+                build_project(
+                    output_dir=tmp_path / "build",
+                    cairo_path=[],
+                    project=project_mock,
+                    disable_hint_validation=False,
+                    pool=pool,
+                )
+            )
+
+    pool_spy.assert_not_called()
+    # Contracts compiled by workers aren't compiled in the main process
+    compile_contract_spy.assert_not_called()
+    assert built_contract_names == [["main_0", "main_1"], ["main_0", "main_1"]]
+
+
+def test_building_compact_contracts(mocker, tmp_path):
+    libs_path = str(Path(current_directory, "mock_lib_root"))
+    contracts = {
+        "main": [f"{str(current_directory)}/mock_sources/mock_entry_point.cairo"]
+    }
+    project_mock = make_mock_project(mocker, contracts, libs_path, current_directory)
+    json_dir = tmp_path / "json"
+    compact_dir = tmp_path / "compact"
+
+    for output_dir, compact in [(json_dir, False), (compact_dir, True)]:
+        build_project(
+            output_dir=output_dir,
+            cairo_path=[],
+            project=project_mock,
+            disable_hint_validation=False,
+            compact=compact,
+        )
+
+    assert not Path(compact_dir, "main.json").exists()
+    assert Path(compact_dir, "main_abi.json").read_text("utf-8") == Path(
+        json_dir, "main_abi.json"
+    ).read_text("utf-8")
+    assert export_json([compact_dir / "main.bin"], tmp_path / "exported") == [
+        tmp_path / "exported" / "main.json"
+    ]
+    assert Path(tmp_path, "exported", "main.json").read_text("utf-8") == Path(
+        json_dir, "main.json"
+    ).read_text("utf-8")
+
+
+def test_building_selected_contracts(mocker, tmp_path):
+    libs_path = str(Path(current_directory, "mock_lib_root"))
+    contracts = {
+        contract_name: [f"{str(current_directory)}/mock_sources/mock_entry_point.cairo"]
+        for contract_name in ["main", "token", "other"]
+    }
+    project_mock = make_mock_project(mocker, contracts, libs_path, current_directory)
+
+    built_contract_names = build_project(
+        output_dir=tmp_path,
+        cairo_path=[],
+        project=project_mock,
+        disable_hint_validation=False,
+        contract_names=["token", "main"],
+    )
+
+    assert built_contract_names == ["main", "token"]
+    assert Path(tmp_path, "main.json").exists()
+    assert Path(tmp_path, "token.json").exists()
+    assert not Path(tmp_path, "other.json").exists()
+
+
+def test_handling_unknown_contract_names(mocker, tmp_path):
+    libs_path = str(Path(current_directory, "mock_lib_root"))
+    contracts = {
+        "main": [f"{str(current_directory)}/mock_sources/mock_entry_point.cairo"]
+    }
+    project_mock = make_mock_project(mocker, contracts, libs_path, current_directory)
+
+    with pytest.raises(UnknownContractException, match="token"):
+        build_project(
+            output_dir=tmp_path,
+            cairo_path=[],
+            project=project_mock,
+            disable_hint_validation=False,
+            contract_names=["main", "token"],
+        )
+
+
+def test_compiling_contracts_with_same_components_once(mocker, tmp_path):
+    libs_path = str(Path(current_directory, "mock_lib_root"))
+    contracts = {
+        "main": [f"{str(current_directory)}/mock_sources/mock_entry_point.cairo"],
+        "alias": [f"{str(current_directory)}/mock_sources/mock_entry_point.cairo"],
+    }
+    project_mock = make_mock_project(mocker, contracts, libs_path, current_directory)
+    compile_contract_spy = mocker.spy(StarknetCompiler, "compile_contract")
+
+    build_project(
+        output_dir=tmp_path,
+        cairo_path=[],
+        project=project_mock,
+        disable_hint_validation=False,
+    )
+
+    compile_contract_spy.assert_called_once()
+    assert Path(tmp_path, "alias.json").read_text("utf-8") == Path(
+        tmp_path, "main.json"
+    ).read_text("utf-8")
+    assert Path(tmp_path, "alias_abi.json").exists()
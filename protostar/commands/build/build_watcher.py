@@ -0,0 +1,76 @@
+import time
+from logging import getLogger
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from protostar.protostar_exception import ProtostarException
+
+FileSnapshot = Dict[Path, Optional[int]]
+
+
+class BuildWatcher:
+    """
+    Builds contracts and rebuilds them each time watched files change, until interrupted.
+    Rebuilds happen in the same process and can share its pool of workers, so compilation caches stay warm.
+    """
+
+    def __init__(
+        self,
+        build: Callable[[], List[str]],
+        get_watched_paths: Callable[[], Iterable[Path]],
+        poll_interval: float = 0.5,
+    ) -> None:
+        self._build = build
+        self._get_watched_paths = get_watched_paths
+        self._poll_interval = poll_interval
+
+    def watch(self, max_rebuilds_count: Optional[int] = None) -> None:
+        logger = getLogger()
+        self._rebuild()
+        snapshot = self._take_snapshot()
+        logger.info("Watching for changes...")
+
+        rebuilds_count = 0
+        while max_rebuilds_count is None or rebuilds_count < max_rebuilds_count:
+            time.sleep(self._poll_interval)
+            current_snapshot = self._take_snapshot()
+            changed_paths = sorted(
+                path
+                for path in snapshot.keys() | current_snapshot.keys()
+                if snapshot.get(path) != current_snapshot.get(path)
+            )
+            if not changed_paths:
+                continue
+
+            logger.info("Changed: %s", ", ".join(str(path) for path in changed_paths))
+            self._rebuild()
+            rebuilds_count += 1
+            # Rebuilt contracts can import new modules
+            snapshot = self._take_snapshot()
+
+    def _rebuild(self) -> None:
+        logger = getLogger()
+        start_time = time.perf_counter()
+        try:
+            built_contract_names = self._build()
+        except ProtostarException as err:
+            logger.error(err.message)
+            return
+        duration = time.perf_counter() - start_time
+        if built_contract_names:
+            logger.info("Built %s in %.2fs", ", ".join(built_contract_names), duration)
+        else:
+            logger.info("All contracts are up to date (%.2fs)", duration)
+
+    def _take_snapshot(self) -> FileSnapshot:
+        return {
+            path: self._get_modification_time(path)
+            for path in self._get_watched_paths()
+        }
+
+    @staticmethod
+    def _get_modification_time(path: Path) -> Optional[int]:
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return None
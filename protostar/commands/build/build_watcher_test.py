@@ -0,0 +1,84 @@
+from functools import partial
+from pathlib import Path
+from typing import List
+
+from pytest_mock import MockerFixture
+
+from protostar.commands.build.build_exceptions import CairoCompilationException
+from protostar.commands.build.build_project import build_project
+from protostar.commands.build.build_watcher import BuildWatcher
+from protostar.utils.config.project_test import make_mock_project
+
+
+def test_rebuilding_after_watched_file_changes(mocker: MockerFixture, tmp_path: Path):
+    watched_path = tmp_path / "main.cairo"
+    watched_path.write_text("")
+    unwatched_path = tmp_path / "other.cairo"
+    built_contract_names: List[List[str]] = [["main", "other"], ["main"]]
+    build = mocker.MagicMock(side_effect=built_contract_names)
+
+    def change_files(_seconds: float):
+        unwatched_path.write_text("// changed")
+        if sleep_mock.call_count == 2:
+            watched_path.write_text("// changed")
+
+    sleep_mock = mocker.patch(
+        "protostar.commands.build.build_watcher.time.sleep", side_effect=change_files
+    )
+
+    BuildWatcher(
+        build=build,
+        get_watched_paths=lambda: [watched_path],
+        poll_interval=0,
+    ).watch(max_rebuilds_count=1)
+
+    assert build.call_count == 2
+    assert sleep_mock.call_count == 2
+
+
+def test_watching_after_failed_build(mocker: MockerFixture, tmp_path: Path):
+    watched_path = tmp_path / "main.cairo"
+    build = mocker.MagicMock(
+        side_effect=[CairoCompilationException("Syntax error"), ["main"]]
+    )
+    mocker.patch(
+        "protostar.commands.build.build_watcher.time.sleep",
+        side_effect=lambda _: watched_path.write_text("// fixed"),
+    )
+
+    BuildWatcher(
+        build=build,
+        get_watched_paths=lambda: [watched_path],
+        poll_interval=0,
+    ).watch(max_rebuilds_count=1)
+
+    assert build.call_count == 2
+
+
+def test_watching_after_syntax_error(mocker: MockerFixture, tmp_path: Path):
+    contract_path = tmp_path / "main.cairo"
+    contract_path.write_text("%lang starknet\nfunc f(:\n", "utf-8")
+    mocker.patch(
+        "protostar.commands.build.build_watcher.time.sleep",
+        side_effect=lambda _: contract_path.write_text("%lang starknet\n", "utf-8"),
+    )
+    build = mocker.MagicMock(
+        side_effect=partial(
+            build_project,
+            make_mock_project(
+                mocker, {"main": [str(contract_path)]}, str(tmp_path), tmp_path
+            ),
+            tmp_path / "build",
+            [],
+            False,
+        )
+    )
+
+    BuildWatcher(
+        build=build,
+        get_watched_paths=lambda: [contract_path],
+        poll_interval=0,
+    ).watch(max_rebuilds_count=1)
+
+    assert build.call_count == 2
+    assert (tmp_path / "build" / "main.json").exists()
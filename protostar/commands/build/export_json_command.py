@@ -0,0 +1,70 @@
+from logging import getLogger
+from pathlib import Path
+from typing import List, Optional
+
+from protostar.cli.command import Command
+
+
+class ExportJsonCommand(Command):
+    @property
+    def name(self) -> str:
+        return "export-json"
+
+    @property
+    def description(self) -> str:
+        return (
+            "Convert contracts saved by `protostar build --compact` to the standard JSON format, "
+            "e.g. for tools other than Protostar."
+        )
+
+    @property
+    def example(self) -> Optional[str]:
+        return "$ protostar export-json build/main.bin"
+
+    @property
+    def arguments(self) -> List[Command.Argument]:
+        return [
+            Command.Argument(
+                name="contracts",
+                description="Paths to compiled contracts in the compact format.",
+                type="path",
+                is_array=True,
+                is_positional=True,
+                is_required=True,
+            ),
+            Command.Argument(
+                name="output",
+                short_name="o",
+                description=(
+                    "An output directory used to put the JSON files in. "
+                    "Defaults to the directory of each contract."
+                ),
+                type="path",
+            ),
+        ]
+
+    async def run(self, args):
+        for json_path in export_json(args.contracts, args.output):
+            getLogger().info("Exported %s", json_path)
+
+
+def export_json(
+    contract_paths: List[Path], output_dir: Optional[Path] = None
+) -> List[Path]:
+    """
+    Saves contracts in the same JSON format as `protostar build` and returns paths of created files.
+    """
+    # pylint: disable=import-outside-toplevel
+    from protostar.utils.compact_contract import dump_contract_json, load_contract_class
+
+    json_paths: List[Path] = []
+    for contract_path in contract_paths:
+        contract_class = load_contract_class(contract_path)
+        if output_dir:
+            output_dir.mkdir(parents=True, exist_ok=True)
+        json_path = (output_dir or contract_path.parent) / f"{contract_path.stem}.json"
+        with open(json_path, mode="w", encoding="utf-8") as json_file:
+            json_file.write(dump_contract_json(contract_class))
+            json_file.write("\n")
+        json_paths.append(json_path)
+    return json_paths
@@ -0,0 +1 @@
+from protostar.commands.daemon.daemon_command import DaemonCommand
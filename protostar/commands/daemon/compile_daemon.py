@@ -0,0 +1,207 @@
+import os
+import pickle
+import socketserver
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from starkware.cairo.lang.compiler.cairo_compile import compile_cairo_ex, get_codes
+from starkware.cairo.lang.compiler.program import Program
+from starkware.cairo.lang.version import __version__ as cairo_lang_version
+from starkware.starknet.compiler.compile import get_abi, get_entry_points_by_type
+from starkware.starknet.compiler.starknet_preprocessor import (
+    StarknetPreprocessedProgram,
+)
+from starkware.starknet.services.api.contract_class import ContractClass
+
+from protostar.commands.build.build_manifest import compute_source_hashes
+from protostar.utils.compile_daemon_client import (
+    CompileDaemonRequest,
+    CompileDaemonResponse,
+    receive_message,
+    send_message,
+)
+from protostar.utils.starknet_compilation import StarknetCompiler
+
+OnModuleRead = Callable[[str], None]
+
+
+def _preprocess_contract(
+    on_module_read: OnModuleRead,
+    sources: List[str],
+    include_paths: List[str],
+    disable_hint_validation: bool,
+) -> StarknetPreprocessedProgram:
+    return StarknetCompiler(
+        include_paths=include_paths,
+        disable_hint_validation=disable_hint_validation,
+        use_compile_daemon=False,
+    ).preprocess_contract(
+        *[Path(source) for source in sources], on_module_read=on_module_read
+    )
+
+
+def _compile_contract(
+    on_module_read: OnModuleRead,
+    sources: List[str],
+    include_paths: List[str],
+    disable_hint_validation: bool,
+    add_debug_info: bool = False,
+) -> ContractClass:
+    return StarknetCompiler(
+        include_paths=include_paths,
+        disable_hint_validation=disable_hint_validation,
+        use_compile_daemon=False,
+    ).compile_contract(
+        *[Path(source) for source in sources],
+        add_debug_info=add_debug_info,
+        on_module_read=on_module_read,
+    )
+
+
+def _get_contract_class(
+    on_module_read: OnModuleRead,
+    sources: List[str],
+    include_paths: List[str],
+    disable_hint_validation: bool,
+) -> ContractClass:
+    # Mirrors `starkware.starknet.testing.contract_utils.get_contract_class`, used by the `declare` cheatcode,
+    # with a module reader reporting imported modules
+    pass_manager = StarknetCompiler(
+        include_paths=include_paths,
+        disable_hint_validation=disable_hint_validation,
+        use_compile_daemon=False,
+    ).get_starknet_pass_manager(on_module_read)
+    program, preprocessed = compile_cairo_ex(
+        code=get_codes(sources), debug_info=True, pass_manager=pass_manager
+    )
+    program = Program.load(data=program.dump())
+    return ContractClass(
+        program=program,
+        entry_points_by_type=get_entry_points_by_type(program=program),
+        abi=get_abi(preprocessed=preprocessed),
+    )
+
+
+@dataclass(frozen=True)
+class _CachedResponse:
+    response: CompileDaemonResponse
+    source_hashes: Dict[str, Optional[str]]
+
+    def is_up_to_date(self) -> bool:
+        return (
+            compute_source_hashes(Path(path) for path in self.source_hashes)
+            == self.source_hashes
+        )
+
+
+class _ThreadingUnixStreamServer(socketserver.ThreadingUnixStreamServer):  # type: ignore
+    daemon_threads = True
+
+
+class CompileDaemon:
+    """
+    Compiles contracts on behalf of other Protostar processes and keeps results in memory.
+    A result is reused until any of the compiled files or modules imported by them changes.
+    """
+
+    HANDLERS: Dict[str, Callable[..., Any]] = {
+        "preprocess_contract": _preprocess_contract,
+        "compile_contract": _compile_contract,
+        "get_contract_class": _get_contract_class,
+    }
+
+    def __init__(self) -> None:
+        self._cached_responses: Dict[Tuple[str, str, str], _CachedResponse] = {}
+        self._server: Optional[socketserver.UnixStreamServer] = None
+        self._compilation_lock = threading.Lock()
+
+    def handle(self, request: CompileDaemonRequest) -> CompileDaemonResponse:
+        if request.cairo_lang_version != cairo_lang_version:
+            return CompileDaemonResponse(
+                error=f"The daemon uses cairo-lang {cairo_lang_version}"
+            )
+        handler = self.HANDLERS.get(request.method)
+        if handler is None:
+            return CompileDaemonResponse(error=f"Unknown method: {request.method}")
+
+        key = (request.method, request.cwd, repr(sorted(request.kwargs.items())))
+        cached_response = self._cached_responses.get(key)
+        if cached_response and cached_response.is_up_to_date():
+            return cached_response.response
+
+        # Compilations change the working directory and use caches shared by the process, so they run one by one.
+        # Clients compile by themselves rather than waiting for another compilation to finish.
+        # The lock is released in `finally`, as `with` can't acquire it without blocking
+        # pylint: disable-next=consider-using-with
+        if not self._compilation_lock.acquire(blocking=False):
+            return CompileDaemonResponse(
+                error="The daemon is compiling another contract"
+            )
+        try:
+            return self._compile(key, handler, request)
+        finally:
+            self._compilation_lock.release()
+
+    def _compile(
+        self,
+        key: Tuple[str, str, str],
+        handler: Callable[..., Any],
+        request: CompileDaemonRequest,
+    ) -> CompileDaemonResponse:
+        # Relative paths in requests are relative to the working directory of the client
+        os.chdir(request.cwd)
+        imported_module_paths: List[str] = []
+        try:
+            result = handler(imported_module_paths.append, **request.kwargs)
+        except Exception as err:  # pylint: disable=broad-except
+            # Clients compile by themselves to raise the error
+            return CompileDaemonResponse(error=str(err))
+
+        response = CompileDaemonResponse(
+            result=result, imported_module_paths=imported_module_paths
+        )
+        self._cached_responses[key] = _CachedResponse(
+            response=response,
+            source_hashes=compute_source_hashes(
+                Path(os.path.abspath(path))
+                for path in [*request.kwargs["sources"], *imported_module_paths]
+            ),
+        )
+        return response
+
+    def serve(self, socket_path: Path) -> None:
+        compile_daemon = self
+
+        class RequestHandler(socketserver.BaseRequestHandler):
+            def handle(self) -> None:
+                try:
+                    request = receive_message(self.request)
+                except EOFError:
+                    # Clients connect without sending requests to check if the daemon is running
+                    return
+                response = compile_daemon.handle(request)
+                try:
+                    send_message(self.request, response)
+                except (pickle.PicklingError, TypeError, AttributeError) as err:
+                    send_message(self.request, CompileDaemonResponse(error=str(err)))
+
+        # Connections are handled in threads, so cached results are sent during compilations.
+        # The socket is created accessible only to the current user, as requests are unpickled.
+        previous_umask = os.umask(0o177)
+        try:
+            server = _ThreadingUnixStreamServer(str(socket_path), RequestHandler)
+        finally:
+            os.umask(previous_umask)
+        with server:
+            self._server = server
+            try:
+                server.serve_forever()
+            finally:
+                self._server = None
+                socket_path.unlink()
+
+    def shutdown(self) -> None:
+        if self._server:
+            self._server.shutdown()
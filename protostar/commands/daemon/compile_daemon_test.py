@@ -0,0 +1,166 @@
+import os
+import socket
+import stat
+import tempfile
+import time
+from pathlib import Path
+from threading import Thread
+
+import pytest
+from pytest_mock import MockerFixture
+from starkware.starknet.services.api.contract_class import ContractClass
+from starkware.starknet.testing.contract_utils import get_contract_class
+
+from protostar.commands.daemon.compile_daemon import CompileDaemon
+from protostar.protostar_exception import ProtostarException
+from protostar.utils.compile_daemon_client import (
+    COMPILE_DAEMON_SOCKET_ENV,
+    compile_daemon_client,
+    get_compile_daemon_socket_path,
+    prepare_compile_daemon_socket_dir,
+    receive_message,
+    send_message,
+)
+from protostar.utils.starknet_compilation import StarknetCompiler
+
+CONTRACT_PATH = (
+    Path(__file__).parent.parent / "build" / "mock_sources" / "mock_entry_point.cairo"
+)
+
+
+@pytest.fixture(name="socket_path")
+def socket_path_fixture(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    socket_path = tmp_path / "daemon.sock"
+    monkeypatch.setenv(COMPILE_DAEMON_SOCKET_ENV, str(socket_path))
+    return socket_path
+
+
+@pytest.fixture(name="compile_daemon")
+def compile_daemon_fixture(socket_path: Path):
+    compile_daemon = CompileDaemon()
+    thread = Thread(target=compile_daemon.serve, args=(socket_path,))
+    thread.start()
+    while not compile_daemon_client.is_running():
+        time.sleep(0.01)
+    yield compile_daemon
+    compile_daemon.shutdown()
+    thread.join()
+
+
+def make_compiler() -> StarknetCompiler:
+    return StarknetCompiler(
+        include_paths=[
+            str(CONTRACT_PATH.parent.parent),
+            str(CONTRACT_PATH.parent.parent / "mock_lib_root"),
+        ],
+        disable_hint_validation=False,
+    )
+
+
+def test_sending_messages():
+    first_socket, second_socket = socket.socketpair()
+    with first_socket, second_socket:
+        send_message(first_socket, {"sources": ["main.cairo"]})
+        assert receive_message(second_socket) == {"sources": ["main.cairo"]}
+
+
+def test_falling_back_when_daemon_is_not_running(socket_path: Path):
+    assert not socket_path.exists()
+    assert compile_daemon_client.request("compile_contract") is None
+    assert isinstance(make_compiler().compile_contract(CONTRACT_PATH), ContractClass)
+
+
+@pytest.mark.usefixtures("compile_daemon")
+def test_reusing_compiled_contracts(mocker: MockerFixture):
+    preprocess_contract_spy = mocker.spy(StarknetCompiler, "_preprocess_contract")
+    imported_module_paths = []
+
+    first_contract = make_compiler().compile_contract(
+        CONTRACT_PATH, on_module_read=imported_module_paths.append
+    )
+    second_contract = make_compiler().compile_contract(CONTRACT_PATH)
+
+    assert preprocess_contract_spy.call_count == 1
+    assert first_contract.abi == second_contract.abi
+    assert any(path.endswith("mock_util.cairo") for path in imported_module_paths)
+
+
+@pytest.mark.usefixtures("compile_daemon")
+def test_getting_same_contract_class_as_starknet_testing():
+    include_paths = make_compiler().include_paths
+
+    response = compile_daemon_client.request(
+        "get_contract_class",
+        sources=[str(CONTRACT_PATH)],
+        include_paths=include_paths,
+        disable_hint_validation=False,
+    )
+
+    assert response is not None
+    assert isinstance(response.result, ContractClass)
+    assert response.result == get_contract_class(
+        source=str(CONTRACT_PATH), cairo_path=include_paths
+    )
+    assert any(
+        path.endswith("mock_util.cairo") for path in response.imported_module_paths
+    )
+
+
+@pytest.mark.usefixtures("compile_daemon")
+def test_compiling_changed_contract_again(mocker: MockerFixture, tmp_path: Path):
+    contract_path = tmp_path / "main.cairo"
+    contract_path.write_text(CONTRACT_PATH.read_text())
+    preprocess_contract_spy = mocker.spy(StarknetCompiler, "_preprocess_contract")
+
+    make_compiler().compile_contract(contract_path)
+    with open(contract_path, mode="a", encoding="utf-8") as file:
+        file.write("\n")
+    make_compiler().compile_contract(contract_path)
+
+    assert preprocess_contract_spy.call_count == 2
+
+
+@pytest.mark.usefixtures("compile_daemon")
+def test_creating_socket_accessible_only_to_current_user(socket_path: Path):
+    assert stat.S_IMODE(os.stat(socket_path).st_mode) & 0o077 == 0
+
+
+@pytest.mark.usefixtures("compile_daemon")
+def test_ignoring_sockets_of_other_users(mocker: MockerFixture):
+    mocker.patch("os.getuid", return_value=os.getuid() + 1)
+
+    assert not compile_daemon_client.is_running()
+    assert compile_daemon_client.request("compile_contract") is None
+
+
+def test_rejecting_temporary_socket_directory_of_other_users(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+):
+    monkeypatch.delenv(COMPILE_DAEMON_SOCKET_ENV, raising=False)
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    monkeypatch.setattr(tempfile, "gettempdir", lambda: str(tmp_path))
+    socket_path = get_compile_daemon_socket_path()
+
+    prepare_compile_daemon_socket_dir(socket_path)
+    assert stat.S_IMODE(os.stat(socket_path.parent).st_mode) == 0o700
+
+    os.chmod(socket_path.parent, 0o777)
+    with pytest.raises(ProtostarException):
+        prepare_compile_daemon_socket_dir(socket_path)
+
+
+def test_sending_cached_results_during_compilation(
+    compile_daemon: CompileDaemon, mocker: MockerFixture, tmp_path: Path
+):
+    contract_path = tmp_path / "main.cairo"
+    contract_path.write_text(CONTRACT_PATH.read_text())
+    make_compiler().compile_contract(CONTRACT_PATH)
+    request_spy = mocker.spy(StarknetCompiler, "_request_compile_daemon")
+
+    # pylint: disable=protected-access
+    with compile_daemon._compilation_lock:
+        make_compiler().compile_contract(CONTRACT_PATH)
+        assert request_spy.spy_return is not None
+
+        make_compiler().compile_contract(contract_path)
+        assert request_spy.spy_return is None
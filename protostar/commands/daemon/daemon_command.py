@@ -0,0 +1,57 @@
+from logging import getLogger
+from typing import List, Optional
+
+from protostar.cli.command import Command
+from protostar.protostar_exception import ProtostarException
+from protostar.utils.compile_daemon_client import (
+    COMPILE_DAEMON_SOCKET_ENV,
+    compile_daemon_client,
+    get_compile_daemon_socket_path,
+    prepare_compile_daemon_socket_dir,
+)
+
+
+class DaemonCommand(Command):
+    @property
+    def name(self) -> str:
+        return "daemon"
+
+    @property
+    def description(self) -> str:
+        return (
+            "Start a compile server which keeps compiled contracts in memory until interrupted. "
+            "`build`, `test` and the `deploy_contract` cheatcode send compilation requests to it when it's running. "
+            "It listens on a unix socket, which can be changed with "
+            f"the `{COMPILE_DAEMON_SOCKET_ENV}` environment variable."
+        )
+
+    @property
+    def example(self) -> Optional[str]:
+        return "$ protostar daemon"
+
+    @property
+    def arguments(self) -> List[Command.Argument]:
+        return []
+
+    async def run(self, args):
+        # pylint: disable=import-outside-toplevel
+        from protostar.commands.daemon.compile_daemon import CompileDaemon
+
+        if not compile_daemon_client.enabled:
+            raise ProtostarException(
+                "Protostar daemon requires unix sockets, which aren't supported on this platform"
+            )
+        socket_path = get_compile_daemon_socket_path()
+        prepare_compile_daemon_socket_dir(socket_path)
+        if compile_daemon_client.is_running():
+            raise ProtostarException(
+                f"Protostar daemon is already running and listening on {socket_path}"
+            )
+        if socket_path.exists():
+            # Left by a daemon which was killed
+            socket_path.unlink()
+
+        # Compilations in the daemon can't be sent to the daemon itself
+        compile_daemon_client.enabled = False
+        getLogger().info("Protostar daemon is listening on %s", socket_path)
+        CompileDaemon().serve(socket_path)
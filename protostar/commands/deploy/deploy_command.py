@@ -3,13 +3,11 @@ from pathlib import Path
 from typing import List, Optional
 
 from protostar.cli.command import Command
+from protostar.commands.deploy.gateway_response import SuccessfulGatewayResponse
 from protostar.commands.deploy.network_config import NetworkConfig
-from protostar.commands.deploy.starkware.starknet_cli import (
-    SuccessfulGatewayResponse,
-    deploy,
-)
 from protostar.protostar_exception import ProtostarException
 from protostar.utils.config.project import Project
+from protostar.utils.python_profiler import PROFILE_PYTHON_ARG, profile_python
 
 
 class CompilationOutputNotFoundException(ProtostarException):
@@ -64,7 +62,7 @@ class DeployCommand(Command):
         return [
             Command.Argument(
                 name="contract",
-                description="The path to the compiled contract.",
+                description="The path to the compiled contract, in the JSON or the compact format.",
                 type="path",
                 is_required=True,
                 is_positional=True,
@@ -98,19 +96,21 @@ class DeployCommand(Command):
             ),
             DeployCommand.gateway_url_arg,
             DeployCommand.network_arg,
+            PROFILE_PYTHON_ARG,
         ]
 
     async def run(self, args):
-        return await self.deploy(
-            compiled_contract_path=args.contract,
-            network=args.network,
-            gateway_url=args.gateway_url,
-            inputs=args.inputs,
-            token=args.token,
-            salt=args.salt,
-        )
+        with profile_python(args.profile_python):
+            return await self.deploy(
+                compiled_contract_path=args.contract,
+                network=args.network,
+                gateway_url=args.gateway_url,
+                inputs=args.inputs,
+                token=args.token,
+                salt=args.salt,
+            )
 
-    # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-arguments, too-many-locals
     async def deploy(
         self,
         compiled_contract_path: Path,
@@ -120,6 +120,9 @@ class DeployCommand(Command):
         token: Optional[str] = None,
         salt: Optional[str] = None,
     ) -> SuccessfulGatewayResponse:
+        # pylint: disable=import-outside-toplevel
+        from protostar.commands.deploy.starkware.starknet_cli import deploy
+
         logger = getLogger()
 
         network_config = self._build_network_config(
@@ -133,8 +136,7 @@ class DeployCommand(Command):
         try:
             with open(
                 self._project.project_root / compilation_output_filepath,
-                mode="r",
-                encoding="utf-8",
+                mode="rb",
             ) as compiled_contract_file:
                 response = await deploy(
                     gateway_url=network_config.gateway_url,
@@ -1,16 +1,18 @@
 from typing import List, Optional
 
-from starkware.starknet.cli.starknet_cli import NETWORKS
-
 from protostar.protostar_exception import ProtostarException
 
+# Networks defined in `starkware.starknet.cli.starknet_cli.NETWORKS`. They are listed in the `deploy` command help,
+# which is built on each run, and importing `starknet_cli` takes long.
+STARKNET_NETWORK_NAMES = ["alpha-goerli", "alpha-mainnet"]
+
 
 class UnknownStarkwareNetworkException(ProtostarException):
     def __init__(self):
         message_lines: List[str] = []
         message_lines.append("Unknown starkware network")
         message_lines.append("The following starkware network names are supported:")
-        for network_name in NETWORKS:
+        for network_name in NetworkConfig.get_starknet_networks():
             message_lines.append(f"- {network_name}")
         super().__init__("\n".join(message_lines))
 
@@ -18,13 +20,16 @@ class UnknownStarkwareNetworkException(ProtostarException):
 class NetworkConfig:
     @staticmethod
     def get_starknet_networks() -> List[str]:
-        return list(NETWORKS.keys())
+        return list(STARKNET_NETWORK_NAMES)
 
     @classmethod
     def from_starknet_network_name(
         cls,
         starkware_network_name: str,
     ) -> "NetworkConfig":
+        # pylint: disable=import-outside-toplevel
+        from starkware.starknet.cli.starknet_cli import NETWORKS
+
         if starkware_network_name not in NETWORKS:
             raise UnknownStarkwareNetworkException()
 
@@ -1,4 +1,5 @@
 import pytest
+from starkware.starknet.cli.starknet_cli import NETWORKS
 
 from protostar.commands.deploy.network_config import (
     NetworkConfig,
@@ -16,6 +17,10 @@ def test_loading_starkware_networks():
     )
 
 
+def test_listing_starkware_networks():
+    assert NetworkConfig.get_starknet_networks() == list(NETWORKS.keys())
+
+
 def test_unknown_network_name_error():
     with pytest.raises(UnknownStarkwareNetworkException):
         NetworkConfig.from_starknet_network_name("foobar")
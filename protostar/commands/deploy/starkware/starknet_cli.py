@@ -1,11 +1,9 @@
-from io import TextIOWrapper
-from typing import Optional, Sequence, Union
+from typing import BinaryIO, Optional, Sequence, TextIO, Union
 
 from services.external_api.client import RetryConfig
 from starkware.starknet.cli.starknet_cli import assert_tx_received, validate_arguments
 from starkware.starknet.definitions import constants, fields
 from starkware.starknet.public.abi_structs import identifier_manager_from_abi
-from starkware.starknet.services.api.contract_class import ContractClass
 from starkware.starknet.services.api.gateway.gateway_client import GatewayClient
 from starkware.starknet.services.api.gateway.transaction import Deploy
 from starkware.starknet.utils.api_utils import cast_to_felts
@@ -13,6 +11,7 @@ from starkware.starkware_utils.error_handling import StarkErrorCode
 
 from protostar.commands.deploy.gateway_response import SuccessfulGatewayResponse
 from protostar.protostar_exception import ProtostarException
+from protostar.utils.compact_contract import parse_contract_class
 
 
 class DeployContractException(ProtostarException):
@@ -21,7 +20,7 @@ class DeployContractException(ProtostarException):
 
 async def deploy(
     gateway_url: str,
-    compiled_contract_file: TextIOWrapper,
+    compiled_contract_file: Union[TextIO, BinaryIO],
     constructor_args: Optional[Sequence[Union[str, int]]] = None,
     salt: Optional[str] = None,
     token: Optional[str] = None,
@@ -42,7 +41,8 @@ async def deploy(
     except ValueError as err:
         raise ValueError("Invalid salt format.") from err
 
-    contract_class = ContractClass.loads(data=compiled_contract_file.read())
+    # Contracts can be saved by `protostar build --compact`
+    contract_class = parse_contract_class(compiled_contract_file.read())
     abi = contract_class.abi
     assert abi is not None, "Missing ABI in the given contract class."
 
@@ -3,9 +3,6 @@ import shutil
 from pathlib import Path
 from typing import Any, List, Optional, Type
 
-from git.exc import InvalidGitRepositoryError
-from git.repo import Repo
-
 from protostar.cli import Command
 from protostar.utils import VersionManager, log_color_provider
 from protostar.utils.config.project import Project, ProjectConfig
@@ -107,11 +104,7 @@ class ProjectCreator:
             lib_pth.mkdir(parents=True)
 
         project.write_config(self.config)
-
-        try:
-            Repo(project_root, search_parent_directories=True)
-        except InvalidGitRepositoryError:
-            Repo.init(project_root)
+        init_git_repository(project_root)
 
     @staticmethod
     def copy_template(script_root: Path, template_name: str, project_path: Path):
@@ -139,11 +132,18 @@ class OnlyConfigCreator(ProjectCreator):
 
         project = Project(self._version_manager, project_root)
         project.write_config(self.config)
+        init_git_repository(project_root)
+
+
+def init_git_repository(project_root: Path):
+    # pylint: disable=import-outside-toplevel
+    from git.exc import InvalidGitRepositoryError
+    from git.repo import Repo
 
-        try:
-            Repo(project_root, search_parent_directories=True)
-        except InvalidGitRepositoryError:
-            Repo.init(project_root)
+    try:
+        Repo(project_root, search_parent_directories=True)
+    except InvalidGitRepositoryError:
+        Repo.init(project_root)
 
 
 def get_creator(args: Any) -> Type[ProjectCreator]:
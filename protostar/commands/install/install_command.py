@@ -2,10 +2,6 @@ from logging import getLogger
 from typing import Any, List, Optional
 
 from protostar.cli import Command
-from protostar.commands.install.install_package_from_repo import (
-    install_package_from_repo,
-)
-from protostar.commands.install.pull_package_submodules import pull_package_submodules
 from protostar.utils import Project, extract_info_from_repo_id, log_color_provider
 
 EXTERNAL_DEPENDENCY_REFERENCE_DESCRIPTION = """- `GITHUB_ACCOUNT_NAME/REPO_NAME[@TAG]`
@@ -55,6 +51,14 @@ class InstallCommand(Command):
 
 
 def handle_install_command(args: Any, project: Project) -> None:
+    # pylint: disable=import-outside-toplevel
+    from protostar.commands.install.install_package_from_repo import (
+        install_package_from_repo,
+    )
+    from protostar.commands.install.pull_package_submodules import (
+        pull_package_submodules,
+    )
+
     logger = getLogger()
 
     if args.package is not None and args.package != "":
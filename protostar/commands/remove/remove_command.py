@@ -5,7 +5,6 @@ from protostar.cli import Command
 from protostar.commands.install.install_command import (
     EXTERNAL_DEPENDENCY_REFERENCE_DESCRIPTION,
 )
-from protostar.commands.remove.remove_package import remove_package
 from protostar.utils import Project, log_color_provider, retrieve_real_package_name
 
 INTERNAL_DEPENDENCY_REFERENCE_DESCRIPTION = (
@@ -49,6 +48,9 @@ class RemoveCommand(Command):
 
 
 def handle_remove_command(args: Any, project: Project):
+    # pylint: disable=import-outside-toplevel
+    from protostar.commands.remove.remove_package import remove_package
+
     logger = getLogger()
 
     package_name = retrieve_real_package_name(
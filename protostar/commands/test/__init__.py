@@ -1 +1,2 @@
+from .merge_test_results_command import MergeTestResultsCommand
 from .test_command import TestCommand
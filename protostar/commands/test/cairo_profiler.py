@@ -0,0 +1,151 @@
+from bisect import bisect_right
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from starkware.cairo.lang.compiler.program import Program
+from starkware.cairo.lang.vm.relocatable import RelocatableValue
+
+CairoFrame = str
+FoldedStack = Tuple[CairoFrame, ...]
+
+
+class CairoProfiler:
+    """
+    Counts Cairo VM steps per call stack, including calls to other contracts.
+    Call stacks are reconstructed from the trace by following frame pointers,
+    and program counters are mapped to functions and lines with the program's debug info.
+    """
+
+    def __init__(self) -> None:
+        self.step_counts: "Counter[FoldedStack]" = Counter()
+        # Runners of entry points being executed, with call stacks leading to them
+        self._active_runs: List[Tuple[Any, FoldedStack]] = []
+        self._frame_labels: Dict[Tuple[int, int], CairoFrame] = {}
+        self._sorted_instruction_offsets: Dict[int, List[int]] = {}
+
+    def profile_run(self, runner: Any, run: Callable[[], Any]) -> Any:
+        """
+        Calls `run`, which executes an entry point with `runner`, and counts steps of the execution.
+        Entry points run while `run` is being called are counted as calls from the current frame.
+        """
+        caller_stack: FoldedStack = ()
+        if self._active_runs:
+            caller_runner, caller_runner_stack = self._active_runs[-1]
+            caller_stack = caller_runner_stack + self._get_call_stack(
+                caller_runner,
+                caller_runner.vm.run_context.pc,
+                caller_runner.vm.run_context.fp,
+            )
+
+        self._active_runs.append((runner, caller_stack))
+        try:
+            return run()
+        finally:
+            self._active_runs.pop()
+            self._count_steps(runner, caller_stack)
+
+    def save_folded_stacks(self, path: Path) -> None:
+        """
+        Saves step counts in the folded stacks format, accepted by `flamegraph.pl` and speedscope.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            for stack, count in self.step_counts.most_common():
+                file.write(f"{';'.join(stack)} {count}\n")
+
+    def _count_steps(self, runner: Any, caller_stack: FoldedStack) -> None:
+        cairo_vm = getattr(runner, "vm", None)
+        if cairo_vm is None:
+            return
+        call_stacks: Dict[Tuple[Any, Any], FoldedStack] = {}
+        for entry in cairo_vm.trace:
+            key = (entry.pc, entry.fp)
+            if key not in call_stacks:
+                call_stacks[key] = caller_stack + self._get_call_stack(
+                    runner, entry.pc, entry.fp
+                )
+            self.step_counts[call_stacks[key]] += 1
+
+    def _get_call_stack(
+        self, runner: Any, program_counter: Any, frame_pointer: Any
+    ) -> FoldedStack:
+        program: Program = runner.program
+        program_base = runner.program_base
+        initial_fp = getattr(runner, "initial_fp", None)
+        memory = runner.vm_memory
+
+        frames: List[CairoFrame] = [
+            self._get_frame_label(program, program_base, program_counter)
+        ]
+        while (
+            frame_pointer != initial_fp
+            and isinstance(frame_pointer, RelocatableValue)
+            and frame_pointer.offset >= 2
+        ):
+            return_pc = memory.get(frame_pointer - 1)
+            previous_fp = memory.get(frame_pointer - 2)
+            if not isinstance(return_pc, RelocatableValue) or previous_fp is None:
+                break
+            # The return address points right after the call instruction
+            frames.append(self._get_frame_label(program, program_base, return_pc - 1))
+            frame_pointer = previous_fp
+        frames.reverse()
+        return tuple(frames)
+
+    def _get_frame_label(
+        self, program: Program, program_base: Any, program_counter: Any
+    ) -> CairoFrame:
+        offset = (
+            program_counter - program_base
+            if isinstance(program_counter, RelocatableValue)
+            else program_counter
+        )
+        if not isinstance(offset, int):
+            return f"pc={program_counter}"
+        key = (id(program), offset)
+        if key not in self._frame_labels:
+            self._frame_labels[key] = self._build_frame_label(program, offset)
+        return self._frame_labels[key]
+
+    def _build_frame_label(self, program: Program, offset: int) -> CairoFrame:
+        debug_info = program.debug_info
+        if debug_info is None:
+            return f"pc={offset}"
+
+        instruction_locations = debug_info.instruction_locations
+        if offset not in instruction_locations:
+            if id(program) not in self._sorted_instruction_offsets:
+                self._sorted_instruction_offsets[id(program)] = sorted(
+                    instruction_locations.keys()
+                )
+            sorted_offsets = self._sorted_instruction_offsets[id(program)]
+            index = bisect_right(sorted_offsets, offset) - 1
+            if index < 0:
+                return f"pc={offset}"
+            offset = sorted_offsets[index]
+
+        instruction_location = instruction_locations[offset]
+        function_name = (
+            str(instruction_location.accessible_scopes[-1])
+            if instruction_location.accessible_scopes
+            else f"pc={offset}"
+        )
+        location = instruction_location.inst
+        if location.input_file.filename is None:
+            return function_name
+        return f"{function_name} ({location.input_file.filename}:{location.start_line})"
+
+
+def get_cairo_profile_path(
+    profile_dir: Path, test_suite_path: Path, test_case_name: str
+) -> Path:
+    try:
+        relative_test_suite_path = test_suite_path.resolve().relative_to(Path.cwd())
+    except ValueError:
+        relative_test_suite_path = Path(test_suite_path.name)
+    return (
+        profile_dir
+        / relative_test_suite_path.with_suffix("")
+        / f"{test_case_name}.folded"
+    )
@@ -3,3 +3,7 @@ from protostar.commands.test.cheatcodes.expect_revert_cheatcode import (
     ExpectRevertCheatcode,
 )
 from protostar.commands.test.cheatcodes.roll_cheatcode import RollCheatcode
+from protostar.commands.test.cheatcodes.expect_max_resources_cheatcode import (
+    ExecutionResourcesBudget,
+    ExpectMaxResourcesCheatcode,
+)
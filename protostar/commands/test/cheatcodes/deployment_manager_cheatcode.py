@@ -20,6 +20,9 @@ from starkware.starknet.core.os.syscall_utils import (
 from starkware.starknet.core.os.contract_address.contract_address import (
     calculate_contract_address_from_hash,
 )
+from starkware.starknet.services.api.contract_class import ContractClass
+
+from protostar.utils.compile_daemon_client import compile_daemon_client
 
 
 @dataclass
@@ -87,8 +90,19 @@ class DeployContractCheatcode(BusinessLogicSysCallHandler):
         return DeclaredContract(class_hash)
 
     async def _declare_contract(self, contract_path):
-        contract_class = get_contract_class(
-            source=contract_path, cairo_path=self.general_config.cheatcodes_cairo_path
+        response = compile_daemon_client.request(
+            "get_contract_class",
+            sources=[str(contract_path)],
+            include_paths=self.general_config.cheatcodes_cairo_path,
+            disable_hint_validation=False,
+        )
+        contract_class = (
+            response.result
+            if response and isinstance(response.result, ContractClass)
+            else get_contract_class(
+                source=contract_path,
+                cairo_path=self.general_config.cheatcodes_cairo_path,
+            )
         )
 
         tx = await InternalDeclare.create_for_testing(
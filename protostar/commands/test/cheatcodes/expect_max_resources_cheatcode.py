@@ -0,0 +1,99 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+from protostar.commands.test.cheatcodes._cheatcode import Cheatcode
+from protostar.commands.test.starkware.cheatable_syscall_handler import (
+    CheatableSysCallHandler,
+)
+from protostar.commands.test.test_cases import ExecutionResourcesSummary
+from protostar.commands.test.test_environment_exceptions import (
+    CheatcodeException,
+    ExecutionResourcesBudgetExceededException,
+)
+
+if TYPE_CHECKING:
+    from protostar.commands.test.test_execution_environment import (
+        TestExecutionEnvironment,
+    )
+
+
+@dataclass(frozen=True)
+class ExecutionResourcesBudget:
+    max_steps: Optional[int] = None
+    max_builtins: Dict[str, int] = field(default_factory=dict)
+
+    def check(
+        self, resources: ExecutionResourcesSummary, scope_description: str
+    ) -> None:
+        exceeded_resources: List[Tuple[str, int, int]] = []
+        if self.max_steps is not None and resources.n_steps > self.max_steps:
+            exceeded_resources.append(("steps", resources.n_steps, self.max_steps))
+        for builtin_name, limit in self.max_builtins.items():
+            used = resources.builtin_instance_counter.get(builtin_name, 0)
+            if used > limit:
+                exceeded_resources.append((builtin_name, used, limit))
+        if exceeded_resources:
+            raise ExecutionResourcesBudgetExceededException(
+                scope_description, exceeded_resources
+            )
+
+
+class ExpectMaxResourcesCheatcode(Cheatcode):
+    """
+    Limits steps and builtins used by the next call made from the test case or by the whole test case.
+    The limits are checked when the test case finishes.
+    """
+
+    SCOPES = ("next_call", "test_case")
+
+    def __init__(
+        self,
+        testing_execution_environment: "TestExecutionEnvironment",
+        cheatable_syscall_handler: CheatableSysCallHandler,
+    ) -> None:
+        super().__init__()
+        self._testing_execution_environment = testing_execution_environment
+        self._cheatable_syscall_handler = cheatable_syscall_handler
+
+    @property
+    def name(self) -> str:
+        return "expect_max_resources"
+
+    def build(self) -> Callable:
+        def expect_max_resources(
+            steps: Optional[int] = None,
+            builtins: Optional[Dict[str, int]] = None,
+            scope: str = "next_call",
+        ):
+            if steps is None and not builtins:
+                raise CheatcodeException(
+                    self.name, "Provide the maximum number of steps or builtins."
+                )
+            if scope not in self.SCOPES:
+                raise CheatcodeException(
+                    self.name,
+                    f"Unknown scope '{scope}', expected one of: {', '.join(self.SCOPES)}",
+                )
+
+            budget = ExecutionResourcesBudget(
+                max_steps=steps,
+                max_builtins={
+                    self._normalize_builtin_name(builtin_name): limit
+                    for builtin_name, limit in (builtins or {}).items()
+                },
+            )
+            # Calls made from the test case are recorded in order, so the next call has the current count as its index
+            call_index = (
+                len(self._cheatable_syscall_handler.internal_calls)
+                if scope == "next_call"
+                else None
+            )
+            self._testing_execution_environment.expect_max_resources(budget, call_index)
+
+        return expect_max_resources
+
+    @staticmethod
+    def _normalize_builtin_name(builtin_name: str) -> str:
+        if builtin_name.endswith("_builtin"):
+            return builtin_name
+        return f"{builtin_name}_builtin"
@@ -0,0 +1,221 @@
+import json
+import re
+from dataclasses import dataclass
+from logging import Logger
+from pathlib import Path
+from typing import Dict, List
+
+from protostar.commands.test.execution_resources_report import (
+    ExecutionResourcesReport,
+)
+from protostar.commands.test.test_cases import ExecutionResourcesSummary
+from protostar.protostar_exception import ProtostarException
+from protostar.utils.log_color_provider import log_color_provider
+
+
+class InvalidExecutionResourcesBaselineException(ProtostarException):
+    pass
+
+
+class ExecutionResourcesRegressionException(ProtostarException):
+    pass
+
+
+def parse_max_regression(value: str) -> float:
+    """
+    Parses a percentage, e.g. `5%` or `5`, into a ratio.
+    """
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)%?", value.strip())
+    if not match:
+        raise InvalidExecutionResourcesBaselineException(
+            f"Invalid max regression '{value}', expected a percentage, e.g. 5%"
+        )
+    return float(match.group(1)) / 100
+
+
+@dataclass(frozen=True)
+class ExecutionResourceChange:
+    test_case_key: str
+    resource_name: str
+    baseline: int
+    current: int
+
+    @property
+    def ratio(self) -> float:
+        if self.baseline == 0:
+            return float("inf") if self.current > 0 else 0.0
+        return (self.current - self.baseline) / self.baseline
+
+    def format_ratio(self) -> str:
+        if self.ratio == float("inf"):
+            return "new"
+        return f"{self.ratio:+.2%}"
+
+
+@dataclass
+class ExecutionResourcesComparison:
+    changes: List[ExecutionResourceChange]
+    regressions: List[ExecutionResourceChange]
+    new_test_case_keys: List[str]
+    missing_test_case_keys: List[str]
+    max_regression: float
+
+    def format_table(self) -> str:
+        lines: List[str] = [log_color_provider.bold("Execution resources changes:")]
+        if not self.changes:
+            lines.append("No changes")
+        for change in self.changes:
+            formatted_ratio = change.format_ratio().rjust(8)
+            if change in self.regressions:
+                formatted_ratio = log_color_provider.colorize("RED", formatted_ratio)
+            elif change.ratio < 0:
+                formatted_ratio = log_color_provider.colorize("GREEN", formatted_ratio)
+            lines.append(
+                f"{formatted_ratio}  {change.baseline:>9} -> {change.current:<9}  "
+                f"{change.resource_name:<20} "
+                f"{log_color_provider.colorize('GRAY', change.test_case_key)}"
+            )
+        if self.new_test_case_keys:
+            lines.append(
+                f"{len(self.new_test_case_keys)} test case(s) not found in the baseline"
+            )
+        if self.missing_test_case_keys:
+            lines.append(
+                f"{len(self.missing_test_case_keys)} test case(s) from the baseline weren't run or didn't pass"
+            )
+        return "\n".join(lines)
+
+    def log(self, logger: Logger) -> None:
+        logger.info(self.format_table())
+
+    def assert_no_regressions(self) -> None:
+        if self.regressions:
+            raise ExecutionResourcesRegressionException(
+                f"Execution resources of {len({change.test_case_key for change in self.regressions})} "
+                f"test case(s) regressed by more than {self.max_regression:.2%}"
+            )
+
+
+class ExecutionResourcesBaseline:
+    """
+    Steps and builtins used by test cases, saved to be compared with later runs.
+    """
+
+    VERSION = 1
+
+    def __init__(self, test_cases: Dict[str, ExecutionResourcesSummary]) -> None:
+        self.test_cases = test_cases
+
+    @staticmethod
+    def get_key(file_path: Path, test_case_name: str) -> str:
+        return f"{file_path.as_posix()}::{test_case_name}"
+
+    @classmethod
+    def from_report(
+        cls, report: ExecutionResourcesReport
+    ) -> "ExecutionResourcesBaseline":
+        return cls(
+            {
+                cls.get_key(row.file_path, row.test_case_name): row.execution_resources
+                for row in report.rows
+            }
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "ExecutionResourcesBaseline":
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                raw_baseline = json.load(file)
+            if raw_baseline.get("version") != cls.VERSION:
+                raise InvalidExecutionResourcesBaselineException(
+                    f"Unsupported execution resources baseline version in '{path}'"
+                )
+            return cls(
+                {
+                    key: ExecutionResourcesSummary(
+                        n_steps=raw_resources["n_steps"],
+                        builtin_instance_counter=raw_resources[
+                            "builtin_instance_counter"
+                        ],
+                        n_memory_holes=raw_resources.get("n_memory_holes", 0),
+                    )
+                    for key, raw_resources in raw_baseline["test_cases"].items()
+                }
+            )
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as ex:
+            raise InvalidExecutionResourcesBaselineException(
+                f"Couldn't load execution resources baseline from '{path}': {ex}"
+            ) from ex
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "version": self.VERSION,
+                    "test_cases": {
+                        key: {
+                            "n_steps": resources.n_steps,
+                            "builtin_instance_counter": resources.builtin_instance_counter,
+                            "n_memory_holes": resources.n_memory_holes,
+                        }
+                        for key, resources in sorted(self.test_cases.items())
+                    },
+                },
+                file,
+                indent=2,
+            )
+
+    def compare(
+        self, current: "ExecutionResourcesBaseline", max_regression: float
+    ) -> ExecutionResourcesComparison:
+        changes: List[ExecutionResourceChange] = []
+        for key in sorted(self.test_cases.keys() & current.test_cases.keys()):
+            changes.extend(
+                self._compare_test_case(
+                    key, self.test_cases[key], current.test_cases[key]
+                )
+            )
+        return ExecutionResourcesComparison(
+            changes=changes,
+            regressions=[change for change in changes if change.ratio > max_regression],
+            new_test_case_keys=sorted(
+                current.test_cases.keys() - self.test_cases.keys()
+            ),
+            missing_test_case_keys=sorted(
+                self.test_cases.keys() - current.test_cases.keys()
+            ),
+            max_regression=max_regression,
+        )
+
+    @staticmethod
+    def _compare_test_case(
+        key: str,
+        baseline: ExecutionResourcesSummary,
+        current: ExecutionResourcesSummary,
+    ) -> List[ExecutionResourceChange]:
+        baseline_counts: Dict[str, int] = {
+            "steps": baseline.n_steps,
+            **baseline.builtin_instance_counter,
+        }
+        current_counts: Dict[str, int] = {
+            "steps": current.n_steps,
+            **current.builtin_instance_counter,
+        }
+        changes: List[ExecutionResourceChange] = []
+        for resource_name in sorted(
+            baseline_counts.keys() | current_counts.keys(),
+            key=lambda name: (name != "steps", name),
+        ):
+            baseline_count = baseline_counts.get(resource_name, 0)
+            current_count = current_counts.get(resource_name, 0)
+            if baseline_count != current_count:
+                changes.append(
+                    ExecutionResourceChange(
+                        test_case_key=key,
+                        resource_name=resource_name,
+                        baseline=baseline_count,
+                        current=current_count,
+                    )
+                )
+        return changes
@@ -0,0 +1,73 @@
+from pathlib import Path
+
+import pytest
+
+from protostar.commands.test.execution_resources_baseline import (
+    ExecutionResourcesBaseline,
+    ExecutionResourcesRegressionException,
+    InvalidExecutionResourcesBaselineException,
+    parse_max_regression,
+)
+from protostar.commands.test.test_cases import ExecutionResourcesSummary
+
+
+def make_resources(n_steps: int, pedersen: int = 0) -> ExecutionResourcesSummary:
+    return ExecutionResourcesSummary(
+        n_steps=n_steps,
+        builtin_instance_counter={"pedersen_builtin": pedersen},
+        n_memory_holes=0,
+    )
+
+
+def test_comparing_with_saved_baseline(tmp_path: Path):
+    baseline_path = tmp_path / "baseline.json"
+    ExecutionResourcesBaseline(
+        {
+            "tests/test_main.cairo::test_a": make_resources(100, pedersen=1),
+            "tests/test_main.cairo::test_b": make_resources(100),
+            "tests/test_main.cairo::test_removed": make_resources(100),
+        }
+    ).save(baseline_path)
+
+    comparison = ExecutionResourcesBaseline.load(baseline_path).compare(
+        ExecutionResourcesBaseline(
+            {
+                "tests/test_main.cairo::test_a": make_resources(104, pedersen=2),
+                "tests/test_main.cairo::test_b": make_resources(90),
+                "tests/test_main.cairo::test_added": make_resources(100),
+            }
+        ),
+        max_regression=0.05,
+    )
+
+    assert [
+        (change.test_case_key, change.resource_name) for change in comparison.changes
+    ] == [
+        ("tests/test_main.cairo::test_a", "steps"),
+        ("tests/test_main.cairo::test_a", "pedersen_builtin"),
+        ("tests/test_main.cairo::test_b", "steps"),
+    ]
+    assert [change.resource_name for change in comparison.regressions] == [
+        "pedersen_builtin"
+    ]
+    assert comparison.new_test_case_keys == ["tests/test_main.cairo::test_added"]
+    assert comparison.missing_test_case_keys == ["tests/test_main.cairo::test_removed"]
+    with pytest.raises(ExecutionResourcesRegressionException):
+        comparison.assert_no_regressions()
+
+
+def test_loading_missing_baseline(tmp_path: Path):
+    with pytest.raises(InvalidExecutionResourcesBaselineException):
+        ExecutionResourcesBaseline.load(tmp_path / "baseline.json")
+
+
+@pytest.mark.parametrize(
+    "value, expected", [("5%", 0.05), ("0", 0.0), (" 12.5% ", 0.125)]
+)
+def test_parsing_max_regression(value: str, expected: float):
+    assert parse_max_regression(value) == pytest.approx(expected)
+
+
+def test_parsing_invalid_max_regression():
+    with pytest.raises(InvalidExecutionResourcesBaselineException):
+        parse_max_regression("-5%")
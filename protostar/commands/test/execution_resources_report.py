@@ -0,0 +1,153 @@
+import csv
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List
+
+from protostar.commands.test.test_cases import (
+    ExecutionResourcesSummary,
+    PassedTestCase,
+)
+from protostar.protostar_exception import ProtostarException
+from protostar.utils.log_color_provider import log_color_provider
+
+
+class InvalidExecutionResourcesReportPathException(ProtostarException):
+    pass
+
+
+@dataclass(frozen=True)
+class TestCaseExecutionResources:
+    file_path: Path
+    test_case_name: str
+    execution_resources: ExecutionResourcesSummary
+
+
+class ExecutionResourcesReport:
+    """
+    Execution resources of passed test cases, from the most expensive.
+    """
+
+    SUPPORTED_SUFFIXES = (".csv", ".json")
+
+    def __init__(self, rows: List[TestCaseExecutionResources]) -> None:
+        self.rows = sorted(
+            rows,
+            key=lambda row: (
+                -row.execution_resources.n_steps,
+                row.file_path.as_posix(),
+                row.test_case_name,
+            ),
+        )
+
+    @classmethod
+    def from_case_results(
+        cls, case_results: Iterable[PassedTestCase]
+    ) -> "ExecutionResourcesReport":
+        return cls(
+            [
+                TestCaseExecutionResources(
+                    file_path=case_result.file_path,
+                    test_case_name=case_result.test_case_name,
+                    execution_resources=case_result.execution_resources,
+                )
+                for case_result in case_results
+                if case_result.execution_resources is not None
+            ]
+        )
+
+    @classmethod
+    def validate_path(cls, path: Path) -> None:
+        if path.suffix not in cls.SUPPORTED_SUFFIXES:
+            raise InvalidExecutionResourcesReportPathException(
+                f"Unsupported execution resources report file '{path}', "
+                f"expected one of: {', '.join(cls.SUPPORTED_SUFFIXES)}"
+            )
+
+    @property
+    def builtin_names(self) -> List[str]:
+        return sorted(
+            {
+                builtin_name
+                for row in self.rows
+                for builtin_name in row.execution_resources.builtin_instance_counter
+            }
+        )
+
+    def format_table(self) -> str:
+        builtin_names = self.builtin_names
+        header = ["steps", "memory holes", *builtin_names]
+        widths = [max(len(column), 9) for column in header]
+
+        lines: List[str] = [
+            log_color_provider.bold("Execution resources:"),
+            log_color_provider.bold(
+                "  ".join(column.rjust(width) for column, width in zip(header, widths))
+                + "  test case"
+            ),
+        ]
+        for row in self.rows:
+            resources = row.execution_resources
+            values = [
+                resources.n_steps,
+                resources.n_memory_holes,
+                *(
+                    resources.builtin_instance_counter.get(builtin_name, 0)
+                    for builtin_name in builtin_names
+                ),
+            ]
+            lines.append(
+                "  ".join(
+                    str(value).rjust(width) for value, width in zip(values, widths)
+                )
+                + f"  {log_color_provider.colorize('GRAY', str(row.file_path))} {row.test_case_name}"
+            )
+        return "\n".join(lines)
+
+    def save(self, path: Path) -> None:
+        self.validate_path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix == ".csv":
+            self._save_as_csv(path)
+        else:
+            self._save_as_json(path)
+
+    def _save_as_csv(self, path: Path) -> None:
+        builtin_names = self.builtin_names
+        with open(path, "w", encoding="utf-8", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(
+                ["file_path", "test_case_name", "n_steps", "n_memory_holes"]
+                + builtin_names
+            )
+            for row in self.rows:
+                resources = row.execution_resources
+                writer.writerow(
+                    [
+                        row.file_path.as_posix(),
+                        row.test_case_name,
+                        resources.n_steps,
+                        resources.n_memory_holes,
+                    ]
+                    + [
+                        resources.builtin_instance_counter.get(builtin_name, 0)
+                        for builtin_name in builtin_names
+                    ]
+                )
+
+    def _save_as_json(self, path: Path) -> None:
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(
+                [
+                    {
+                        "file_path": row.file_path.as_posix(),
+                        "test_case_name": row.test_case_name,
+                        "n_steps": row.execution_resources.n_steps,
+                        "n_memory_holes": row.execution_resources.n_memory_holes,
+                        "builtin_instance_counter": row.execution_resources.builtin_instance_counter,
+                    }
+                    for row in self.rows
+                ],
+                file,
+                indent=2,
+            )
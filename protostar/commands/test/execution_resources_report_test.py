@@ -0,0 +1,83 @@
+import csv
+import json
+from pathlib import Path
+
+import pytest
+
+from protostar.commands.test.execution_resources_report import (
+    ExecutionResourcesReport,
+    InvalidExecutionResourcesReportPathException,
+)
+from protostar.commands.test.test_cases import (
+    ExecutionResourcesSummary,
+    PassedTestCase,
+)
+
+
+def make_report() -> ExecutionResourcesReport:
+    return ExecutionResourcesReport.from_case_results(
+        [
+            PassedTestCase(
+                file_path=Path("tests/test_main.cairo"),
+                test_case_name="test_cheap",
+                execution_resources=ExecutionResourcesSummary(
+                    n_steps=10, builtin_instance_counter={}, n_memory_holes=1
+                ),
+            ),
+            PassedTestCase(
+                file_path=Path("tests/test_main.cairo"),
+                test_case_name="test_expensive",
+                execution_resources=ExecutionResourcesSummary(
+                    n_steps=100,
+                    builtin_instance_counter={"pedersen_builtin": 3},
+                    n_memory_holes=0,
+                ),
+            ),
+            PassedTestCase(
+                file_path=Path("tests/test_main.cairo"),
+                test_case_name="test_expecting_revert",
+            ),
+        ]
+    )
+
+
+def test_rows_are_sorted_from_the_most_steps():
+    report = make_report()
+
+    assert [row.test_case_name for row in report.rows] == [
+        "test_expensive",
+        "test_cheap",
+    ]
+    assert report.builtin_names == ["pedersen_builtin"]
+
+
+def test_saving_as_csv(tmp_path: Path):
+    path = tmp_path / "resources.csv"
+
+    make_report().save(path)
+
+    with open(path, encoding="utf-8") as file:
+        rows = list(csv.DictReader(file))
+    assert rows[0]["test_case_name"] == "test_expensive"
+    assert rows[0]["pedersen_builtin"] == "3"
+    assert rows[1]["pedersen_builtin"] == "0"
+
+
+def test_saving_as_json(tmp_path: Path):
+    path = tmp_path / "resources.json"
+
+    make_report().save(path)
+
+    rows = json.loads(path.read_text())
+    assert rows[1] == {
+        "file_path": "tests/test_main.cairo",
+        "test_case_name": "test_cheap",
+        "n_steps": 10,
+        "n_memory_holes": 1,
+        "builtin_instance_counter": {},
+    }
+
+
+def test_unsupported_file_format(tmp_path: Path):
+    with pytest.raises(InvalidExecutionResourcesReportPathException):
+        make_report().save(tmp_path / "resources.txt")
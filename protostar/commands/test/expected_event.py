@@ -1,7 +1,5 @@
-import os
 from collections import deque
 from enum import Enum
-from pathlib import Path
 from typing import List, Tuple, Union
 
 from starkware.starknet.business_logic.execution.objects import Event
@@ -11,12 +9,6 @@ from typing_extensions import Literal, NotRequired, TypedDict
 from protostar.commands.test.test_suite import TestSuite
 
 
-def collect_immediate_subdirectories(root_dir: Path) -> List[str]:
-    assert root_dir.is_dir(), f"{root_dir} is supposed to be a directory!"
-    (root, dirs, _) = next(os.walk(str(root_dir.resolve())))
-    return [str(Path(root, directory).resolve()) for directory in dirs]
-
-
 class ExpectedEvent:
     RawEventType = TypedDict(
         "ExpectedEvent",
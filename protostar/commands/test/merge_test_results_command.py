@@ -0,0 +1,118 @@
+from logging import getLogger
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
+
+from protostar.cli.command import Command
+
+if TYPE_CHECKING:
+    from protostar.commands.test.testing_summary import TestingSummary
+    from protostar.utils.config.project import Project
+
+
+class MergeTestResultsCommand(Command):
+    def __init__(self, project: "Project") -> None:
+        super().__init__()
+        self._project = project
+
+    @property
+    def name(self) -> str:
+        return "merge-test-results"
+
+    @property
+    def description(self) -> str:
+        return "Merge test results saved by `protostar test --results-out`, e.g. by CI shards."
+
+    @property
+    def example(self) -> Optional[str]:
+        return "$ protostar merge-test-results shard_1.json shard_2.json"
+
+    @property
+    def arguments(self) -> List[Command.Argument]:
+        return [
+            Command.Argument(
+                name="results",
+                description="Files with test results.",
+                type="path",
+                is_array=True,
+                is_positional=True,
+                is_required=True,
+            ),
+            Command.Argument(
+                name="durations",
+                description="Print the given number of the slowest test suites and test cases.",
+                type="int",
+            ),
+            Command.Argument(
+                name="results-out",
+                description="Save merged test results to the given file.",
+                type="path",
+            ),
+        ]
+
+    async def run(self, args) -> "TestingSummary":
+        # pylint: disable=import-outside-toplevel
+        from protostar.commands.test.test_durations_history import (
+            TEST_DURATIONS_HISTORY_FILENAME,
+        )
+
+        summary = self.merge(
+            results_paths=args.results,
+            slowest_count=args.durations or 0,
+            results_out=args.results_out,
+            test_durations_history_path=self._project.cache_path
+            / TEST_DURATIONS_HISTORY_FILENAME,
+        )
+        summary.assert_all_passed()
+        return summary
+
+    # pylint: disable=no-self-use
+    def merge(
+        self,
+        results_paths: List[Path],
+        slowest_count: int = 0,
+        results_out: Optional[Path] = None,
+        test_durations_history_path: Optional[Path] = None,
+    ) -> "TestingSummary":
+        # pylint: disable=import-outside-toplevel
+        from protostar.commands.test.test_durations_history import (
+            TestDurationsHistory,
+        )
+        from protostar.commands.test.test_results_file import TestResultsFile
+        from protostar.commands.test.testing_summary import TestingSummary
+
+        results_files = [TestResultsFile.load(path) for path in results_paths]
+        merged_results_file = TestResultsFile(
+            case_results=[
+                case_result
+                for results_file in results_files
+                for case_result in results_file.case_results
+            ],
+            collected_test_cases_count=sum(
+                results_file.collected_test_cases_count
+                for results_file in results_files
+            ),
+            collected_test_suites_count=sum(
+                results_file.collected_test_suites_count
+                for results_file in results_files
+            ),
+        )
+
+        testing_summary = TestingSummary(merged_results_file.case_results)
+        testing_summary.log(
+            getLogger(),
+            collected_test_cases_count=merged_results_file.collected_test_cases_count,
+            collected_test_suites_count=merged_results_file.collected_test_suites_count,
+            slowest_count=slowest_count,
+        )
+
+        if test_durations_history_path:
+            test_durations_history = TestDurationsHistory.load(
+                test_durations_history_path
+            )
+            test_durations_history.update(merged_results_file.case_results)
+            test_durations_history.save(test_durations_history_path)
+
+        if results_out:
+            merged_results_file.save(results_out)
+
+        return testing_summary
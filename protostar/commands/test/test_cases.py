@@ -1,7 +1,8 @@
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
+from starkware.starknet.business_logic.execution.objects import CallInfo
 from starkware.starknet.testing.objects import StarknetTransactionExecutionInfo
 
 from protostar.commands.test.test_environment_exceptions import ReportedException
@@ -17,10 +18,82 @@ class TestCaseResult:
         return log_color_provider.colorize("GRAY", str(self.file_path))
 
 
+@dataclass(frozen=True)
+class ExecutionResourcesSummary:
+    """
+    Resources used by a test case, including the resources of the calls made from it.
+    """
+
+    n_steps: int
+    builtin_instance_counter: Dict[str, int]
+    n_memory_holes: int
+
+    @classmethod
+    def from_tx_info(
+        cls, tx_info: StarknetTransactionExecutionInfo
+    ) -> "ExecutionResourcesSummary":
+        return cls.from_call_info(tx_info.call_info)
+
+    @classmethod
+    def from_call_info(cls, call_info: CallInfo) -> "ExecutionResourcesSummary":
+        # Resources of a call already include the resources of its internal calls
+        resources = call_info.execution_resources
+        return cls(
+            n_steps=resources.n_steps,
+            builtin_instance_counter=dict(resources.builtin_instance_counter),
+            n_memory_holes=resources.n_memory_holes,
+        )
+
+    def __str__(self) -> str:
+        result: List[str] = [
+            f"steps={self.n_steps}",
+            f"memory_holes={self.n_memory_holes}",
+        ]
+        for builtin_name, count in sorted(self.builtin_instance_counter.items()):
+            if count > 0:
+                result.append(f"{builtin_name}={count}")
+        return ", ".join(result)
+
+
+@dataclass(frozen=True)
+class TestSuiteTimings:
+    """
+    Durations, in seconds, of the test suite preparation shared by all of its test cases.
+    """
+
+    compilation: float = 0.0
+    deployment: float = 0.0
+    setup_hook: float = 0.0
+
+    @property
+    def total(self) -> float:
+        return self.compilation + self.deployment + self.setup_hook
+
+
+@dataclass(frozen=True)
+class TestCaseFingerprint:
+    """
+    Hash of the compiled test suite and hashes of sources of contracts deployed or declared by the test case.
+    """
+
+    test_contract_hash: str
+    used_contract_hashes: Dict[str, str]
+
+
 @dataclass(frozen=True)
 class PassedTestCase(TestCaseResult):
+    """
+    `tx_info` is attached only if the runner was asked to keep the execution info,
+    otherwise the result carries only the `execution_resources` summary.
+    """
+
     test_case_name: str
-    tx_info: Optional[StarknetTransactionExecutionInfo]
+    execution_resources: Optional[ExecutionResourcesSummary] = None
+    duration: float = 0.0
+    fork_duration: float = 0.0
+    test_suite_timings: Optional[TestSuiteTimings] = None
+    fingerprint: Optional[TestCaseFingerprint] = None
+    tx_info: Optional[StarknetTransactionExecutionInfo] = None
 
     def __str__(self) -> str:
         result: List[str] = []
@@ -29,10 +102,24 @@ class PassedTestCase(TestCaseResult):
         return " ".join(result)
 
 
+@dataclass(frozen=True)
+class CachedTestCase(PassedTestCase):
+    """
+    A test case that passed in a previous run and wasn't executed, because its fingerprint didn't change.
+    """
+
+    def __str__(self) -> str:
+        return f"{super().__str__()} {log_color_provider.colorize('GRAY', '(cached)')}"
+
+
 @dataclass(frozen=True)
 class FailedTestCase(TestCaseResult):
     test_case_name: str
     exception: ReportedException
+    duration: float = 0.0
+    fork_duration: float = 0.0
+    test_suite_timings: Optional[TestSuiteTimings] = None
+    fingerprint: Optional[TestCaseFingerprint] = None
 
     def __str__(self) -> str:
         result: List[str] = []
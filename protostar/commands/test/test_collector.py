@@ -10,17 +10,25 @@ from pathlib import Path
 from time import time
 from typing import Dict, List, Optional, Set, Tuple
 
+from starkware.cairo.lang.compiler.ast.code_elements import (
+    CodeElementFunction,
+    CodeElementImport,
+)
+from starkware.cairo.lang.compiler.ast.module import CairoFile
 from starkware.cairo.lang.compiler.preprocessor.preprocessor_error import (
     LocationError,
     PreprocessorError,
 )
-from starkware.starknet.compiler.starknet_preprocessor import (
-    StarknetPreprocessedProgram,
+from starkware.starknet.compiler.external_wrapper import (
+    EXTERNAL_DECORATOR,
+    VIEW_DECORATOR,
 )
 
 from protostar.commands.test.test_cases import BrokenTestSuite
 from protostar.commands.test.test_suite import TestSuite
+from protostar.utils.parsed_module_cache import parsed_module_cache
 from protostar.utils.starknet_compilation import StarknetCompiler
+from protostar.utils.tracer import tracer
 
 TestSuiteGlob = str
 TestSuitePath = Path
@@ -42,7 +50,7 @@ class ParsedTarget:
         test_suite_glob: Optional[TestSuiteGlob] = target
         test_case_glob: Optional[TestCaseGlob] = None
         if "::" in target:
-            (test_suite_glob, test_case_glob) = target.split("::")
+            test_suite_glob, test_case_glob = target.split("::")
         test_suite_glob = test_suite_glob or default_test_suite_glob or "."
 
         if not test_case_glob:
@@ -89,6 +97,9 @@ TestSuiteInfoDict = Dict[TestSuitePath, TestSuiteInfo]
 
 @dataclass
 class TestCollector:
+    starknet_compiler: Optional[StarknetCompiler] = None
+    """Preprocesses test suites which import test cases. Only include paths of the compiler are used."""
+
     class Result:
         def __init__(
             self,
@@ -126,12 +137,6 @@ class TestCollector:
             else:
                 logger.warning("No test cases found")
 
-    def __init__(
-        self,
-        starknet_compiler: StarknetCompiler,
-    ) -> None:
-        self._starknet_compiler = starknet_compiler
-
     supported_test_suite_filename_patterns = [
         re.compile(r"^test_.*\.cairo"),
         re.compile(r"^.*_test.cairo"),
@@ -284,7 +289,11 @@ class TestCollector:
                         test_suite_info,
                     )
                 )
-            except (PreprocessorError, LocationError) as err:
+            except (
+                PreprocessorError,
+                LocationError,
+                StarknetCompiler.FileNotFoundException,
+            ) as err:
                 broken_test_suites.append(
                     BrokenTestSuite(
                         file_path=test_suite_info.path,
@@ -299,33 +308,76 @@ class TestCollector:
         self,
         test_suite_info: TestSuiteInfo,
     ) -> TestSuite:
-        preprocessed = self._preprocess_contract(test_suite_info.path)
-        collected_test_case_names = self._collect_test_case_names(preprocessed)
-        matching_test_case_names = test_suite_info.match_test_case_names(
-            collected_test_case_names
+        with tracer.span("parse test suite", path=str(test_suite_info.path)):
+            function_names = self._get_function_names(test_suite_info.path)
+        collected_test_case_names = self._collect_test_case_names(function_names)
+        matching_test_case_names = set(
+            test_suite_info.match_test_case_names(collected_test_case_names)
         )
 
         return TestSuite(
             test_path=test_suite_info.path,
-            test_case_names=matching_test_case_names,
-            preprocessed_contract=preprocessed,
-            setup_fn_name=self._find_setup_hook_name(preprocessed),
+            test_case_names=[
+                test_case_name
+                for test_case_name in collected_test_case_names
+                if test_case_name in matching_test_case_names
+            ],
+            setup_fn_name=self._find_setup_hook_name(function_names),
         )
 
-    def _collect_test_case_names(
-        self, preprocessed: StarknetPreprocessedProgram
-    ) -> List[str]:
-        return self._starknet_compiler.get_function_names(
-            preprocessed, predicate=lambda fn_name: fn_name.startswith("test_")
+    def _collect_test_case_names(self, function_names: List[str]) -> List[str]:
+        return [
+            function_name
+            for function_name in function_names
+            if function_name.startswith("test_")
+        ]
+
+    def _find_setup_hook_name(self, function_names: List[str]) -> Optional[str]:
+        return "__setup__" if "__setup__" in function_names else None
+
+    def _get_function_names(self, file_path: Path) -> List[str]:
+        """
+        Returns names of external and view functions defined in the test suite, in the order of definition.
+        Only the test suite file is parsed. Imported modules are read, and the test suite is preprocessed,
+        by the test runner. Parsed files are cached, so the test runner doesn't parse the test suite again.
+        Test suites importing functions which can be test cases or the setup hook are preprocessed,
+        as imported external functions are test cases too.
+        """
+        cairo_file = parsed_module_cache.parse_file(
+            file_path.read_text("utf-8"), str(file_path)
         )
+        if self._imports_test_functions(cairo_file):
+            return self._get_function_names_from_abi(file_path)
+        return [
+            commented_code_element.code_elm.name
+            for commented_code_element in cairo_file.code_block.code_elements
+            if isinstance(commented_code_element.code_elm, CodeElementFunction)
+            and commented_code_element.code_elm.element_type == "func"
+            and any(
+                decorator.name in (EXTERNAL_DECORATOR, VIEW_DECORATOR)
+                for decorator in commented_code_element.code_elm.decorators
+            )
+        ]
 
-    def _find_setup_hook_name(
-        self, preprocessed: StarknetPreprocessedProgram
-    ) -> Optional[str]:
-        function_names = self._starknet_compiler.get_function_names(
-            preprocessed, predicate=lambda fn_name: fn_name == "__setup__"
+    @staticmethod
+    def _imports_test_functions(cairo_file: CairoFile) -> bool:
+        return any(
+            name.startswith("test_") or name == "__setup__"
+            for commented_code_element in cairo_file.code_block.code_elements
+            if isinstance(commented_code_element.code_elm, CodeElementImport)
+            for import_item in commented_code_element.code_elm.import_items
+            for name in [
+                import_item.orig_identifier.name,
+                import_item.identifier.name,
+            ]
         )
-        return function_names[0] if len(function_names) > 0 else None
 
-    def _preprocess_contract(self, file_path: Path) -> StarknetPreprocessedProgram:
-        return self._starknet_compiler.preprocess_contract(file_path)
+    def _get_function_names_from_abi(self, file_path: Path) -> List[str]:
+        starknet_compiler = self.starknet_compiler or StarknetCompiler(
+            include_paths=[], disable_hint_validation=True
+        )
+        with tracer.span("preprocess test suite", path=str(file_path)):
+            preprocessed = starknet_compiler.preprocess_contract(file_path)
+        return StarknetCompiler.get_function_names(
+            preprocessed, predicate=lambda _: True
+        )
@@ -1,17 +1,37 @@
 from pathlib import Path
-from typing import Callable, List, cast
+from typing import List, cast
 from unittest.mock import MagicMock
 
 import pytest
 from pytest_mock import MockerFixture
-from starkware.cairo.lang.compiler.preprocessor.preprocessor_error import (
-    PreprocessorError,
-)
 
 from protostar.commands.test.test_collector import TestCollector
 from protostar.commands.test.test_suite import TestSuite
 from protostar.utils.starknet_compilation import StarknetCompiler
 
+TEST_SUITE_CODE = """%lang starknet
+
+@external
+func test_case_a():
+    return ()
+end
+
+@view
+func test_case_b():
+    return ()
+end
+
+@external
+func run():
+    return ()
+end
+
+# @external
+func test_not_external():
+    return ()
+end
+"""
+
 
 @pytest.fixture(name="project_root")
 def project_root_fixture(tmpdir) -> Path:
@@ -43,38 +63,21 @@ def test_suites_fixture(project_root: Path):
     """
     tmp_bar_path = project_root / "bar"
     tmp_bar_path.mkdir(exist_ok=True, parents=True)
-    (tmp_bar_path / "bar_test.cairo").touch()
+    (tmp_bar_path / "bar_test.cairo").write_text(TEST_SUITE_CODE, "utf-8")
 
     tmp_foo_path = project_root / "foo"
     tmp_foo_path.mkdir(exist_ok=True, parents=True)
-    (tmp_foo_path / "test_foo.cairo").touch()
+    (tmp_foo_path / "test_foo.cairo").write_text(TEST_SUITE_CODE, "utf-8")
     (tmp_foo_path / "foo.cairo").touch()
 
     tmp_baz_path = project_root / "baz"
     tmp_baz_path.mkdir(exist_ok=True, parents=True)
     tmp_foo_path = tmp_baz_path / "foo"
     tmp_foo_path.mkdir(exist_ok=True, parents=True)
-    (tmp_foo_path / "test_foo.cairo").touch()
+    (tmp_foo_path / "test_foo.cairo").write_text(TEST_SUITE_CODE, "utf-8")
     (tmp_foo_path / "foo.cairo").touch()
 
 
-@pytest.fixture(name="starknet_compiler")
-def starknet_compiler_fixture(mocker: MockerFixture):
-    starknet_compiler_mock = mocker.MagicMock()
-    starknet_compiler_mock.get_function_names = mocker.MagicMock()
-
-    def get_function_names(_, predicate):
-        return [
-            fn_name
-            for fn_name in ["test_case_a", "test_case_b", "run"]
-            if predicate(fn_name)
-        ]
-
-    starknet_compiler_mock.get_function_names.side_effect = get_function_names
-
-    return starknet_compiler_mock
-
-
 def assert_tested_suites(test_suites: List[TestSuite], expected_file_names: List[str]):
     test_suite_names = [test_suite.test_path.name for test_suite in test_suites]
     assert set(test_suite_names) == set(expected_file_names)
@@ -88,8 +91,8 @@ def test_is_test_suite():
     assert not TestCollector.is_test_suite("z_test_ex.cairo")
 
 
-def test_collecting_tests_from_target(starknet_compiler, project_root: Path):
-    test_collector = TestCollector(starknet_compiler)
+def test_collecting_tests_from_target(project_root: Path):
+    test_collector = TestCollector()
 
     result = test_collector.collect(targets=[str(project_root)])
 
@@ -99,27 +102,27 @@ def test_collecting_tests_from_target(starknet_compiler, project_root: Path):
     assert result.test_cases_count == 6
 
 
-def test_returning_broken_test_suites(starknet_compiler, project_root):
-    test_collector = TestCollector(starknet_compiler)
-    cast(
-        MagicMock, starknet_compiler.preprocess_contract
-    ).side_effect = PreprocessorError("")
+def test_returning_broken_test_suites(project_root):
+    test_collector = TestCollector()
+    (project_root / "foo" / "test_foo.cairo").write_text("ABC", "utf-8")
 
     result = test_collector.collect(targets=[str(project_root)])
 
-    assert len(result.broken_test_suites) > 0
+    assert [
+        broken_test_suite.file_path for broken_test_suite in result.broken_test_suites
+    ] == [project_root / "foo" / "test_foo.cairo"]
 
 
-def test_collecting_specific_file(starknet_compiler, project_root: Path):
-    test_collector = TestCollector(starknet_compiler)
+def test_collecting_specific_file(project_root: Path):
+    test_collector = TestCollector()
 
     result = test_collector.collect([str(project_root / "foo" / "test_foo.cairo")])
 
     assert_tested_suites(result.test_suites, ["test_foo.cairo"])
 
 
-def test_collecting_specific_function(starknet_compiler, project_root: Path):
-    test_collector = TestCollector(starknet_compiler)
+def test_collecting_specific_function(project_root: Path):
+    test_collector = TestCollector()
 
     result = test_collector.collect(
         [str(project_root / "foo" / "test_foo.cairo::test_case_a")]
@@ -129,30 +132,79 @@ def test_collecting_specific_function(starknet_compiler, project_root: Path):
     assert result.test_cases_count == 1
 
 
-def test_collector_preprocess_contracts(
-    mocker: MockerFixture, starknet_compiler, project_root: Path
+def test_collecting_external_and_view_functions_in_definition_order(
+    project_root: Path,
 ):
-    preprocessed_contract = mocker.MagicMock()
-    starknet_compiler.preprocess_contract.return_value = preprocessed_contract
-    test_collector = TestCollector(starknet_compiler)
+    test_collector = TestCollector()
 
     [suite] = test_collector.collect(
         [str(project_root / "foo" / "test_foo.cairo")]
     ).test_suites
-    starknet_compiler.preprocess_contract.assert_called_once()
-    assert suite.preprocessed_contract == preprocessed_contract
 
+    assert suite.test_case_names == ["test_case_a", "test_case_b"]
+
+
+def test_collecting_without_preprocessing(mocker: MockerFixture, project_root: Path):
+    preprocess_contract_spy = mocker.spy(StarknetCompiler, "preprocess_contract")
+    (project_root / "foo" / "test_foo.cairo").write_text(
+        TEST_SUITE_CODE + "\nfrom not_existing_module import foo\n", "utf-8"
+    )
+    test_collector = TestCollector()
+
+    result = test_collector.collect([str(project_root / "foo" / "test_foo.cairo")])
+
+    preprocess_contract_spy.assert_not_called()
+    assert result.test_cases_count == 2
+    assert result.broken_test_suites == []
 
-def test_finding_setup_function(
-    starknet_compiler: StarknetCompiler, project_root: Path
-):
-    def get_function_names(_, predicate: Callable[[str], bool]) -> List[str]:
-        return list(filter(predicate, ["test_main", "__setup__"]))
 
-    cast(
-        MagicMock, starknet_compiler.get_function_names
-    ).side_effect = get_function_names
-    test_collector = TestCollector(starknet_compiler)
+def test_collecting_imported_test_cases(project_root: Path):
+    (project_root / "foo" / "lib.cairo").write_text(
+        """%lang starknet
+
+@external
+func test_imported():
+    return ()
+end
+""",
+        "utf-8",
+    )
+    (project_root / "foo" / "test_foo.cairo").write_text(
+        """%lang starknet
+from foo.lib import test_imported
+
+@external
+func test_local():
+    return ()
+end
+""",
+        "utf-8",
+    )
+    test_collector = TestCollector(
+        StarknetCompiler(
+            include_paths=[str(project_root)], disable_hint_validation=True
+        )
+    )
+
+    [suite] = test_collector.collect(
+        [str(project_root / "foo" / "test_foo.cairo")]
+    ).test_suites
+
+    assert set(suite.test_case_names) == {"test_local", "test_imported"}
+
+
+def test_finding_setup_function(project_root: Path):
+    (project_root / "foo" / "test_foo.cairo").write_text(
+        TEST_SUITE_CODE
+        + """
+@external
+func __setup__():
+    return ()
+end
+""",
+        "utf-8",
+    )
+    test_collector = TestCollector()
 
     [suite] = test_collector.collect(
         [str(project_root / "foo" / "test_foo.cairo")]
@@ -169,7 +221,6 @@ def test_logging_collected_one_test_suite_and_one_test_case(mocker: MockerFixtur
             TestSuite(
                 test_case_names=["foo"],
                 test_path=Path(),
-                preprocessed_contract=mocker.MagicMock(),
             )
         ],
     ).log(logger_mock)
@@ -187,12 +238,10 @@ def test_logging_many_test_suites_and_many_test_cases(mocker: MockerFixture):
             TestSuite(
                 test_case_names=["foo"],
                 test_path=Path(),
-                preprocessed_contract=mocker.MagicMock(),
             ),
             TestSuite(
                 test_case_names=["foo"],
                 test_path=Path(),
-                preprocessed_contract=mocker.MagicMock(),
             ),
         ],
     ).log(logger_mock)
@@ -212,24 +261,24 @@ def test_logging_no_cases_found(mocker: MockerFixture):
     cast(MagicMock, logger_mock.warning).assert_called_once_with("No test cases found")
 
 
-def test_collecting_from_directory_globs(starknet_compiler, project_root):
-    test_collector = TestCollector(starknet_compiler)
+def test_collecting_from_directory_globs(project_root):
+    test_collector = TestCollector()
 
     result = test_collector.collect([f"{project_root}/b*r", f"{project_root}/f*"])
 
     assert_tested_suites(result.test_suites, ["bar_test.cairo", "test_foo.cairo"])
 
 
-def test_recursive_globs(starknet_compiler, project_root):
-    test_collector = TestCollector(starknet_compiler)
+def test_recursive_globs(project_root):
+    test_collector = TestCollector()
 
     result = test_collector.collect([f"{project_root}/**/test_foo.cairo"])
 
     assert_tested_suites(result.test_suites, ["test_foo.cairo", "test_foo.cairo"])
 
 
-def test_collecting_specific_function_in_glob(starknet_compiler, project_root):
-    test_collector = TestCollector(starknet_compiler)
+def test_collecting_specific_function_in_glob(project_root):
+    test_collector = TestCollector()
 
     result = test_collector.collect([f"{project_root}/**/test_foo.cairo::test_case_a"])
 
@@ -240,8 +289,8 @@ def test_collecting_specific_function_in_glob(starknet_compiler, project_root):
     assert result.test_cases_count == 2
 
 
-def test_multiple_globs_pointing_to_test_case(starknet_compiler, project_root):
-    test_collector = TestCollector(starknet_compiler)
+def test_multiple_globs_pointing_to_test_case(project_root):
+    test_collector = TestCollector()
 
     result = test_collector.collect(
         [
@@ -257,8 +306,8 @@ def test_multiple_globs_pointing_to_test_case(starknet_compiler, project_root):
     assert result.test_cases_count == 2
 
 
-def test_omitting_pattern_in_globs(starknet_compiler, project_root):
-    test_collector = TestCollector(starknet_compiler)
+def test_omitting_pattern_in_globs(project_root):
+    test_collector = TestCollector()
 
     result = test_collector.collect(
         [str(project_root)], ignored_targets=[f"{project_root}/**/test_foo.cairo"]
@@ -268,8 +317,8 @@ def test_omitting_pattern_in_globs(starknet_compiler, project_root):
     assert result.test_cases_count == 2
 
 
-def test_globs_in_test_case_name(starknet_compiler, project_root):
-    test_collector = TestCollector(starknet_compiler)
+def test_globs_in_test_case_name(project_root):
+    test_collector = TestCollector()
 
     result = test_collector.collect([f"{project_root}/foo/test_foo.cairo::*b"])
 
@@ -278,8 +327,8 @@ def test_globs_in_test_case_name(starknet_compiler, project_root):
     assert result.test_suites[0].test_case_names[0] == "test_case_b"
 
 
-def test_combining_test_suites(starknet_compiler, project_root):
-    test_collector = TestCollector(starknet_compiler)
+def test_combining_test_suites(project_root):
+    test_collector = TestCollector()
 
     result = test_collector.collect(
         [
@@ -292,10 +341,8 @@ def test_combining_test_suites(starknet_compiler, project_root):
     assert result.test_cases_count == 2
 
 
-def test_ignoring_test_cases(starknet_compiler, project_root: Path):
-    test_collector = TestCollector(
-        starknet_compiler,
-    )
+def test_ignoring_test_cases(project_root: Path):
+    test_collector = TestCollector()
 
     result = test_collector.collect(
         [f"{project_root}/foo/test_foo.cairo"],
@@ -308,8 +355,8 @@ def test_ignoring_test_cases(starknet_compiler, project_root: Path):
     assert result.test_suites[0].test_case_names[0] == "test_case_b"
 
 
-def test_empty_test_suites(starknet_compiler, project_root: Path):
-    test_collector = TestCollector(starknet_compiler)
+def test_empty_test_suites(project_root: Path):
+    test_collector = TestCollector()
 
     result = test_collector.collect(
         [f"{project_root}/foo/test_foo.cairo::test_not_existing_test_case"],
@@ -319,9 +366,9 @@ def test_empty_test_suites(starknet_compiler, project_root: Path):
 
 
 def test_testing_all_test_cases_despite_one_of_points_to_specific_test_case(
-    starknet_compiler, project_root: Path
+    project_root: Path,
 ):
-    test_collector = TestCollector(starknet_compiler)
+    test_collector = TestCollector()
 
     result = test_collector.collect(
         [
@@ -1,29 +1,39 @@
+import json
+from contextlib import ExitStack
+from dataclasses import replace
 from logging import getLogger
 from pathlib import Path
 from typing import TYPE_CHECKING, List, Optional
 
 from protostar.cli.activity_indicator import ActivityIndicator
 from protostar.cli.command import Command
-from protostar.commands.test.test_collector import TestCollector
-from protostar.commands.test.test_runner import TestRunner
-from protostar.commands.test.test_scheduler import TestScheduler
-from protostar.commands.test.testing_live_logger import TestingLiveLogger
-from protostar.commands.test.testing_summary import TestingSummary
+from protostar.protostar_exception import ProtostarException
 from protostar.utils.log_color_provider import log_color_provider
-from protostar.utils.protostar_directory import ProtostarDirectory
-from protostar.utils.starknet_compilation import StarknetCompiler
+from protostar.utils.protostar_directory import ProtostarDirectory, VersionManager
+from protostar.utils.python_profiler import PROFILE_PYTHON_ARG, profile_python
+from protostar.utils.tracer import trace, tracer
 
 if TYPE_CHECKING:
+    from protostar.commands.test.test_collector import TestCollector
+    from protostar.commands.test.test_durations_history import TestDurationsHistory
+    from protostar.commands.test.test_results_cache import TestResultsCache
+    from protostar.commands.test.test_results_reporters import TestResultsReport
+    from protostar.commands.test.test_shard import TestShard
+    from protostar.commands.test.testing_summary import TestingSummary
     from protostar.utils.config.project import Project
 
 
 class TestCommand(Command):
     def __init__(
-        self, project: "Project", protostar_directory: ProtostarDirectory
+        self,
+        project: "Project",
+        protostar_directory: ProtostarDirectory,
+        version_manager: Optional[VersionManager] = None,
     ) -> None:
         super().__init__()
         self._project = project
         self._protostar_directory = protostar_directory
+        self._version_manager = version_manager
 
     @property
     def name(self) -> str:
@@ -70,15 +80,240 @@ class TestCommand(Command):
                 description="Additional directories to look for sources.",
                 type="directory",
             ),
+            Command.Argument(
+                name="eager-debug-info",
+                description=(
+                    "Compile test suites with debug info upfront. "
+                    "By default, a test suite is recompiled with debug info only "
+                    "when one of its test cases fails or the test suite is broken."
+                ),
+                type="bool",
+            ),
+            Command.Argument(
+                name="durations",
+                description="Print the given number of the slowest test suites and test cases.",
+                type="int",
+            ),
+            Command.Argument(
+                name="shard",
+                description=(
+                    "Run only the given slice of test suites, e.g. `1/4`. "
+                    "Test suites are split between shards by hashes of their paths, "
+                    "or by durations from `--shard-durations`."
+                ),
+                type="str",
+            ),
+            Command.Argument(
+                name="shard-durations",
+                description=(
+                    "Balance test suites between shards by durations recorded in the given file, "
+                    "e.g. `.protostar_cache/test_durations.json` saved by a previous run. "
+                    "All shards have to use the same file, otherwise they can select overlapping test suites."
+                ),
+                type="path",
+            ),
+            Command.Argument(
+                name="results-out",
+                description=(
+                    "Save test results to the given file. "
+                    "Use `protostar merge-test-results` to combine results of multiple shards."
+                ),
+                type="path",
+            ),
+            PROFILE_PYTHON_ARG,
+            Command.Argument(
+                name="report",
+                description=(
+                    "Stream test results to a file in the given format, as they are received. "
+                    "Use `jsonl=PATH` for JSON lines or `junit=PATH` for JUnit XML."
+                ),
+                type="str",
+                is_array=True,
+            ),
+            Command.Argument(
+                name="resources",
+                description=(
+                    "Show steps, memory holes and builtins used by each passed test case, "
+                    "and a summary table sorted by the number of steps."
+                ),
+                type="bool",
+            ),
+            Command.Argument(
+                name="resources-out",
+                description=(
+                    "Save execution resources of passed test cases to the given `.csv` or `.json` file."
+                ),
+                type="path",
+            ),
+            Command.Argument(
+                name="save-resource-baseline",
+                description="Save steps and builtins used by passed test cases to the given file.",
+                type="path",
+            ),
+            Command.Argument(
+                name="compare-resource-baseline",
+                description=(
+                    "Compare steps and builtins used by passed test cases with the given baseline file. "
+                    "The command fails if any of them grew more than `--max-regression`."
+                ),
+                type="path",
+            ),
+            Command.Argument(
+                name="max-regression",
+                description=(
+                    "The allowed growth of steps or builtins compared to the baseline, e.g. `5%`. "
+                    "Defaults to `0%`."
+                ),
+                type="str",
+            ),
+            Command.Argument(
+                name="profile-cairo",
+                description=(
+                    "Count Cairo steps per function and line of each test case, "
+                    "including calls to other contracts, and save them to the given directory "
+                    "as `.folded` files, which can be rendered as flame graphs. "
+                    "Implies `--eager-debug-info` and `--no-cache`."
+                ),
+                type="path",
+            ),
+            Command.Argument(
+                name="trace-out",
+                description=(
+                    "Save a timeline of collecting, compiling, deploying and running tests "
+                    "to the given file in the Chrome trace event format, with a track per process. "
+                    "Open it in https://ui.perfetto.dev or chrome://tracing."
+                ),
+                type="path",
+            ),
+            Command.Argument(
+                name="no-cache",
+                description=(
+                    "Execute all test cases. By default, test cases which passed in the previous run "
+                    "are skipped if neither the test suite nor the contracts it deploys or declares "
+                    "have changed."
+                ),
+                type="bool",
+            ),
+            Command.Argument(
+                name="last-failed",
+                description=(
+                    "Run only test cases which failed in the previous run. "
+                    "All test cases are run if none failed."
+                ),
+                type="bool",
+            ),
+            Command.Argument(
+                name="collect-only",
+                description=(
+                    "List test cases matching targets without running them. "
+                    "Only test suite files are parsed, so test cases are listed much faster "
+                    "than they are compiled."
+                ),
+                type="bool",
+            ),
+            Command.Argument(
+                name="json",
+                description="Print test cases listed by `--collect-only` as JSON.",
+                type="bool",
+            ),
         ]
 
-    async def run(self, args) -> TestingSummary:
-        summary = await self.test(
-            targets=args.target,
-            ignored_targets=args.ignore,
-            cairo_path=args.cairo_path,
+    async def run(self, args) -> "TestingSummary":
+        # pylint: disable=import-outside-toplevel, too-many-locals
+        from protostar.commands.test.execution_resources_baseline import (
+            ExecutionResourcesBaseline,
+            parse_max_regression,
+        )
+        from protostar.commands.test.execution_resources_report import (
+            ExecutionResourcesReport,
+        )
+        from protostar.commands.test.test_durations_history import (
+            TEST_DURATIONS_HISTORY_FILENAME,
+        )
+        from protostar.commands.test.test_results_cache import (
+            TEST_RESULTS_CACHE_FILENAME,
+        )
+        from protostar.commands.test.test_results_reporters import TestResultsReport
+        from protostar.commands.test.test_shard import TestShard
+        from protostar.utils.parsed_module_cache import (
+            get_parsed_modules_cache_dir,
+            parsed_module_cache,
+        )
+
+        if args.json and not args.collect_only:
+            raise ProtostarException("`--json` can be used only with `--collect-only`")
+        if args.resources_out:
+            ExecutionResourcesReport.validate_path(args.resources_out)
+        if args.shard_durations and not args.shard_durations.is_file():
+            raise ProtostarException(
+                f"Test durations file {args.shard_durations} doesn't exist"
+            )
+        max_regression = (
+            parse_max_regression(args.max_regression) if args.max_regression else 0.0
+        )
+        resources_baseline = (
+            ExecutionResourcesBaseline.load(args.compare_resource_baseline)
+            if args.compare_resource_baseline
+            else None
         )
+
+        parsed_modules_disk_cache = parsed_module_cache.use_disk_cache(
+            get_parsed_modules_cache_dir(), self._get_protostar_version()
+        )
+        if args.collect_only:
+            with parsed_modules_disk_cache:
+                summary = self.collect_only(
+                    targets=args.target,
+                    ignored_targets=args.ignore,
+                    cairo_path=args.cairo_path,
+                    as_json=args.json,
+                )
+            summary.assert_all_passed()
+            return summary
+
+        with profile_python(args.profile_python), trace(
+            args.trace_out
+        ), parsed_modules_disk_cache:
+            summary = await self.test(
+                targets=args.target,
+                ignored_targets=args.ignore,
+                cairo_path=args.cairo_path,
+                lazy_debug_info=not (args.eager_debug_info or args.profile_cairo),
+                slowest_count=args.durations or 0,
+                test_durations_history_path=self._project.cache_path
+                / TEST_DURATIONS_HISTORY_FILENAME,
+                shard=TestShard.parse(args.shard) if args.shard else None,
+                shard_durations_path=args.shard_durations,
+                results_out=args.results_out,
+                results_cache_path=self._project.cache_path
+                / TEST_RESULTS_CACHE_FILENAME,
+                use_results_cache=not (args.no_cache or args.profile_cairo),
+                last_failed=args.last_failed,
+                reports=[
+                    TestResultsReport.parse(report) for report in args.report or []
+                ],
+                show_execution_resources=args.resources,
+                execution_resources_out=args.resources_out,
+                cairo_profile_dir=args.profile_cairo,
+                python_profile_dir=args.profile_python,
+            )
+
+        current_resources = ExecutionResourcesBaseline.from_report(
+            ExecutionResourcesReport.from_case_results(summary.passed)
+        )
+        if args.save_resource_baseline:
+            current_resources.save(args.save_resource_baseline)
+        resources_comparison = (
+            resources_baseline.compare(current_resources, max_regression)
+            if resources_baseline
+            else None
+        )
+        if resources_comparison:
+            resources_comparison.log(getLogger())
+
         summary.assert_all_passed()
+        if resources_comparison:
+            resources_comparison.assert_no_regressions()
         return summary
 
     async def test(
@@ -86,15 +321,220 @@ class TestCommand(Command):
         targets: List[str],
         ignored_targets: Optional[List[str]] = None,
         cairo_path: Optional[List[Path]] = None,
-    ) -> TestingSummary:
+        lazy_debug_info: bool = True,
+        keep_execution_info: bool = False,
+        slowest_count: int = 0,
+        test_durations_history_path: Optional[Path] = None,
+        shard: Optional["TestShard"] = None,
+        shard_durations_path: Optional[Path] = None,
+        results_out: Optional[Path] = None,
+        results_cache_path: Optional[Path] = None,
+        use_results_cache: bool = True,
+        last_failed: bool = False,
+        reports: Optional[List["TestResultsReport"]] = None,
+        show_execution_resources: bool = False,
+        execution_resources_out: Optional[Path] = None,
+        cairo_profile_dir: Optional[Path] = None,
+        python_profile_dir: Optional[Path] = None,
+    ) -> "TestingSummary":
+        # pylint: disable=import-outside-toplevel, too-many-arguments, too-many-locals
+        from protostar.commands.test.execution_resources_report import (
+            ExecutionResourcesReport,
+        )
+        from protostar.commands.test.test_durations_history import (
+            TestDurationsHistory,
+        )
+        from protostar.commands.test.test_results_file import TestResultsFile
+        from protostar.commands.test.test_runner import TestRunner
+        from protostar.commands.test.test_scheduler import TestScheduler
+        from protostar.commands.test.testing_live_logger import TestingLiveLogger
+        from protostar.commands.test.testing_summary import TestingSummary
+
         logger = getLogger()
 
         include_paths = self._build_include_paths(cairo_path or [])
 
         with ActivityIndicator(log_color_provider.colorize("GRAY", "Collecting tests")):
-            test_collector_result = TestCollector(
+            test_collector_result = self._collect(
+                targets, ignored_targets, include_paths
+            )
+
+        test_durations_history = (
+            TestDurationsHistory.load(test_durations_history_path)
+            if test_durations_history_path
+            else TestDurationsHistory()
+        )
+        test_results_cache = (
+            self._load_test_results_cache(results_cache_path)
+            if results_cache_path
+            else None
+        )
+        if last_failed and test_results_cache:
+            test_collector_result = self._select_last_failed(
+                test_collector_result, test_results_cache
+            )
+
+        test_collector_result = self._schedule_test_suites(
+            test_collector_result,
+            test_durations_history,
+            shard,
+            (
+                TestDurationsHistory.load(shard_durations_path)
+                if shard_durations_path
+                else None
+            ),
+        )
+
+        test_collector_result.log(logger)
+
+        testing_summary = TestingSummary(
+            case_results=test_collector_result.broken_test_suites  # type: ignore | pyright bug?
+        )
+
+        with ExitStack() as exit_stack:
+            reporters = [
+                exit_stack.enter_context(report.create_reporter())
+                for report in reports or []
+            ]
+            for reporter in reporters:
+                for broken_test_suite in test_collector_result.broken_test_suites:
+                    reporter.report(broken_test_suite)
+
+            if test_collector_result.test_cases_count > 0:
+                live_logger = TestingLiveLogger(
+                    logger,
+                    testing_summary,
+                    slowest_count=slowest_count,
+                    reporters=reporters,
+                    show_execution_resources=show_execution_resources,
+                )
+                TestScheduler(live_logger, worker=TestRunner.worker).run(
+                    include_paths=include_paths,
+                    test_collector_result=test_collector_result,
+                    lazy_debug_info=lazy_debug_info,
+                    keep_execution_info=keep_execution_info,
+                    test_results_cache=test_results_cache,
+                    skip_cached_test_cases=use_results_cache,
+                    cairo_profile_dir=cairo_profile_dir,
+                    python_profile_dir=python_profile_dir,
+                )
+
+                if test_durations_history_path and (
+                    testing_summary.passed or testing_summary.failed
+                ):
+                    test_durations_history.update(
+                        [*testing_summary.passed, *testing_summary.failed]
+                    )
+                    test_durations_history.save(test_durations_history_path)
+
+                if (
+                    results_cache_path
+                    and test_results_cache
+                    and (testing_summary.passed or testing_summary.failed)
+                ):
+                    test_results_cache.update(
+                        [*testing_summary.passed, *testing_summary.failed]
+                    )
+                    test_results_cache.save(results_cache_path)
+
+        if execution_resources_out:
+            ExecutionResourcesReport.from_case_results(testing_summary.passed).save(
+                execution_resources_out
+            )
+
+        if results_out:
+            TestResultsFile(
+                case_results=[
+                    *testing_summary.passed,
+                    *testing_summary.failed,
+                    *testing_summary.broken,
+                ],
+                collected_test_cases_count=test_collector_result.test_cases_count,
+                collected_test_suites_count=len(test_collector_result.test_suites),
+                shard=str(shard) if shard else None,
+            ).save(results_out)
+
+        return testing_summary
+
+    def collect_only(
+        self,
+        targets: List[str],
+        ignored_targets: Optional[List[str]] = None,
+        cairo_path: Optional[List[Path]] = None,
+        as_json: bool = False,
+    ) -> "TestingSummary":
+        """
+        Prints test cases matching targets, as `path::test_case_name` lines or as JSON.
+        """
+        # pylint: disable=import-outside-toplevel
+        from protostar.commands.test.testing_summary import TestingSummary
+
+        include_paths = self._build_include_paths(cairo_path or [])
+        if as_json:
+            # The activity indicator would be printed to the standard output along with JSON
+            test_collector_result = self._collect(
+                targets, ignored_targets, include_paths
+            )
+        else:
+            with ActivityIndicator(
+                log_color_provider.colorize("GRAY", "Collecting tests")
+            ):
+                test_collector_result = self._collect(
+                    targets, ignored_targets, include_paths
+                )
+
+        test_suites = sorted(
+            test_collector_result.test_suites,
+            key=lambda test_suite: test_suite.test_path,
+        )
+        if as_json:
+            print(
+                json.dumps(
+                    {
+                        "test_suites": [
+                            {
+                                "path": str(test_suite.test_path),
+                                "test_cases": test_suite.test_case_names,
+                                "setup_hook": test_suite.setup_fn_name,
+                            }
+                            for test_suite in test_suites
+                        ],
+                        "broken_test_suites": [
+                            {
+                                "path": str(broken_test_suite.file_path),
+                                "error": str(broken_test_suite.exception),
+                            }
+                            for broken_test_suite in test_collector_result.broken_test_suites
+                        ],
+                        "test_cases_count": test_collector_result.test_cases_count,
+                    },
+                    indent=4,
+                )
+            )
+        else:
+            for test_suite in test_suites:
+                for test_case_name in test_suite.test_case_names:
+                    print(f"{test_suite.test_path}::{test_case_name}")
+            test_collector_result.log(getLogger())
+
+        return TestingSummary(
+            case_results=test_collector_result.broken_test_suites  # type: ignore
+        )
+
+    def _collect(
+        self,
+        targets: List[str],
+        ignored_targets: Optional[List[str]],
+        include_paths: List[str],
+    ) -> "TestCollector.Result":
+        # pylint: disable=import-outside-toplevel
+        from protostar.commands.test.test_collector import TestCollector
+        from protostar.utils.starknet_compilation import StarknetCompiler
+
+        with tracer.span("TestCollector.collect"):
+            return TestCollector(
                 StarknetCompiler(
-                    disable_hint_validation=True, include_paths=include_paths
+                    include_paths=include_paths, disable_hint_validation=True
                 )
             ).collect(
                 targets=targets,
@@ -102,19 +542,84 @@ class TestCommand(Command):
                 default_test_suite_glob=str(self._project.project_root),
             )
 
-        test_collector_result.log(logger)
+    def _load_test_results_cache(self, path: Path) -> "TestResultsCache":
+        # pylint: disable=import-outside-toplevel
+        from protostar.commands.test.test_results_cache import TestResultsCache
 
-        testing_summary = TestingSummary(
-            case_results=test_collector_result.broken_test_suites  # type: ignore | pyright bug?
+        return TestResultsCache.load(
+            path,
+            protostar_version=self._get_protostar_version(),
+            cairo_lang_version=str(
+                self._version_manager.cairo_version if self._version_manager else None
+            ),
         )
 
-        if test_collector_result.test_cases_count > 0:
-            live_logger = TestingLiveLogger(logger, testing_summary)
-            TestScheduler(live_logger, worker=TestRunner.worker).run(
-                include_paths=include_paths, test_collector_result=test_collector_result
+    def _get_protostar_version(self) -> str:
+        return str(
+            self._version_manager.protostar_version if self._version_manager else None
+        )
+
+    @staticmethod
+    def _select_last_failed(
+        test_collector_result: "TestCollector.Result",
+        test_results_cache: "TestResultsCache",
+    ) -> "TestCollector.Result":
+        # pylint: disable=import-outside-toplevel
+        from protostar.commands.test.test_collector import TestCollector
+        from protostar.commands.test.test_suite import TestSuite
+
+        if not test_results_cache.has_failures():
+            getLogger().info("No failed test cases recorded, running all test cases")
+            return test_collector_result
+
+        test_suites: List[TestSuite] = []
+        for test_suite in test_collector_result.test_suites:
+            failed_test_case_names = set(
+                test_results_cache.get_failed_test_case_names(test_suite.test_path)
             )
+            test_case_names = [
+                test_case_name
+                for test_case_name in test_suite.test_case_names
+                if test_case_name in failed_test_case_names
+            ]
+            if test_case_names:
+                test_suites.append(replace(test_suite, test_case_names=test_case_names))
 
-        return testing_summary
+        return TestCollector.Result(
+            test_suites=test_suites,
+            broken_test_suites=test_collector_result.broken_test_suites,
+            duration=test_collector_result.duration,
+        )
+
+    @staticmethod
+    def _schedule_test_suites(
+        test_collector_result: "TestCollector.Result",
+        test_durations_history: "TestDurationsHistory",
+        shard: Optional["TestShard"],
+        shard_durations_history: Optional["TestDurationsHistory"] = None,
+    ) -> "TestCollector.Result":
+        # pylint: disable=import-outside-toplevel
+        from protostar.commands.test.test_collector import TestCollector
+
+        if shard is None:
+            test_collector_result.test_suites = (
+                test_durations_history.sort_longest_first(
+                    test_collector_result.test_suites
+                )
+            )
+            return test_collector_result
+
+        # Histories recorded by each machine only order test suites selected for the shard
+        # Test suites broken during the collection are reported only by the first shard
+        return TestCollector.Result(
+            test_suites=test_durations_history.sort_longest_first(
+                shard.select(test_collector_result.test_suites, shard_durations_history)
+            ),
+            broken_test_suites=(
+                test_collector_result.broken_test_suites if shard.index == 1 else []
+            ),
+            duration=test_collector_result.duration,
+        )
 
     def _build_include_paths(self, cairo_paths: List[Path]) -> List[str]:
         cairo_paths = self._protostar_directory.add_protostar_cairo_dir(cairo_paths)
@@ -1,4 +1,5 @@
 # pylint: disable=invalid-name
+import json
 from pathlib import Path
 from types import SimpleNamespace
 from typing import cast
@@ -9,6 +10,12 @@ from pytest_mock import MockerFixture
 
 from protostar.commands.test import TestCommand
 from protostar.commands.test.test_collector import TestCollector
+from protostar.commands.test.test_durations_history import (
+    TestDurationsHistory,
+    TestSuiteDurations,
+)
+from protostar.commands.test.test_shard import TestShard
+from protostar.commands.test.test_suite import TestSuite
 
 
 @pytest.mark.asyncio
@@ -17,19 +24,37 @@ async def test_test_command_runs_scheduler_properly(mocker: MockerFixture):
     args.target = ["foo"]
     args.ignore = ["bar"]
     args.cairo_path = [Path() / "baz"]
+    args.eager_debug_info = False
+    args.durations = None
+    args.shard = None
+    args.shard_durations = None
+    args.results_out = None
+    args.no_cache = False
+    args.last_failed = False
+    args.report = None
+    args.resources = False
+    args.resources_out = None
+    args.save_resource_baseline = None
+    args.compare_resource_baseline = None
+    args.max_regression = None
+    args.profile_cairo = None
+    args.profile_python = None
+    args.trace_out = None
+    args.collect_only = False
+    args.json = False
 
     TestCollectorMock = mocker.patch(
-        "protostar.commands.test.test_command.TestCollector",
+        "protostar.commands.test.test_collector.TestCollector",
     )
     test_collector_result = TestCollector.Result([])
     test_collector_result.test_cases_count = 1
     TestCollectorMock.return_value.collect.return_value = test_collector_result
 
     TestSchedulerMock = mocker.patch(
-        "protostar.commands.test.test_command.TestScheduler"
+        "protostar.commands.test.test_scheduler.TestScheduler"
     )
     TestingLiveLogger = mocker.patch(
-        "protostar.commands.test.test_command.TestingLiveLogger"
+        "protostar.commands.test.testing_live_logger.TestingLiveLogger"
     )
     project_mock = mocker.MagicMock()
     project_root = "."
@@ -54,3 +79,68 @@ async def test_test_command_runs_scheduler_properly(mocker: MockerFixture):
             "include_paths"
         ]
     )
+
+
+def test_listing_collected_test_cases_as_json(mocker: MockerFixture, capsys):
+    TestCollectorMock = mocker.patch(
+        "protostar.commands.test.test_collector.TestCollector",
+    )
+    TestCollectorMock.return_value.collect.return_value = TestCollector.Result(
+        [
+            TestSuite(
+                test_path=Path("tests/test_main.cairo"),
+                test_case_names=["test_a", "test_b"],
+                setup_fn_name="__setup__",
+            )
+        ]
+    )
+    TestSchedulerMock = mocker.patch(
+        "protostar.commands.test.test_scheduler.TestScheduler"
+    )
+    test_command = TestCommand(mocker.MagicMock(), mocker.MagicMock())
+
+    test_command.collect_only(targets=["tests"], as_json=True)
+
+    assert json.loads(capsys.readouterr().out) == {
+        "test_suites": [
+            {
+                "path": str(Path("tests/test_main.cairo")),
+                "test_cases": ["test_a", "test_b"],
+                "setup_hook": "__setup__",
+            }
+        ],
+        "broken_test_suites": [],
+        "test_cases_count": 2,
+    }
+    cast(MagicMock, TestSchedulerMock.return_value.run).assert_not_called()
+
+
+def test_shards_with_different_durations_histories_run_each_test_suite_once():
+    test_suites = [
+        TestSuite(test_path=Path(f"tests/test_{i}.cairo"), test_case_names=["test"])
+        for i in range(10)
+    ]
+    histories = [
+        TestDurationsHistory(),
+        TestDurationsHistory(
+            {
+                "tests/test_0.cairo": TestSuiteDurations(setup=100.0),
+                "tests/test_1.cairo": TestSuiteDurations(setup=50.0),
+            }
+        ),
+    ]
+
+    selected_paths = [
+        test_suite.test_path
+        for index, history in enumerate(histories, start=1)
+        # pylint: disable=protected-access
+        for test_suite in TestCommand._schedule_test_suites(
+            TestCollector.Result(test_suites=list(test_suites)),
+            history,
+            TestShard(index=index, count=2),
+        ).test_suites
+    ]
+
+    assert sorted(selected_paths) == sorted(
+        test_suite.test_path for test_suite in test_suites
+    )
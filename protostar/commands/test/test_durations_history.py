@@ -0,0 +1,150 @@
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from protostar.commands.test.test_cases import (
+    CachedTestCase,
+    FailedTestCase,
+    PassedTestCase,
+    TestCaseResult,
+)
+from protostar.commands.test.test_suite import TestSuite
+
+TEST_DURATIONS_HISTORY_FILENAME = "test_durations.json"
+DEFAULT_TEST_CASE_DURATION = 1.0
+DEFAULT_TEST_SUITE_SETUP_DURATION = 1.0
+
+
+@dataclass
+class TestSuiteDurations:
+    setup: Optional[float] = None
+    test_cases: Dict[str, float] = field(default_factory=dict)
+
+
+class TestDurationsHistory:
+    """
+    Durations of test suites and test cases recorded in previous runs.
+    Test suites without recorded durations are estimated from the number of test cases.
+    """
+
+    VERSION = 1
+
+    def __init__(
+        self, test_suites: Optional[Dict[str, TestSuiteDurations]] = None
+    ) -> None:
+        self._test_suites: Dict[str, TestSuiteDurations] = test_suites or {}
+        self._averages: Optional[Tuple[float, float]] = None
+
+    @classmethod
+    def load(cls, path: Path) -> "TestDurationsHistory":
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                raw_history = json.load(file)
+            if raw_history.get("version") != cls.VERSION:
+                return cls()
+            return cls(
+                {
+                    test_suite_path: TestSuiteDurations(
+                        setup=raw_test_suite.get("setup"),
+                        test_cases=dict(raw_test_suite["test_cases"]),
+                    )
+                    for test_suite_path, raw_test_suite in raw_history[
+                        "test_suites"
+                    ].items()
+                }
+            )
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            # A missing or corrupted history only affects the order of test suites
+            return cls()
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "version": self.VERSION,
+                    "test_suites": {
+                        test_suite_path: {
+                            "setup": test_suite.setup,
+                            "test_cases": test_suite.test_cases,
+                        }
+                        for test_suite_path, test_suite in self._test_suites.items()
+                    },
+                },
+                file,
+            )
+
+    def update(self, case_results: Iterable[TestCaseResult]) -> None:
+        for case_result in case_results:
+            if not isinstance(case_result, (PassedTestCase, FailedTestCase)):
+                continue
+            # Cached test cases weren't executed, so their durations are meaningless
+            if isinstance(case_result, CachedTestCase):
+                continue
+            test_suite = self._test_suites.setdefault(
+                self.get_key(case_result.file_path), TestSuiteDurations()
+            )
+            test_suite.test_cases[case_result.test_case_name] = (
+                case_result.fork_duration + case_result.duration
+            )
+            if case_result.test_suite_timings is not None:
+                test_suite.setup = case_result.test_suite_timings.total
+        self._averages = None
+
+    def estimate_test_suite_duration(
+        self, file_path: Path, test_case_names: List[str]
+    ) -> float:
+        average_setup_duration, average_test_case_duration = self._get_averages()
+        test_suite = self._test_suites.get(self.get_key(file_path))
+        if test_suite is None:
+            return average_setup_duration + average_test_case_duration * len(
+                test_case_names
+            )
+
+        setup_duration = (
+            test_suite.setup if test_suite.setup is not None else average_setup_duration
+        )
+        return setup_duration + sum(
+            test_suite.test_cases.get(test_case_name, average_test_case_duration)
+            for test_case_name in test_case_names
+        )
+
+    def sort_longest_first(self, test_suites: List[TestSuite]) -> List[TestSuite]:
+        return sorted(
+            test_suites,
+            key=lambda test_suite: self.estimate_test_suite_duration(
+                test_suite.test_path, test_suite.test_case_names
+            ),
+            reverse=True,
+        )
+
+    @staticmethod
+    def get_key(file_path: Path) -> str:
+        return file_path.as_posix()
+
+    def _get_averages(self) -> Tuple[float, float]:
+        if self._averages is None:
+            setup_durations = [
+                test_suite.setup
+                for test_suite in self._test_suites.values()
+                if test_suite.setup is not None
+            ]
+            test_case_durations = [
+                duration
+                for test_suite in self._test_suites.values()
+                for duration in test_suite.test_cases.values()
+            ]
+            self._averages = (
+                (
+                    sum(setup_durations) / len(setup_durations)
+                    if setup_durations
+                    else DEFAULT_TEST_SUITE_SETUP_DURATION
+                ),
+                (
+                    sum(test_case_durations) / len(test_case_durations)
+                    if test_case_durations
+                    else DEFAULT_TEST_CASE_DURATION
+                ),
+            )
+        return self._averages
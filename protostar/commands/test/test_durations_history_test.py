@@ -0,0 +1,58 @@
+from pathlib import Path
+from typing import List
+
+from protostar.commands.test.test_cases import PassedTestCase, TestSuiteTimings
+from protostar.commands.test.test_durations_history import TestDurationsHistory
+from protostar.commands.test.test_suite import TestSuite
+
+
+def make_test_suite(path: str, test_case_names: List[str]) -> TestSuite:
+    return TestSuite(
+        test_path=Path(path),
+        test_case_names=test_case_names,
+    )
+
+
+def test_sorting_test_suites_from_the_longest(tmp_path: Path):
+    history = TestDurationsHistory()
+    history.update(
+        [
+            PassedTestCase(
+                file_path=Path("tests/test_fast.cairo"),
+                test_case_name="test_a",
+                duration=1,
+                test_suite_timings=TestSuiteTimings(compilation=1),
+            ),
+            PassedTestCase(
+                file_path=Path("tests/test_slow.cairo"),
+                test_case_name="test_a",
+                duration=10,
+                test_suite_timings=TestSuiteTimings(compilation=1),
+            ),
+        ]
+    )
+    history_path = tmp_path / "test_durations.json"
+    history.save(history_path)
+
+    sorted_test_suites = TestDurationsHistory.load(history_path).sort_longest_first(
+        [
+            make_test_suite("tests/test_fast.cairo", ["test_a"]),
+            make_test_suite("tests/test_unknown.cairo", ["test_a"]),
+            make_test_suite("tests/test_slow.cairo", ["test_a"]),
+        ]
+    )
+
+    assert [test_suite.test_path.name for test_suite in sorted_test_suites] == [
+        "test_slow.cairo",
+        "test_unknown.cairo",
+        "test_fast.cairo",
+    ]
+
+
+def test_loading_corrupted_history(tmp_path: Path):
+    history_path = tmp_path / "test_durations.json"
+    history_path.write_text("{", encoding="utf-8")
+
+    history = TestDurationsHistory.load(history_path)
+
+    assert history.estimate_test_suite_duration(Path("foo"), ["test_a"]) > 0
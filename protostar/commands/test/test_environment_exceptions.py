@@ -1,5 +1,5 @@
 import re
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from starkware.starknet.business_logic.execution.objects import Event
 from typing_extensions import Literal
@@ -297,3 +297,25 @@ class ExpectedEventMissingException(ReportedException):
             self.missing,
             self._event_selector_to_name_map,
         )
+
+
+class ExecutionResourcesBudgetExceededException(ReportedException):
+    def __init__(
+        self,
+        scope_description: str,
+        exceeded_resources: List[Tuple[str, int, int]],
+    ) -> None:
+        self.scope_description = scope_description
+        self.exceeded_resources = exceeded_resources
+        super().__init__()
+
+    def __str__(self) -> str:
+        result: List[str] = [
+            f"Execution resources of {self.scope_description} exceeded the budget:"
+        ]
+        for resource_name, used, limit in self.exceeded_resources:
+            result.append(f"— {resource_name}: used {used}, allowed {limit}")
+        return "\n".join(result)
+
+    def __reduce__(self):
+        return type(self), (self.scope_description, self.exceeded_resources)
@@ -9,11 +9,15 @@ from starkware.cairo.common.cairo_function_runner import CairoFunctionRunner
 from starkware.starknet.public.abi import get_selector_from_name
 from starkware.starknet.services.api.contract_class import ContractClass
 from starkware.starknet.testing.contract import StarknetContract
+from starkware.starknet.testing.objects import StarknetTransactionExecutionInfo
 from starkware.starkware_utils.error_handling import StarkException
 from starkware.starknet.testing.contract import DeclaredClass
 
+from protostar.commands.test.cairo_profiler import CairoProfiler
 from protostar.commands.test.cheatcodes import (
     Cheatcode,
+    ExecutionResourcesBudget,
+    ExpectMaxResourcesCheatcode,
     ExpectRevertCheatcode,
     RollCheatcode,
 )
@@ -28,6 +32,7 @@ from protostar.commands.test.starkware.cheatable_syscall_handler import (
     CheatableSysCallHandlerException,
 )
 from protostar.commands.test.starkware.forkable_starknet import ForkableStarknet
+from protostar.commands.test.test_cases import ExecutionResourcesSummary
 from protostar.commands.test.test_context import TestContext
 
 
@@ -42,6 +47,7 @@ from protostar.commands.test.test_environment_exceptions import (
 )
 from protostar.utils.data_transformer_facade import DataTransformerFacade
 from protostar.utils.starknet_compilation import StarknetCompiler
+from protostar.utils.tracer import tracer
 
 logger = getLogger()
 
@@ -65,7 +71,7 @@ class ProtostarDeclaredClass:
 
 
 class TestExecutionEnvironment:
-    # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-arguments, too-many-instance-attributes
     def __init__(
         self,
         include_paths: List[str],
@@ -81,6 +87,9 @@ class TestExecutionEnvironment:
         self._include_paths = include_paths
         self._test_finish_hooks: Set[Callable[[], None]] = set()
         self._starknet_compiler = starknet_compiler
+        self.used_contract_paths: Set[str] = set()
+        self._tx_info: Optional[StarknetTransactionExecutionInfo] = None
+        self.cairo_profiler: Optional[CairoProfiler] = None
 
     @classmethod
     async def from_test_suite_definition(
@@ -92,9 +101,13 @@ class TestExecutionEnvironment:
         general_config = CheatableStarknetGeneralConfig(
             cheatcodes_cairo_path=include_paths
         )
-        starknet = await ForkableStarknet.empty(general_config=general_config)
+        with tracer.span("ForkableStarknet.empty"):
+            starknet = await ForkableStarknet.empty(general_config=general_config)
 
-        starknet_contract = await starknet.deploy(contract_class=test_suite_definition)
+        with tracer.span("deploy test contract"):
+            starknet_contract = await starknet.deploy(
+                contract_class=test_suite_definition
+            )
 
         return cls(
             include_paths or [],
@@ -113,12 +126,13 @@ class TestExecutionEnvironment:
             test_context=deepcopy(self.test_context),
             starknet_compiler=self._starknet_compiler,
         )
+        new_env.used_contract_paths = set(self.used_contract_paths)
         return new_env
 
     def deploy_in_env(
         self, contract_path: str, constructor_calldata: Optional[List[int]] = None
     ):
-
+        self.used_contract_paths.add(contract_path)
         contract = DeployedContract(
             asyncio.run(
                 self.starknet.deploy(
@@ -131,6 +145,7 @@ class TestExecutionEnvironment:
         return contract
 
     def declare_in_env(self, contract_path: str):
+        self.used_contract_paths.add(contract_path)
         contract = ProtostarDeclaredClass(
             asyncio.run(
                 self.starknet.declare(
@@ -144,7 +159,9 @@ class TestExecutionEnvironment:
     async def invoke_setup_hook(self, fn_name: str) -> None:
         await self.invoke_test_case(fn_name)
 
-    async def invoke_test_case(self, test_case_name: str):
+    async def invoke_test_case(
+        self, test_case_name: str
+    ) -> Optional[StarknetTransactionExecutionInfo]:
         original_run_from_entrypoint = CairoFunctionRunner.run_from_entrypoint
         CairoFunctionRunner.run_from_entrypoint = (
             self._get_run_from_entrypoint_with_custom_hint_locals(
@@ -153,11 +170,13 @@ class TestExecutionEnvironment:
         )
 
         try:
-            await self._call_test_case_fn(test_case_name)
+            tx_info = await self._call_test_case_fn(test_case_name)
+            self._tx_info = tx_info
             for hook in self._test_finish_hooks:
                 hook()
             if self._expected_error is not None:
                 raise ExpectedRevertException(self._expected_error)
+            return tx_info
         except RevertableException as ex:
             if self._expected_error:
                 if not self._expected_error.match(ex):
@@ -167,12 +186,16 @@ class TestExecutionEnvironment:
                     ) from ex
             else:
                 raise ex
+            return None
         finally:
             CairoFunctionRunner.run_from_entrypoint = original_run_from_entrypoint
             self._expected_error = None
+            self._tx_info = None
             self._test_finish_hooks.clear()
 
-    async def _call_test_case_fn(self, test_case_name: str):
+    async def _call_test_case_fn(
+        self, test_case_name: str
+    ) -> StarknetTransactionExecutionInfo:
         try:
             func = getattr(self.test_contract, test_case_name)
             return await func().invoke()
@@ -207,6 +230,14 @@ class TestExecutionEnvironment:
                 )
                 self._inject_test_context_into_hint_locals(kwargs["hint_locals"])
 
+                # Only entry points of contracts are profiled, as the runner also executes
+                # Cairo functions of Starknet, e.g. to compute class hashes of deployed contracts
+                if self.cairo_profiler:
+                    runner = args[0]
+                    return self.cairo_profiler.profile_run(
+                        runner, lambda: fn_run_from_entrypoint(*args, **kwargs)
+                    )
+
             return fn_run_from_entrypoint(
                 *args,
                 **kwargs,
@@ -344,6 +375,7 @@ class TestExecutionEnvironment:
         cheatcodes: List[Cheatcode] = [
             ExpectRevertCheatcode(self),
             RollCheatcode(cheatable_syscall_handler),
+            ExpectMaxResourcesCheatcode(self, cheatable_syscall_handler),
         ]
 
         for cheatcode in cheatcodes:
@@ -367,3 +399,33 @@ class TestExecutionEnvironment:
                 )
 
         return stop_expecting_revert
+
+    def expect_max_resources(
+        self, budget: ExecutionResourcesBudget, call_index: Optional[int]
+    ) -> None:
+        """
+        Checks the budget against the whole test case or, if `call_index` is provided,
+        against the call made from the test case with that index.
+        """
+
+        def check_execution_resources():
+            assert self._tx_info is not None, "Missing execution info of the test case"
+            call_info = self._tx_info.call_info
+            if call_index is None:
+                budget.check(
+                    ExecutionResourcesSummary.from_call_info(call_info), "the test case"
+                )
+                return
+
+            if call_index >= len(call_info.internal_calls):
+                raise SimpleReportedException(
+                    "Expected a call after `expect_max_resources`, but the test case didn't make one"
+                )
+            budget.check(
+                ExecutionResourcesSummary.from_call_info(
+                    call_info.internal_calls[call_index]
+                ),
+                "the call",
+            )
+
+        self.add_test_finish_hook(check_execution_resources)
@@ -0,0 +1,209 @@
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from starkware.starknet.services.api.contract_class import ContractClass
+from typing_extensions import Literal
+
+from protostar.commands.test.test_cases import (
+    CachedTestCase,
+    ExecutionResourcesSummary,
+    FailedTestCase,
+    PassedTestCase,
+    TestCaseFingerprint,
+    TestCaseResult,
+)
+
+TEST_RESULTS_CACHE_FILENAME = "test_results.json"
+
+
+def compute_contract_hash(contract_class: ContractClass) -> str:
+    serialized_contract = ContractClass.Schema().dump(contract_class)
+    serialized_contract["program"].pop("debug_info", None)
+    return hashlib.sha256(
+        json.dumps(serialized_contract, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
+
+def compute_sources_hash(source_paths: Iterable[Path]) -> str:
+    """
+    Hashes paths and contents of a contract and all modules it imports.
+    Unlike `compute_contract_hash`, it doesn't require compiling the contract.
+    """
+    sources_hash = hashlib.sha256()
+    for source_path in sorted(set(source_paths)):
+        sources_hash.update(str(source_path).encode("utf-8") + b"\0")
+        sources_hash.update(hashlib.sha256(source_path.read_bytes()).digest())
+    return sources_hash.hexdigest()
+
+
+@dataclass(frozen=True)
+class CachedTestCaseResult:
+    status: Literal["passed", "failed"]
+    fingerprint: TestCaseFingerprint
+    execution_resources: Optional[ExecutionResourcesSummary] = None
+
+    def is_up_to_date(
+        self,
+        test_contract_hash: str,
+        get_used_contract_hash: Callable[[str], Optional[str]],
+    ) -> bool:
+        return (
+            self.status == "passed"
+            and self.fingerprint.test_contract_hash == test_contract_hash
+            and all(
+                get_used_contract_hash(contract_path) == contract_hash
+                for contract_path, contract_hash in self.fingerprint.used_contract_hashes.items()
+            )
+        )
+
+
+CachedTestSuiteResults = Dict[str, CachedTestCaseResult]
+
+
+class TestResultsCache:
+    """
+    Outcomes of test cases from previous runs. Test cases which passed and have the same fingerprint
+    aren't executed again. The cache is discarded when Protostar or cairo-lang version changes.
+    """
+
+    VERSION = 2
+
+    def __init__(
+        self,
+        protostar_version: str,
+        cairo_lang_version: str,
+        test_suites: Optional[Dict[str, CachedTestSuiteResults]] = None,
+    ) -> None:
+        self._protostar_version = protostar_version
+        self._cairo_lang_version = cairo_lang_version
+        self._test_suites: Dict[str, CachedTestSuiteResults] = test_suites or {}
+
+    @classmethod
+    def load(
+        cls, path: Path, protostar_version: str, cairo_lang_version: str
+    ) -> "TestResultsCache":
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                raw_cache = json.load(file)
+            if (
+                raw_cache.get("version") != cls.VERSION
+                or raw_cache.get("protostar_version") != protostar_version
+                or raw_cache.get("cairo_lang_version") != cairo_lang_version
+            ):
+                return cls(protostar_version, cairo_lang_version)
+            return cls(
+                protostar_version,
+                cairo_lang_version,
+                {
+                    test_suite_path: {
+                        test_case_name: cls._deserialize_cached_result(raw_result)
+                        for test_case_name, raw_result in raw_test_suite.items()
+                    }
+                    for test_suite_path, raw_test_suite in raw_cache[
+                        "test_suites"
+                    ].items()
+                },
+            )
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            # A missing or corrupted cache only results in running all test cases
+            return cls(protostar_version, cairo_lang_version)
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "version": self.VERSION,
+                    "protostar_version": self._protostar_version,
+                    "cairo_lang_version": self._cairo_lang_version,
+                    "test_suites": {
+                        test_suite_path: {
+                            test_case_name: self._serialize_cached_result(result)
+                            for test_case_name, result in test_suite.items()
+                        }
+                        for test_suite_path, test_suite in self._test_suites.items()
+                    },
+                },
+                file,
+            )
+
+    def update(self, case_results: Iterable[TestCaseResult]) -> None:
+        for case_result in case_results:
+            if isinstance(case_result, CachedTestCase):
+                continue
+            if not isinstance(case_result, (PassedTestCase, FailedTestCase)):
+                continue
+            if case_result.fingerprint is None:
+                continue
+            self._test_suites.setdefault(self._get_key(case_result.file_path), {})[
+                case_result.test_case_name
+            ] = CachedTestCaseResult(
+                status=(
+                    "passed" if isinstance(case_result, PassedTestCase) else "failed"
+                ),
+                fingerprint=case_result.fingerprint,
+                execution_resources=(
+                    case_result.execution_resources
+                    if isinstance(case_result, PassedTestCase)
+                    else None
+                ),
+            )
+
+    def get_test_suite_results(self, file_path: Path) -> CachedTestSuiteResults:
+        return self._test_suites.get(self._get_key(file_path), {})
+
+    def get_failed_test_case_names(self, file_path: Path) -> List[str]:
+        return [
+            test_case_name
+            for test_case_name, result in self.get_test_suite_results(file_path).items()
+            if result.status == "failed"
+        ]
+
+    def has_failures(self) -> bool:
+        return any(
+            result.status == "failed"
+            for test_suite in self._test_suites.values()
+            for result in test_suite.values()
+        )
+
+    @staticmethod
+    def _get_key(file_path: Path) -> str:
+        return file_path.as_posix()
+
+    @staticmethod
+    def _serialize_cached_result(result: CachedTestCaseResult) -> Dict:
+        resources = result.execution_resources
+        return {
+            "status": result.status,
+            "test_contract_hash": result.fingerprint.test_contract_hash,
+            "used_contract_hashes": result.fingerprint.used_contract_hashes,
+            "execution_resources": (
+                {
+                    "n_steps": resources.n_steps,
+                    "builtin_instance_counter": resources.builtin_instance_counter,
+                    "n_memory_holes": resources.n_memory_holes,
+                }
+                if resources
+                else None
+            ),
+        }
+
+    @staticmethod
+    def _deserialize_cached_result(raw_result: Dict) -> CachedTestCaseResult:
+        if raw_result["status"] not in ("passed", "failed"):
+            raise ValueError(f"Unknown status: {raw_result['status']}")
+        return CachedTestCaseResult(
+            status=raw_result["status"],
+            fingerprint=TestCaseFingerprint(
+                test_contract_hash=raw_result["test_contract_hash"],
+                used_contract_hashes=dict(raw_result["used_contract_hashes"]),
+            ),
+            execution_resources=(
+                ExecutionResourcesSummary(**raw_result["execution_resources"])
+                if raw_result.get("execution_resources")
+                else None
+            ),
+        )
@@ -0,0 +1,112 @@
+from pathlib import Path
+
+from protostar.commands.test.test_cases import (
+    CachedTestCase,
+    ExecutionResourcesSummary,
+    FailedTestCase,
+    PassedTestCase,
+    TestCaseFingerprint,
+)
+from protostar.commands.test.test_environment_exceptions import (
+    SimpleReportedException,
+)
+from protostar.commands.test.test_results_cache import (
+    TestResultsCache,
+    compute_sources_hash,
+)
+
+TEST_SUITE_PATH = Path("tests/test_main.cairo")
+
+
+def make_cache() -> TestResultsCache:
+    cache = TestResultsCache(protostar_version="0.3.0", cairo_lang_version="0.9.0")
+    cache.update(
+        [
+            PassedTestCase(
+                file_path=TEST_SUITE_PATH,
+                test_case_name="test_passed",
+                execution_resources=ExecutionResourcesSummary(
+                    n_steps=10, builtin_instance_counter={}, n_memory_holes=0
+                ),
+                fingerprint=TestCaseFingerprint(
+                    test_contract_hash="test_hash",
+                    used_contract_hashes={"src/main.cairo": "main_hash"},
+                ),
+            ),
+            FailedTestCase(
+                file_path=TEST_SUITE_PATH,
+                test_case_name="test_failed",
+                exception=SimpleReportedException("failure"),
+                fingerprint=TestCaseFingerprint(
+                    test_contract_hash="test_hash", used_contract_hashes={}
+                ),
+            ),
+            PassedTestCase(
+                file_path=TEST_SUITE_PATH,
+                test_case_name="test_without_fingerprint",
+            ),
+        ]
+    )
+    return cache
+
+
+def test_passed_test_case_is_up_to_date_only_with_the_same_fingerprint(
+    tmp_path: Path,
+):
+    cache_path = tmp_path / "test_results.json"
+    make_cache().save(cache_path)
+
+    results = TestResultsCache.load(
+        cache_path, protostar_version="0.3.0", cairo_lang_version="0.9.0"
+    ).get_test_suite_results(TEST_SUITE_PATH)
+
+    assert set(results.keys()) == {"test_passed", "test_failed"}
+    assert results["test_passed"].execution_resources == ExecutionResourcesSummary(
+        n_steps=10, builtin_instance_counter={}, n_memory_holes=0
+    )
+    assert results["test_passed"].is_up_to_date("test_hash", lambda _: "main_hash")
+    assert not results["test_passed"].is_up_to_date("other_hash", lambda _: "main_hash")
+    assert not results["test_passed"].is_up_to_date("test_hash", lambda _: None)
+    assert not results["test_failed"].is_up_to_date("test_hash", lambda _: None)
+
+
+def test_cache_is_discarded_when_versions_change(tmp_path: Path):
+    cache_path = tmp_path / "test_results.json"
+    make_cache().save(cache_path)
+
+    cache = TestResultsCache.load(
+        cache_path, protostar_version="0.3.0", cairo_lang_version="0.10.0"
+    )
+
+    assert cache.get_test_suite_results(TEST_SUITE_PATH) == {}
+    assert not cache.has_failures()
+
+
+def test_cached_test_cases_dont_override_entries():
+    cache = make_cache()
+    cache.update(
+        [
+            CachedTestCase(
+                file_path=TEST_SUITE_PATH,
+                test_case_name="test_failed",
+                fingerprint=TestCaseFingerprint(
+                    test_contract_hash="test_hash", used_contract_hashes={}
+                ),
+            )
+        ]
+    )
+
+    assert cache.has_failures()
+    assert cache.get_failed_test_case_names(TEST_SUITE_PATH) == ["test_failed"]
+
+
+def test_sources_hash_changes_with_imported_modules(tmp_path: Path):
+    contract_path = tmp_path / "main.cairo"
+    contract_path.write_text("from lib import f\n", "utf-8")
+    module_path = tmp_path / "lib.cairo"
+    module_path.write_text("func f():\n    return ()\nend\n", "utf-8")
+    sources_hash = compute_sources_hash([contract_path, module_path])
+
+    assert compute_sources_hash([module_path, contract_path]) == sources_hash
+    module_path.write_text("func f():\n    ret\nend\n", "utf-8")
+    assert compute_sources_hash([contract_path, module_path]) != sources_hash
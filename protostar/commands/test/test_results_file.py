@@ -0,0 +1,178 @@
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from protostar.commands.test.test_cases import (
+    BrokenTestSuite,
+    CachedTestCase,
+    ExecutionResourcesSummary,
+    FailedTestCase,
+    PassedTestCase,
+    TestCaseResult,
+    TestSuiteTimings,
+)
+from protostar.commands.test.test_environment_exceptions import (
+    SimpleReportedException,
+)
+from protostar.protostar_exception import ProtostarException
+
+SerializedTestCaseResult = Dict[str, Any]
+
+
+class InvalidTestResultsFileException(ProtostarException):
+    pass
+
+
+def serialize_test_case_result(
+    case_result: TestCaseResult,
+) -> SerializedTestCaseResult:
+    result: SerializedTestCaseResult = {"file_path": case_result.file_path.as_posix()}
+
+    if isinstance(case_result, (PassedTestCase, FailedTestCase)):
+        result["status"] = (
+            "passed" if isinstance(case_result, PassedTestCase) else "failed"
+        )
+        result["test_case_name"] = case_result.test_case_name
+        result["duration"] = case_result.duration
+        result["fork_duration"] = case_result.fork_duration
+        result["test_suite_timings"] = (
+            {
+                "compilation": case_result.test_suite_timings.compilation,
+                "deployment": case_result.test_suite_timings.deployment,
+                "setup_hook": case_result.test_suite_timings.setup_hook,
+            }
+            if case_result.test_suite_timings
+            else None
+        )
+
+    if isinstance(case_result, PassedTestCase):
+        resources = case_result.execution_resources
+        result["execution_resources"] = (
+            {
+                "n_steps": resources.n_steps,
+                "builtin_instance_counter": resources.builtin_instance_counter,
+                "n_memory_holes": resources.n_memory_holes,
+            }
+            if resources
+            else None
+        )
+        if isinstance(case_result, CachedTestCase):
+            result["cached"] = True
+    elif isinstance(case_result, FailedTestCase):
+        result["message"] = str(case_result.exception)
+    elif isinstance(case_result, BrokenTestSuite):
+        result["status"] = "broken"
+        result["test_case_names"] = case_result.test_case_names
+        result["message"] = str(case_result.exception)
+
+    return result
+
+
+def deserialize_test_case_result(result: SerializedTestCaseResult) -> TestCaseResult:
+    file_path = Path(result["file_path"])
+    status = result["status"]
+
+    if status == "broken":
+        return BrokenTestSuite(
+            file_path=file_path,
+            test_case_names=result["test_case_names"],
+            exception=SimpleReportedException(result["message"]),
+        )
+
+    test_suite_timings = (
+        TestSuiteTimings(**result["test_suite_timings"])
+        if result.get("test_suite_timings")
+        else None
+    )
+
+    if status == "failed":
+        return FailedTestCase(
+            file_path=file_path,
+            test_case_name=result["test_case_name"],
+            exception=SimpleReportedException(result["message"]),
+            duration=result["duration"],
+            fork_duration=result["fork_duration"],
+            test_suite_timings=test_suite_timings,
+        )
+
+    if status == "passed":
+        passed_test_case_cls = (
+            CachedTestCase if result.get("cached") else PassedTestCase
+        )
+        return passed_test_case_cls(
+            file_path=file_path,
+            test_case_name=result["test_case_name"],
+            execution_resources=(
+                ExecutionResourcesSummary(**result["execution_resources"])
+                if result.get("execution_resources")
+                else None
+            ),
+            duration=result["duration"],
+            fork_duration=result["fork_duration"],
+            test_suite_timings=test_suite_timings,
+        )
+
+    raise ValueError(f"Unknown test case result status: {status}")
+
+
+@dataclass
+class TestResultsFile:
+    """
+    Results of a test run saved in a form that can be merged with results of other runs, e.g. CI shards.
+    """
+
+    VERSION = 1
+
+    case_results: List[TestCaseResult]
+    collected_test_cases_count: int
+    collected_test_suites_count: int
+    shard: Optional[str] = None
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "version": self.VERSION,
+                    "shard": self.shard,
+                    "collected_test_cases_count": self.collected_test_cases_count,
+                    "collected_test_suites_count": self.collected_test_suites_count,
+                    "results": [
+                        serialize_test_case_result(case_result)
+                        for case_result in self.case_results
+                    ],
+                },
+                file,
+            )
+
+    @classmethod
+    def load(cls, path: Path) -> "TestResultsFile":
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                raw_results_file = json.load(file)
+            if raw_results_file["version"] != cls.VERSION:
+                raise InvalidTestResultsFileException(
+                    f"Unsupported version of the test results file '{path}'"
+                )
+            return cls(
+                case_results=[
+                    deserialize_test_case_result(result)
+                    for result in raw_results_file["results"]
+                ],
+                collected_test_cases_count=raw_results_file[
+                    "collected_test_cases_count"
+                ],
+                collected_test_suites_count=raw_results_file[
+                    "collected_test_suites_count"
+                ],
+                shard=raw_results_file.get("shard"),
+            )
+        except FileNotFoundError as err:
+            raise InvalidTestResultsFileException(
+                f"Couldn't find the test results file '{path}'"
+            ) from err
+        except (ValueError, KeyError, TypeError) as err:
+            raise InvalidTestResultsFileException(
+                f"Couldn't read the test results file '{path}'"
+            ) from err
@@ -1,17 +1,92 @@
-from typing import TYPE_CHECKING
+import pickle
+from collections import deque
+from threading import Lock, Timer
+from time import time
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional, Tuple
 
 from protostar.commands.test.test_cases import TestCaseResult
+from protostar.utils.tracer import tracer
 
 if TYPE_CHECKING:
     import queue
 
+TestResultsBatch = Tuple[float, List[bytes]]
+"""Time the batch was sent and pickled test case results."""
+
 
 class TestResultsQueue:
-    def __init__(self, shared_queue: "queue.Queue[TestCaseResult]") -> None:
+    """
+    Results are sent in batches to reduce the number of round-trips between processes.
+    A batch is sent when it reaches `batch_size` or `flush_interval` seconds after its first result,
+    so results aren't held back while a producer runs a long test case.
+    Producers have to call `flush` after putting the last result.
+    Results are pickled in `put`, so a result which can't be sent raises an error in the producer,
+    instead of being dropped by the feeder thread of a multiprocessing queue.
+    Batches carry the time they were sent, so the transit can be traced.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self,
+        shared_queue: "queue.Queue[TestResultsBatch]",
+        batch_size: int = 64,
+        flush_interval: float = 0.1,
+    ) -> None:
         self._shared_queue = shared_queue
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._pending_results: List[bytes] = []
+        self._received_results: Deque[TestCaseResult] = deque()
+        self._last_flush_time = time()
+        self._lock = Lock()
+        self._flush_timer: Optional[Timer] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Workers started with `spawn` receive the queue without the producer state
+        state = self.__dict__.copy()
+        state["_pending_results"] = []
+        state["_received_results"] = deque()
+        state["_lock"] = None
+        state["_flush_timer"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = Lock()
 
     def get(self) -> TestCaseResult:
-        return self._shared_queue.get(block=True, timeout=1000)
+        if not self._received_results:
+            sent_time, results = self._shared_queue.get(block=True, timeout=1000)
+            tracer.add_span(
+                "results queue transit", sent_time, time(), results_count=len(results)
+            )
+            self._received_results.extend(pickle.loads(result) for result in results)
+        return self._received_results.popleft()
 
     def put(self, item: TestCaseResult) -> None:
-        self._shared_queue.put(item)
+        pickled_item = pickle.dumps(item)
+        with self._lock:
+            self._pending_results.append(pickled_item)
+            if (
+                len(self._pending_results) >= self._batch_size
+                or time() - self._last_flush_time >= self._flush_interval
+            ):
+                self._send_pending_results()
+            elif self._flush_timer is None:
+                self._flush_timer = Timer(self._flush_interval, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._send_pending_results()
+
+    def _send_pending_results(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if self._pending_results:
+            self._shared_queue.put((time(), self._pending_results))
+            self._pending_results = []
+        self._last_flush_time = time()
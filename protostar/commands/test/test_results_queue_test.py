@@ -0,0 +1,63 @@
+import queue
+from threading import Lock
+from typing import Any, List, cast
+
+import pytest
+
+from protostar.commands.test.test_cases import TestCaseResult
+from protostar.commands.test.test_results_queue import (
+    TestResultsBatch,
+    TestResultsQueue,
+)
+
+
+def make_results(count: int) -> List[TestCaseResult]:
+    return [cast(Any, f"result_{i}") for i in range(count)]
+
+
+def test_sending_results_in_batches():
+    shared_queue: queue.Queue[TestResultsBatch] = queue.Queue()
+    test_results_queue = TestResultsQueue(
+        shared_queue, batch_size=2, flush_interval=1000
+    )
+    results = make_results(3)
+
+    for result in results:
+        test_results_queue.put(result)
+
+    assert shared_queue.qsize() == 1
+    test_results_queue.flush()
+    assert shared_queue.qsize() == 2
+    assert [test_results_queue.get() for _ in results] == results
+
+
+def test_sending_results_after_flush_interval():
+    shared_queue: queue.Queue[TestResultsBatch] = queue.Queue()
+    test_results_queue = TestResultsQueue(shared_queue, batch_size=64, flush_interval=0)
+
+    test_results_queue.put(make_results(1)[0])
+
+    assert shared_queue.qsize() == 1
+
+
+def test_sending_results_held_back_by_slow_test_cases():
+    shared_queue: queue.Queue[TestResultsBatch] = queue.Queue()
+    test_results_queue = TestResultsQueue(
+        shared_queue, batch_size=64, flush_interval=0.05
+    )
+    test_results_queue.flush()
+    result = make_results(1)[0]
+
+    # The producer runs the next test case without putting or flushing results
+    test_results_queue.put(result)
+
+    _, results = shared_queue.get(timeout=1)
+    assert len(results) == 1
+
+
+def test_raising_error_for_results_which_cant_be_sent():
+    shared_queue: queue.Queue[TestResultsBatch] = queue.Queue()
+    test_results_queue = TestResultsQueue(shared_queue)
+
+    with pytest.raises(TypeError):
+        test_results_queue.put(cast(Any, Lock()))
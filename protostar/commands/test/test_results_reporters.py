@@ -0,0 +1,199 @@
+import json
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Dict, Optional, Type
+from xml.sax.saxutils import escape, quoteattr
+
+from typing_extensions import Literal
+
+from protostar.commands.test.test_cases import (
+    BrokenTestSuite,
+    CachedTestCase,
+    FailedTestCase,
+    PassedTestCase,
+    TestCaseResult,
+)
+from protostar.commands.test.test_results_file import serialize_test_case_result
+from protostar.protostar_exception import ProtostarException
+
+TestResultsReportFormat = Literal["jsonl", "junit"]
+
+ANSI_ESCAPE_SEQUENCE_REGEX = re.compile(r"\x1b\[[0-9;]*m")
+
+
+class InvalidTestResultsReportException(ProtostarException):
+    pass
+
+
+def strip_colors(text: str) -> str:
+    return ANSI_ESCAPE_SEQUENCE_REGEX.sub("", text)
+
+
+class TestResultsReporter(ABC):
+    """
+    Writes each test case result to a file as soon as it is received,
+    so the memory usage doesn't grow with the number of test cases.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._file: Optional[IO[str]] = None
+
+    def __enter__(self) -> "TestResultsReporter":
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self._path, "w", encoding="utf-8")
+        self._write_header()
+        return self
+
+    def __exit__(self, *_args) -> None:
+        assert self._file is not None
+        self._write_footer()
+        self._file.close()
+        self._file = None
+
+    def report(self, case_result: TestCaseResult) -> None:
+        self._write(self._format(case_result))
+
+    def flush(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+
+    def _write(self, text: str) -> None:
+        assert self._file is not None, "Reporter used outside of its context"
+        self._file.write(text)
+
+    def _write_header(self) -> None:
+        pass
+
+    def _write_footer(self) -> None:
+        pass
+
+    @abstractmethod
+    def _format(self, case_result: TestCaseResult) -> str:
+        ...
+
+
+class JsonLinesTestResultsReporter(TestResultsReporter):
+    """
+    Writes one JSON object per line, in the format of `--results-out` results.
+    """
+
+    def _format(self, case_result: TestCaseResult) -> str:
+        serialized_result = serialize_test_case_result(case_result)
+        if "message" in serialized_result:
+            serialized_result["message"] = strip_colors(serialized_result["message"])
+        return json.dumps(serialized_result) + "\n"
+
+
+class JUnitTestResultsReporter(TestResultsReporter):
+    """
+    Writes a single JUnit `testsuite` with a `testcase` per result, in the order of arrival.
+    Test suite files are used as class names. Totals aren't written, as they are known only at the end.
+    """
+
+    def _write_header(self) -> None:
+        self._write(
+            '<?xml version="1.0" encoding="utf-8"?>\n'
+            '<testsuites>\n<testsuite name="protostar">\n'
+        )
+
+    def _write_footer(self) -> None:
+        self._write("</testsuite>\n</testsuites>\n")
+
+    def _format(self, case_result: TestCaseResult) -> str:
+        class_name = case_result.file_path.as_posix()
+        if isinstance(case_result, BrokenTestSuite):
+            error = self._format_element(
+                "error", "Broken test suite", str(case_result.exception)
+            )
+            return "".join(
+                self._format_test_case(class_name, test_case_name, 0.0, error)
+                for test_case_name in case_result.test_case_names
+            )
+
+        if isinstance(case_result, (PassedTestCase, FailedTestCase)):
+            body = ""
+            if isinstance(case_result, FailedTestCase):
+                body = self._format_element(
+                    "failure", "Test case failed", str(case_result.exception)
+                )
+            if isinstance(case_result, PassedTestCase):
+                body = self._format_properties(case_result)
+            return self._format_test_case(
+                class_name,
+                case_result.test_case_name,
+                case_result.duration,
+                body,
+            )
+
+        return ""
+
+    @staticmethod
+    def _format_test_case(
+        class_name: str, test_case_name: str, duration: float, body: str
+    ) -> str:
+        return (
+            f"<testcase classname={quoteattr(class_name)} name={quoteattr(test_case_name)} "
+            f'time="{duration:.6f}">{body}</testcase>\n'
+        )
+
+    @staticmethod
+    def _format_element(tag: str, message: str, text: str) -> str:
+        return (
+            f"<{tag} message={quoteattr(message)}>{escape(strip_colors(text))}</{tag}>"
+        )
+
+    @staticmethod
+    def _format_properties(case_result: PassedTestCase) -> str:
+        properties: Dict[str, str] = {}
+        if isinstance(case_result, CachedTestCase):
+            properties["cached"] = "true"
+        resources = case_result.execution_resources
+        if resources:
+            properties["n_steps"] = str(resources.n_steps)
+            properties["n_memory_holes"] = str(resources.n_memory_holes)
+            for builtin_name, count in sorted(
+                resources.builtin_instance_counter.items()
+            ):
+                properties[builtin_name] = str(count)
+        if not properties:
+            return ""
+        return (
+            "<properties>"
+            + "".join(
+                f"<property name={quoteattr(name)} value={quoteattr(value)}/>"
+                for name, value in properties.items()
+            )
+            + "</properties>"
+        )
+
+
+@dataclass(frozen=True)
+class TestResultsReport:
+    report_format: TestResultsReportFormat
+    path: Path
+
+    @classmethod
+    def parse(cls, value: str) -> "TestResultsReport":
+        report_format, separator, path = value.partition("=")
+        if not separator or not path:
+            raise InvalidTestResultsReportException(
+                f"Invalid report '{value}', expected format: FORMAT=PATH, e.g. junit=report.xml"
+            )
+        if report_format not in REPORTERS:
+            raise InvalidTestResultsReportException(
+                f"Unknown report format '{report_format}', "
+                f"supported formats: {', '.join(REPORTERS.keys())}"
+            )
+        return cls(report_format=report_format, path=Path(path))  # type: ignore
+
+    def create_reporter(self) -> TestResultsReporter:
+        return REPORTERS[self.report_format](self.path)
+
+
+REPORTERS: Dict[str, Type[TestResultsReporter]] = {
+    "jsonl": JsonLinesTestResultsReporter,
+    "junit": JUnitTestResultsReporter,
+}
@@ -0,0 +1,84 @@
+import json
+from pathlib import Path
+from xml.etree import ElementTree
+
+import pytest
+
+from protostar.commands.test.test_cases import (
+    BrokenTestSuite,
+    ExecutionResourcesSummary,
+    FailedTestCase,
+    PassedTestCase,
+)
+from protostar.commands.test.test_environment_exceptions import (
+    SimpleReportedException,
+)
+from protostar.commands.test.test_results_reporters import (
+    InvalidTestResultsReportException,
+    TestResultsReport,
+)
+
+CASE_RESULTS = [
+    PassedTestCase(
+        file_path=Path("tests/test_main.cairo"),
+        test_case_name="test_passed",
+        execution_resources=ExecutionResourcesSummary(
+            n_steps=42, builtin_instance_counter={"range_check": 2}, n_memory_holes=0
+        ),
+        duration=0.5,
+    ),
+    FailedTestCase(
+        file_path=Path("tests/test_main.cairo"),
+        test_case_name="test_failed",
+        exception=SimpleReportedException("\x1b[31mexpected <1>\x1b[0m"),
+        duration=0.25,
+    ),
+    BrokenTestSuite(
+        file_path=Path("tests/test_broken.cairo"),
+        test_case_names=["test_a", "test_b"],
+        exception=SimpleReportedException("broken"),
+    ),
+]
+
+
+def test_jsonl_report(tmp_path: Path):
+    report_path = tmp_path / "report.jsonl"
+
+    with TestResultsReport.parse(f"jsonl={report_path}").create_reporter() as reporter:
+        for case_result in CASE_RESULTS:
+            reporter.report(case_result)
+
+    lines = [json.loads(line) for line in report_path.read_text().splitlines()]
+    assert [line["status"] for line in lines] == ["passed", "failed", "broken"]
+    assert lines[0]["execution_resources"]["n_steps"] == 42
+    assert lines[1]["message"] == "expected <1>"
+    assert lines[1]["duration"] == 0.25
+
+
+def test_junit_report(tmp_path: Path):
+    report_path = tmp_path / "report.xml"
+
+    with TestResultsReport.parse(f"junit={report_path}").create_reporter() as reporter:
+        for case_result in CASE_RESULTS:
+            reporter.report(case_result)
+
+    test_cases = ElementTree.parse(report_path).getroot().findall(".//testcase")
+    assert [test_case.get("name") for test_case in test_cases] == [
+        "test_passed",
+        "test_failed",
+        "test_a",
+        "test_b",
+    ]
+    assert test_cases[0].get("time") == "0.500000"
+    assert {
+        prop.get("name"): prop.get("value") for prop in test_cases[0].iter("property")
+    } == {"n_steps": "42", "n_memory_holes": "0", "range_check": "2"}
+    failure = test_cases[1].find("failure")
+    assert failure is not None and failure.text == "expected <1>"
+    assert test_cases[3].find("error") is not None
+
+
+@pytest.mark.parametrize("value", ["junit", "junit=", "html=report.html"])
+def test_invalid_report(value: str):
+    with pytest.raises(InvalidTestResultsReportException):
+        TestResultsReport.parse(value)
@@ -1,28 +1,50 @@
 import asyncio
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from logging import getLogger
-from typing import List, Optional
+from pathlib import Path
+from time import time
+from typing import Dict, List, Optional, Tuple
 
+from starkware.cairo.lang.compiler.error_handling import LocationError
+from starkware.starknet.compiler.starknet_preprocessor import (
+    StarknetPreprocessedProgram,
+)
 from starkware.starknet.services.api.contract_class import ContractClass
 from starkware.starkware_utils.error_handling import StarkException
 
+from protostar.commands.test.cairo_profiler import (
+    CairoProfiler,
+    get_cairo_profile_path,
+)
 from protostar.commands.test.test_cases import (
     BrokenTestSuite,
+    CachedTestCase,
+    ExecutionResourcesSummary,
     FailedTestCase,
     PassedTestCase,
+    TestCaseFingerprint,
+    TestCaseResult,
+    TestSuiteTimings,
     UnexpectedExceptionTestSuiteResult,
 )
 from protostar.commands.test.test_environment_exceptions import ReportedException
 from protostar.commands.test.test_execution_environment import TestExecutionEnvironment
+from protostar.commands.test.test_results_cache import (
+    CachedTestSuiteResults,
+    compute_contract_hash,
+    compute_sources_hash,
+)
 from protostar.commands.test.test_results_queue import TestResultsQueue
 from protostar.commands.test.test_suite import TestSuite
 from protostar.protostar_exception import ProtostarException
 from protostar.utils.starknet_compilation import StarknetCompiler
+from protostar.utils.tracer import tracer
 
 logger = getLogger()
 
 
 class TestRunner:
+    # pylint: disable=too-many-instance-attributes, too-many-arguments
     include_paths: Optional[List[str]] = None
     _collected_count: Optional[int] = None
 
@@ -30,9 +52,20 @@ class TestRunner:
         self,
         queue: TestResultsQueue,
         include_paths: Optional[List[str]] = None,
+        lazy_debug_info: bool = False,
+        keep_execution_info: bool = False,
+        cached_test_suite_results: Optional[CachedTestSuiteResults] = None,
+        cairo_profile_dir: Optional[Path] = None,
     ):
         self.queue = queue
         self.include_paths = []
+        self.lazy_debug_info = lazy_debug_info
+        self.keep_execution_info = keep_execution_info
+        self.cached_test_suite_results = cached_test_suite_results
+        self.cairo_profile_dir = cairo_profile_dir
+        self._debug_env_base: Optional[TestExecutionEnvironment] = None
+        self._used_contract_hashes: Dict[str, Optional[str]] = {}
+        self._preprocessed_test_suites: Dict[Path, StarknetPreprocessedProgram] = {}
 
         if include_paths:
             self.include_paths.extend(include_paths)
@@ -45,14 +78,25 @@ class TestRunner:
     @dataclass
     class WorkerArgs:
         test_suite: TestSuite
-        test_results_queue: TestResultsQueue
         include_paths: List[str]
+        lazy_debug_info: bool = False
+        keep_execution_info: bool = False
+        cached_test_suite_results: Optional[CachedTestSuiteResults] = None
+        """`None` disables fingerprinting and skipping of test cases from the results cache."""
+        cairo_profile_dir: Optional[Path] = None
 
     @classmethod
-    def worker(cls, args: "TestRunner.WorkerArgs"):
+    def worker(
+        cls, args: "TestRunner.WorkerArgs", test_results_queue: TestResultsQueue
+    ):
         asyncio.run(
             cls(
-                queue=args.test_results_queue, include_paths=args.include_paths
+                queue=test_results_queue,
+                include_paths=args.include_paths,
+                lazy_debug_info=args.lazy_debug_info,
+                keep_execution_info=args.keep_execution_info,
+                cached_test_suite_results=args.cached_test_suite_results,
+                cairo_profile_dir=args.cairo_profile_dir,
             ).run_test_suite(args.test_suite)
         )
 
@@ -62,23 +106,9 @@ class TestRunner:
                 self.include_paths is not None
             ), "Uninitialized paths list in test runner"
 
-            compiled_test = self.starknet_compiler.compile_preprocessed_contract(
-                test_suite.preprocessed_contract, add_debug_info=True
-            )
-
-            await self._run_test_suite(
-                test_contract=compiled_test,
-                test_suite=test_suite,
-            )
+            with tracer.span("run test suite", path=str(test_suite.test_path)):
+                await self._run_test_suite(test_suite)
 
-        except ReportedException as ex:
-            self.queue.put(
-                BrokenTestSuite(
-                    file_path=test_suite.test_path,
-                    test_case_names=test_suite.test_case_names,
-                    exception=ex,
-                )
-            )
         # An unexpected exception in a worker should crash nor freeze the whole application
         except BaseException as ex:  # pylint: disable=broad-except
             self.queue.put(
@@ -91,57 +121,296 @@ class TestRunner:
 
     async def _run_test_suite(
         self,
-        test_contract: ContractClass,
         test_suite: TestSuite,
     ):
         assert self.queue, "Uninitialized reporter!"
 
+        test_case_names = test_suite.test_case_names
+        test_contract_hash: Optional[str] = None
         try:
-            env_base = await TestExecutionEnvironment.from_test_suite_definition(
-                self.starknet_compiler, test_contract, self.include_paths
+            start_time = time()
+            test_contract = self._compile_test_suite(
+                test_suite, add_debug_info=not self.lazy_debug_info
             )
+            compilation_duration = time() - start_time
 
-            if test_suite.setup_fn_name:
-                await env_base.invoke_setup_hook(test_suite.setup_fn_name)
-
-        except StarkException as ex:
-            if self.is_constructor_args_exception(ex):
-                ex = ProtostarException(
-                    (
-                        "Protostar doesn't support the unit testing approach for"
-                        "files with a constructor expecting arguments."
-                        "Restructure your code or use `deploy_contract` cheatcode."
-                    )
+            if self.cached_test_suite_results is not None:
+                test_contract_hash = compute_contract_hash(test_contract)
+                test_case_names = self._report_cached_test_cases(
+                    test_suite, test_contract_hash
                 )
+                if not test_case_names:
+                    return
 
-            self.queue.put(
-                BrokenTestSuite(
-                    file_path=test_suite.test_path,
-                    exception=ex,
-                    test_case_names=test_suite.test_case_names,
+            env_base, test_suite_timings = await self._prepare_env_base(
+                test_suite, test_contract
+            )
+            test_suite_timings = replace(
+                test_suite_timings, compilation=compilation_duration
+            )
+        except (ReportedException, StarkException) as ex:
+            exception: BaseException = ex
+            if self.lazy_debug_info:
+                exception = await self._reproduce_broken_test_suite_with_debug_info(
+                    test_suite, ex
                 )
+            self.queue.put(
+                self._build_broken_test_suite(test_suite, exception, test_case_names)
             )
             return
+        except (LocationError, StarknetCompiler.FileNotFoundException) as ex:
+            # Test suites are preprocessed here rather than in the collector,
+            # so Cairo errors in them or in imported modules break the test suite
+            self.queue.put(self._build_broken_test_suite(test_suite, ex))
+            return
+
+        for test_case_name in test_case_names:
+            test_case_result = await self._run_test_case(
+                env_base,
+                test_suite,
+                test_case_name,
+                test_suite_timings,
+                test_contract_hash,
+            )
+            if self.lazy_debug_info and isinstance(test_case_result, FailedTestCase):
+                test_case_result = await self._rerun_test_case_with_debug_info(
+                    test_suite, test_case_result
+                )
+            self.queue.put(test_case_result)
+
+    def _compile_test_suite(
+        self, test_suite: TestSuite, add_debug_info: bool
+    ) -> ContractClass:
+        with tracer.span(
+            "compile test suite",
+            path=str(test_suite.test_path),
+            add_debug_info=add_debug_info,
+        ):
+            return self.starknet_compiler.compile_preprocessed_contract(
+                self._preprocess_test_suite(test_suite), add_debug_info=add_debug_info
+            )
 
+    def _preprocess_test_suite(
+        self, test_suite: TestSuite
+    ) -> StarknetPreprocessedProgram:
+        # Compiling with debug info after a failure reuses the preprocessed program
+        preprocessed = self._preprocessed_test_suites.get(test_suite.test_path)
+        if preprocessed is None:
+            with tracer.span("preprocess test suite", path=str(test_suite.test_path)):
+                preprocessed = self.starknet_compiler.preprocess_contract(
+                    test_suite.test_path
+                )
+            self._preprocessed_test_suites[test_suite.test_path] = preprocessed
+        return preprocessed
+
+    def _report_cached_test_cases(
+        self, test_suite: TestSuite, test_contract_hash: str
+    ) -> List[str]:
+        """
+        Reports test cases which passed before with the same fingerprint.
+        Returns names of the test cases which need to be executed.
+        """
+        assert self.cached_test_suite_results is not None
+        test_case_names: List[str] = []
         for test_case_name in test_suite.test_case_names:
-            env = env_base.fork()
-            try:
-                call_result = await env.invoke_test_case(test_case_name)
+            cached_result = self.cached_test_suite_results.get(test_case_name)
+            if cached_result and cached_result.is_up_to_date(
+                test_contract_hash, self._get_used_contract_hash
+            ):
                 self.queue.put(
-                    PassedTestCase(
+                    CachedTestCase(
                         file_path=test_suite.test_path,
                         test_case_name=test_case_name,
-                        tx_info=call_result,
+                        execution_resources=cached_result.execution_resources,
+                        fingerprint=cached_result.fingerprint,
                     )
                 )
-            except ReportedException as ex:
-                self.queue.put(
-                    FailedTestCase(
-                        file_path=test_suite.test_path,
-                        test_case_name=test_case_name,
-                        exception=ex,
-                    )
+            else:
+                test_case_names.append(test_case_name)
+        return test_case_names
+
+    def _get_used_contract_hash(self, contract_path: str) -> Optional[str]:
+        if contract_path not in self._used_contract_hashes:
+            try:
+                # Contracts are hashed by their sources, as compiling them would take longer than running test cases
+                source_path = Path(contract_path)
+                imported_module_paths = (
+                    self.starknet_compiler.get_imported_module_paths(source_path)
+                )
+                self._used_contract_hashes[contract_path] = compute_sources_hash(
+                    [source_path, *map(Path, imported_module_paths)]
                 )
+            # The test case is executed again and reports the actual problem
+            except Exception:  # pylint: disable=broad-except
+                self._used_contract_hashes[contract_path] = None
+        return self._used_contract_hashes[contract_path]
+
+    def _build_fingerprint(
+        self, env: TestExecutionEnvironment, test_contract_hash: Optional[str]
+    ) -> Optional[TestCaseFingerprint]:
+        if test_contract_hash is None:
+            return None
+        used_contract_hashes: Dict[str, str] = {}
+        for contract_path in sorted(env.used_contract_paths):
+            contract_hash = self._get_used_contract_hash(contract_path)
+            if contract_hash is None:
+                return None
+            used_contract_hashes[contract_path] = contract_hash
+        return TestCaseFingerprint(
+            test_contract_hash=test_contract_hash,
+            used_contract_hashes=used_contract_hashes,
+        )
+
+    async def _prepare_env_base(
+        self, test_suite: TestSuite, test_contract: ContractClass
+    ) -> Tuple[TestExecutionEnvironment, TestSuiteTimings]:
+        start_time = time()
+        env_base = await TestExecutionEnvironment.from_test_suite_definition(
+            self.starknet_compiler, test_contract, self.include_paths
+        )
+        deployment_end_time = time()
+
+        if test_suite.setup_fn_name:
+            with tracer.span("invoke_setup_hook"):
+                await env_base.invoke_setup_hook(test_suite.setup_fn_name)
+        setup_hook_end_time = time()
+
+        return env_base, TestSuiteTimings(
+            deployment=deployment_end_time - start_time,
+            setup_hook=setup_hook_end_time - deployment_end_time,
+        )
+
+    async def _prepare_debug_env_base(
+        self, test_suite: TestSuite
+    ) -> TestExecutionEnvironment:
+        env_base, _ = await self._prepare_env_base(
+            test_suite, self._compile_test_suite(test_suite, add_debug_info=True)
+        )
+        return env_base
+
+    async def _run_test_case(
+        self,
+        env_base: TestExecutionEnvironment,
+        test_suite: TestSuite,
+        test_case_name: str,
+        test_suite_timings: Optional[TestSuiteTimings] = None,
+        test_contract_hash: Optional[str] = None,
+    ) -> TestCaseResult:
+        fork_start_time = time()
+        with tracer.span("fork"):
+            env = env_base.fork()
+        if self.cairo_profile_dir:
+            env.cairo_profiler = CairoProfiler()
+        start_time = time()
+        try:
+            with tracer.span("invoke_test_case", test_case_name=test_case_name):
+                tx_info = await env.invoke_test_case(test_case_name)
+            duration = time() - start_time
+            self._save_cairo_profile(env, test_suite, test_case_name)
+            return PassedTestCase(
+                file_path=test_suite.test_path,
+                test_case_name=test_case_name,
+                execution_resources=(
+                    ExecutionResourcesSummary.from_tx_info(tx_info) if tx_info else None
+                ),
+                duration=duration,
+                fork_duration=start_time - fork_start_time,
+                test_suite_timings=test_suite_timings,
+                fingerprint=self._build_fingerprint(env, test_contract_hash),
+                tx_info=tx_info if self.keep_execution_info else None,
+            )
+        except ReportedException as ex:
+            duration = time() - start_time
+            self._save_cairo_profile(env, test_suite, test_case_name)
+            return FailedTestCase(
+                file_path=test_suite.test_path,
+                test_case_name=test_case_name,
+                exception=ex,
+                duration=duration,
+                fork_duration=start_time - fork_start_time,
+                test_suite_timings=test_suite_timings,
+                fingerprint=self._build_fingerprint(env, test_contract_hash),
+            )
+
+    def _save_cairo_profile(
+        self,
+        env: TestExecutionEnvironment,
+        test_suite: TestSuite,
+        test_case_name: str,
+    ) -> None:
+        if self.cairo_profile_dir and env.cairo_profiler:
+            env.cairo_profiler.save_folded_stacks(
+                get_cairo_profile_path(
+                    self.cairo_profile_dir, test_suite.test_path, test_case_name
+                )
+            )
+
+    async def _reproduce_broken_test_suite_with_debug_info(
+        self, test_suite: TestSuite, exception: BaseException
+    ) -> BaseException:
+        """
+        Repeats the test suite setup with debug info, so the reported error contains the Cairo traceback.
+        The original exception is kept if the setup doesn't fail again.
+        """
+        try:
+            self._debug_env_base = await self._prepare_debug_env_base(test_suite)
+        except (ReportedException, StarkException) as debug_ex:
+            return debug_ex
+        return exception
+
+    async def _rerun_test_case_with_debug_info(
+        self, test_suite: TestSuite, failed_test_case: FailedTestCase
+    ) -> TestCaseResult:
+        """
+        Runs the failed test case again in the environment compiled with debug info.
+        The original result is kept if the test case doesn't fail again.
+        Timings of the original run are reported in both cases.
+        """
+        try:
+            if self._debug_env_base is None:
+                self._debug_env_base = await self._prepare_debug_env_base(test_suite)
+            debug_test_case_result = await self._run_test_case(
+                self._debug_env_base, test_suite, failed_test_case.test_case_name
+            )
+        except (ReportedException, StarkException):
+            return failed_test_case
+
+        if isinstance(debug_test_case_result, FailedTestCase):
+            return replace(
+                debug_test_case_result,
+                duration=failed_test_case.duration,
+                fork_duration=failed_test_case.fork_duration,
+                test_suite_timings=failed_test_case.test_suite_timings,
+                fingerprint=failed_test_case.fingerprint,
+            )
+        return failed_test_case
+
+    def _build_broken_test_suite(
+        self,
+        test_suite: TestSuite,
+        exception: BaseException,
+        test_case_names: Optional[List[str]] = None,
+    ) -> BrokenTestSuite:
+        if isinstance(exception, StarkException) and self.is_constructor_args_exception(
+            exception
+        ):
+            exception = ProtostarException(
+                (
+                    "Protostar doesn't support the unit testing approach for"
+                    "files with a constructor expecting arguments."
+                    "Restructure your code or use `deploy_contract` cheatcode."
+                )
+            )
+
+        return BrokenTestSuite(
+            file_path=test_suite.test_path,
+            exception=exception,
+            test_case_names=(
+                test_suite.test_case_names
+                if test_case_names is None
+                else test_case_names
+            ),
+        )
 
     @staticmethod
     def is_constructor_args_exception(ex: StarkException) -> bool:
@@ -1,50 +1,131 @@
 import multiprocessing
 import signal
-from typing import TYPE_CHECKING, Callable, List
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, List, Optional
 
+from protostar.commands.test.test_results_cache import (
+    CachedTestSuiteResults,
+    TestResultsCache,
+)
 from protostar.commands.test.test_results_queue import TestResultsQueue
 from protostar.commands.test.test_runner import TestRunner
 from protostar.commands.test.testing_live_logger import TestingLiveLogger
+from protostar.starkware_patches import apply_starkware_patches
+from protostar.utils.python_profiler import PythonProfiler
+from protostar.utils.tracer import tracer
 
 if TYPE_CHECKING:
     from protostar.commands.test.test_collector import TestCollector
+    from protostar.commands.test.test_suite import TestSuite
+
+TestSchedulerWorker = Callable[[TestRunner.WorkerArgs, TestResultsQueue], None]
+
+_worker_test_results_queue: Optional[TestResultsQueue] = None
+_worker_python_profiler: Optional[PythonProfiler] = None
+
+
+def _init_worker(
+    test_results_queue: TestResultsQueue,
+    python_profile_dir: Optional[Path] = None,
+    trace_parts_dir: Optional[Path] = None,
+):
+    # pylint: disable=global-statement, invalid-name
+    global _worker_test_results_queue, _worker_python_profiler
+    # Workers started with `spawn` don't inherit patches applied in the main process
+    apply_starkware_patches()
+    _worker_test_results_queue = test_results_queue
+    if python_profile_dir:
+        _worker_python_profiler = PythonProfiler(python_profile_dir, "worker")
+        _worker_python_profiler.start()
+    # Forked workers inherit the state of the main process tracer
+    if trace_parts_dir:
+        tracer.start(trace_parts_dir, "worker")
+    else:
+        tracer.stop()
+    # prevents showing a stacktrace on cmd/ctrl + c
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def _run_worker(worker: TestSchedulerWorker, args: TestRunner.WorkerArgs):
+    assert _worker_test_results_queue is not None, "Uninitialized worker"
+    try:
+        worker(args, _worker_test_results_queue)
+    finally:
+        # Workers are terminated with the pool, so stats are saved as soon as each task finishes,
+        # before its last results are sent and the main process can stop waiting for them
+        tracer.save_part()
+        if _worker_python_profiler:
+            _worker_python_profiler.stop()
+            _worker_python_profiler.save()
+            _worker_python_profiler.start()
+        _worker_test_results_queue.flush()
 
 
 class TestScheduler:
     def __init__(
         self,
         live_logger: TestingLiveLogger,
-        worker: Callable[
-            [TestRunner.WorkerArgs],
-            None,
-        ],
+        worker: TestSchedulerWorker,
     ):
         self._live_logger = live_logger
         self._worker = worker
 
+    # pylint: disable=too-many-arguments
     def run(
-        self, test_collector_result: "TestCollector.Result", include_paths: List[str]
+        self,
+        test_collector_result: "TestCollector.Result",
+        include_paths: List[str],
+        lazy_debug_info: bool = False,
+        keep_execution_info: bool = False,
+        test_results_cache: Optional[TestResultsCache] = None,
+        skip_cached_test_cases: bool = True,
+        cairo_profile_dir: Optional[Path] = None,
+        python_profile_dir: Optional[Path] = None,
     ):
-        with multiprocessing.Manager() as manager:
-            test_results_queue = TestResultsQueue(manager.Queue())
-            setups: List[TestRunner.WorkerArgs] = [
-                TestRunner.WorkerArgs(
-                    test_suite,
-                    test_results_queue,
-                    include_paths,
+        # The queue is passed to workers on their start, because multiprocessing queues can't be
+        # sent as task arguments. Unlike `multiprocessing.Manager().Queue()`, it doesn't route
+        # every message through a separate server process. Results are pickled before being put,
+        # so errors are raised in workers rather than in the feeder thread of the queue.
+        test_results_queue = TestResultsQueue(multiprocessing.Queue())
+        setups: List[TestRunner.WorkerArgs] = [
+            TestRunner.WorkerArgs(
+                test_suite,
+                include_paths,
+                lazy_debug_info,
+                keep_execution_info,
+                self._get_cached_test_suite_results(
+                    test_suite, test_results_cache, skip_cached_test_cases
+                ),
+                cairo_profile_dir,
+            )
+            for test_suite in test_collector_result.test_suites
+        ]
+
+        try:
+            with multiprocessing.Pool(
+                multiprocessing.cpu_count(),
+                _init_worker,
+                (test_results_queue, python_profile_dir, tracer.parts_dir),
+            ) as pool:
+                # Test suites are sorted from the longest, so they are dispatched one by one
+                results = pool.map_async(
+                    partial(_run_worker, self._worker), setups, chunksize=1
                 )
-                for test_suite in test_collector_result.test_suites
-            ]
-
-            try:
-                with multiprocessing.Pool(
-                    multiprocessing.cpu_count(),
-                    lambda: signal.signal(
-                        signal.SIGINT, signal.SIG_IGN
-                    ),  # prevents showing a stacktrace on cmd/ctrl + c
-                ) as pool:
-                    results = pool.map_async(self._worker, setups)
-                    self._live_logger.log(test_results_queue, test_collector_result)
-                    results.get()
-            except KeyboardInterrupt:
-                return
+                self._live_logger.log(test_results_queue, test_collector_result)
+                results.get()
+        except KeyboardInterrupt:
+            return
+
+    @staticmethod
+    def _get_cached_test_suite_results(
+        test_suite: "TestSuite",
+        test_results_cache: Optional[TestResultsCache],
+        skip_cached_test_cases: bool,
+    ) -> Optional[CachedTestSuiteResults]:
+        if test_results_cache is None:
+            return None
+        # Results are still fingerprinted, so the cache can be refreshed
+        if not skip_cached_test_cases:
+            return {}
+        return test_results_cache.get_test_suite_results(test_suite.test_path)
@@ -0,0 +1,97 @@
+import hashlib
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+from protostar.commands.test.test_durations_history import TestDurationsHistory
+from protostar.commands.test.test_suite import TestSuite
+from protostar.protostar_exception import ProtostarException
+
+
+class InvalidShardException(ProtostarException):
+    pass
+
+
+@dataclass(frozen=True)
+class TestShard:
+    """
+    A 1-based `index` of `count` disjoint slices of test suites.
+    Every shard has to compute the same assignment, so test suites are balanced by durations
+    only if all shards read the same durations history. Otherwise, they are split by hashes of their paths.
+    """
+
+    index: int
+    count: int
+
+    @classmethod
+    def parse(cls, value: str) -> "TestShard":
+        match = re.fullmatch(r"(\d+)/(\d+)", value.strip())
+        if not match:
+            raise InvalidShardException(
+                f"Invalid shard '{value}', expected format: INDEX/COUNT, e.g. 1/4"
+            )
+        index, count = int(match.group(1)), int(match.group(2))
+        if count < 1 or not 1 <= index <= count:
+            raise InvalidShardException(
+                f"Invalid shard '{value}', INDEX must be between 1 and COUNT"
+            )
+        return cls(index=index, count=count)
+
+    def __str__(self) -> str:
+        return f"{self.index}/{self.count}"
+
+    def select(
+        self,
+        test_suites: List[TestSuite],
+        shared_test_durations_history: Optional[TestDurationsHistory] = None,
+    ) -> List[TestSuite]:
+        if shared_test_durations_history is None:
+            return [
+                test_suite
+                for test_suite in test_suites
+                if self._get_shard_index_by_path_hash(test_suite.test_path)
+                == self.index - 1
+            ]
+        return self._select_by_durations(test_suites, shared_test_durations_history)
+
+    def _get_shard_index_by_path_hash(self, test_path: Path) -> int:
+        # Shards can run in different directories, so relative paths are hashed
+        try:
+            test_path = test_path.resolve().relative_to(Path.cwd())
+        except ValueError:
+            pass
+        path_hash = hashlib.sha256(test_path.as_posix().encode("utf-8")).hexdigest()
+        return int(path_hash, 16) % self.count
+
+    def _select_by_durations(
+        self,
+        test_suites: List[TestSuite],
+        test_durations_history: TestDurationsHistory,
+    ) -> List[TestSuite]:
+        """
+        Assigns test suites, from the longest, to the least loaded shard.
+        Returned test suites keep the longest-first order.
+        """
+        estimated_test_suites = sorted(
+            (
+                (
+                    test_durations_history.estimate_test_suite_duration(
+                        test_suite.test_path, test_suite.test_case_names
+                    ),
+                    test_suite,
+                )
+                for test_suite in test_suites
+            ),
+            key=lambda item: (-item[0], item[1].test_path.as_posix()),
+        )
+
+        shard_loads = [0.0] * self.count
+        selected_test_suites: List[TestSuite] = []
+        for estimated_duration, test_suite in estimated_test_suites:
+            shard_index = min(range(self.count), key=lambda i: (shard_loads[i], i))
+            shard_loads[shard_index] += estimated_duration
+            if shard_index == self.index - 1:
+                selected_test_suites.append(test_suite)
+
+        return selected_test_suites
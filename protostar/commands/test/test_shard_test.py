@@ -0,0 +1,54 @@
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from protostar.commands.test.test_durations_history import TestDurationsHistory
+from protostar.commands.test.test_shard import InvalidShardException, TestShard
+from protostar.commands.test.test_suite import TestSuite
+
+
+def make_test_suites(test_cases_counts: List[int]) -> List[TestSuite]:
+    return [
+        TestSuite(
+            test_path=Path(f"tests/test_{i}.cairo"),
+            test_case_names=[f"test_{j}" for j in range(test_cases_count)],
+        )
+        for i, test_cases_count in enumerate(test_cases_counts)
+    ]
+
+
+def test_shards_are_disjoint_and_balanced():
+    test_suites = make_test_suites([8, 1, 2, 3])
+    history = TestDurationsHistory()
+
+    shards = [
+        TestShard.parse(f"{index}/2").select(test_suites, history)
+        for index in range(1, 3)
+    ]
+
+    selected_paths = [test_suite.test_path for shard in shards for test_suite in shard]
+    assert sorted(selected_paths) == sorted(
+        test_suite.test_path for test_suite in test_suites
+    )
+    assert [len(shard) for shard in shards] == [1, 3]
+
+
+def test_splitting_test_suites_by_path_hashes_without_shared_history():
+    test_suites = make_test_suites([1] * 20)
+
+    shards = [
+        TestShard.parse(f"{index}/3").select(test_suites) for index in range(1, 4)
+    ]
+
+    selected_paths = [test_suite.test_path for shard in shards for test_suite in shard]
+    assert sorted(selected_paths) == sorted(
+        test_suite.test_path for test_suite in test_suites
+    )
+    assert all(shards)
+
+
+@pytest.mark.parametrize("value", ["0/2", "3/2", "1", "a/b", "1/0"])
+def test_parsing_invalid_shard(value: str):
+    with pytest.raises(InvalidShardException):
+        TestShard.parse(value)
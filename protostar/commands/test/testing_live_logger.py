@@ -1,69 +1,178 @@
 import queue
+import sys
 from logging import Logger
-from typing import TYPE_CHECKING, Any, cast
+from time import time
+from typing import TYPE_CHECKING, Any, Callable, Iterator, List, Optional, Tuple, cast
 
 from tqdm import tqdm as bar
 
-from protostar.commands.test.test_cases import BrokenTestSuite
+from protostar.commands.test.test_cases import (
+    BrokenTestSuite,
+    PassedTestCase,
+    TestCaseResult,
+)
 from protostar.commands.test.test_results_queue import TestResultsQueue
+from protostar.commands.test.test_results_reporters import TestResultsReporter
 from protostar.commands.test.testing_summary import TestingSummary
+from protostar.utils.log_color_provider import log_color_provider
 
 if TYPE_CHECKING:
     from protostar.commands.test.test_collector import TestCollector
 
 
 class TestingLiveLogger:
-    def __init__(self, logger: Logger, testing_summary: TestingSummary) -> None:
+    """
+    Prints results with a progress bar if stdout is a terminal, otherwise as a plain stream of lines.
+    The output is rendered at most once per `frame_interval` seconds.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        logger: Logger,
+        testing_summary: TestingSummary,
+        is_interactive: Optional[bool] = None,
+        frame_interval: float = 0.1,
+        slowest_count: int = 0,
+        reporters: Optional[List[TestResultsReporter]] = None,
+        show_execution_resources: bool = False,
+    ) -> None:
         self._logger = logger
         self.testing_summary = testing_summary
+        self._is_interactive = (
+            sys.stdout.isatty() if is_interactive is None else is_interactive
+        )
+        self._frame_interval = frame_interval
+        self._slowest_count = slowest_count
+        self._reporters = reporters or []
+        self._show_execution_resources = show_execution_resources
 
     def log(
         self,
         test_results_queue: TestResultsQueue,
         test_collector_result: "TestCollector.Result",
     ):
-
         try:
-            with bar(
-                total=test_collector_result.test_cases_count,
-                bar_format="{l_bar}{bar}[{n_fmt}/{total_fmt}]",
-                dynamic_ncols=True,
-                leave=False,
-            ) as progress_bar:
-                tests_left_n = test_collector_result.test_cases_count
-                progress_bar.update()
-                try:
-                    while tests_left_n > 0:
-                        test_case_result = test_results_queue.get()
-                        self.testing_summary.extend([test_case_result])
-                        cast(Any, progress_bar).colour = (
-                            "RED"
-                            if len(self.testing_summary.failed)
-                            + len(self.testing_summary.broken)
-                            > 0
-                            else "GREEN"
-                        )
-                        progress_bar.write(str(test_case_result))
-
-                        if isinstance(test_case_result, BrokenTestSuite):
-                            tests_in_case_count = len(test_case_result.test_case_names)
-                            progress_bar.update(tests_in_case_count)
-                            tests_left_n -= tests_in_case_count
-                        else:
-                            progress_bar.update(1)
-                            tests_left_n -= 1
-                finally:
-                    progress_bar.write("")
-                    progress_bar.clear()
-                    self.testing_summary.log(
-                        logger=self._logger,
-                        collected_test_cases_count=test_collector_result.test_cases_count,
-                        collected_test_suites_count=len(
-                            test_collector_result.test_suites
-                        ),
-                    )
-
+            if self._is_interactive:
+                self._log_with_progress_bar(test_results_queue, test_collector_result)
+            else:
+                self._log_as_stream(test_results_queue, test_collector_result)
         except queue.Empty:
             # https://docs.python.org/3/library/queue.html#queue.Queue.get
             # We skip it to prevent deadlock, but this error should never happen
             pass
+
+    def _log_with_progress_bar(
+        self,
+        test_results_queue: TestResultsQueue,
+        test_collector_result: "TestCollector.Result",
+    ):
+        with bar(
+            total=test_collector_result.test_cases_count,
+            bar_format="{l_bar}{bar}[{n_fmt}/{total_fmt}]",
+            dynamic_ncols=True,
+            leave=False,
+        ) as progress_bar:
+            progress_bar.update()
+
+            def render(lines: List[str], processed_test_cases_count: int):
+                cast(Any, progress_bar).colour = (
+                    "RED" if self.testing_summary.has_failures else "GREEN"
+                )
+                if lines:
+                    progress_bar.write("\n".join(lines))
+                progress_bar.update(processed_test_cases_count)
+
+            try:
+                self._log_in_frames(
+                    test_results_queue, test_collector_result, render=render
+                )
+            finally:
+                progress_bar.write("")
+                progress_bar.clear()
+                self._log_summary(test_collector_result)
+
+    def _log_as_stream(
+        self,
+        test_results_queue: TestResultsQueue,
+        test_collector_result: "TestCollector.Result",
+    ):
+        def render(lines: List[str], _processed_test_cases_count: int):
+            if lines:
+                print("\n".join(lines), flush=True)
+
+        try:
+            self._log_in_frames(
+                test_results_queue, test_collector_result, render=render
+            )
+        finally:
+            print("", flush=True)
+            self._log_summary(test_collector_result)
+
+    def _log_in_frames(
+        self,
+        test_results_queue: TestResultsQueue,
+        test_collector_result: "TestCollector.Result",
+        render: Callable[[List[str], int], None],
+    ):
+        pending_lines: List[str] = []
+        pending_test_cases_count = 0
+        last_render_time = 0.0
+        try:
+            for test_case_result, processed_test_cases_count in self._receive_results(
+                test_results_queue, test_collector_result.test_cases_count
+            ):
+                pending_lines.append(self._format_result(test_case_result))
+                pending_test_cases_count += processed_test_cases_count
+
+                if time() - last_render_time >= self._frame_interval:
+                    render(pending_lines, pending_test_cases_count)
+                    self._flush_reporters()
+                    pending_lines = []
+                    pending_test_cases_count = 0
+                    last_render_time = time()
+        finally:
+            render(pending_lines, pending_test_cases_count)
+            self._flush_reporters()
+
+    def _format_result(self, test_case_result: TestCaseResult) -> str:
+        if (
+            self._show_execution_resources
+            and isinstance(test_case_result, PassedTestCase)
+            and test_case_result.execution_resources
+        ):
+            return f"{test_case_result} " + log_color_provider.colorize(
+                "GRAY", f"({test_case_result.execution_resources})"
+            )
+        return str(test_case_result)
+
+    def _flush_reporters(self):
+        for reporter in self._reporters:
+            reporter.flush()
+
+    def _receive_results(
+        self, test_results_queue: TestResultsQueue, test_cases_count: int
+    ) -> Iterator[Tuple[TestCaseResult, int]]:
+        tests_left_n = test_cases_count
+        while tests_left_n > 0:
+            test_case_result = test_results_queue.get()
+            self.testing_summary.extend([test_case_result])
+            for reporter in self._reporters:
+                reporter.report(test_case_result)
+
+            if isinstance(test_case_result, BrokenTestSuite):
+                processed_test_cases_count = len(test_case_result.test_case_names)
+            else:
+                processed_test_cases_count = 1
+
+            tests_left_n -= processed_test_cases_count
+            yield test_case_result, processed_test_cases_count
+
+    def _log_summary(self, test_collector_result: "TestCollector.Result"):
+        self.testing_summary.log(
+            logger=self._logger,
+            collected_test_cases_count=test_collector_result.test_cases_count,
+            collected_test_suites_count=len(test_collector_result.test_suites),
+            slowest_count=self._slowest_count,
+            show_execution_resources=self._show_execution_resources,
+        )
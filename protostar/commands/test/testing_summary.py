@@ -1,10 +1,17 @@
+import heapq
 from collections import defaultdict
 from logging import Logger
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Set, Union
 
+from typing_extensions import Literal
+
+from protostar.commands.test.execution_resources_report import (
+    ExecutionResourcesReport,
+)
 from protostar.commands.test.test_cases import (
     BrokenTestSuite,
+    CachedTestCase,
     FailedTestCase,
     PassedTestCase,
     TestCaseResult,
@@ -12,34 +19,92 @@ from protostar.commands.test.test_cases import (
 from protostar.protostar_exception import ProtostarExceptionSilent
 from protostar.utils.log_color_provider import log_color_provider
 
+TestSuiteStatus = Literal["passed", "failed", "broken"]
+
+TEST_SUITE_STATUS_PRIORITY: Dict[TestSuiteStatus, int] = {
+    "passed": 0,
+    "failed": 1,
+    "broken": 2,
+}
+
 
 class TestingSummary:
     def __init__(self, case_results: List[TestCaseResult]) -> None:
-        self.case_results = []
-        self.test_suites_mapping: Dict[Path, List[TestCaseResult]] = defaultdict(list)
         self.passed: List[PassedTestCase] = []
         self.failed: List[FailedTestCase] = []
         self.broken: List[BrokenTestSuite] = []
+        self._test_suite_statuses: Dict[Path, TestSuiteStatus] = {}
+        self._test_suites_count_by_status: Dict[TestSuiteStatus, int] = defaultdict(int)
+        self._test_suite_durations: Dict[Path, float] = defaultdict(float)
+        self._timed_test_suites: Set[Path] = set()
         self.extend(case_results)
 
     def extend(self, case_results: List[TestCaseResult]):
-        self.case_results += case_results
         for case_result in case_results:
-            self.test_suites_mapping[case_result.file_path].append(case_result)
-
             if isinstance(case_result, PassedTestCase):
                 self.passed.append(case_result)
+                self._update_test_suite_status(case_result.file_path, "passed")
             if isinstance(case_result, FailedTestCase):
                 self.failed.append(case_result)
+                self._update_test_suite_status(case_result.file_path, "failed")
             if isinstance(case_result, BrokenTestSuite):
                 self.broken.append(case_result)
-
+                self._update_test_suite_status(case_result.file_path, "broken")
+            if isinstance(case_result, (PassedTestCase, FailedTestCase)):
+                self._update_test_suite_duration(case_result)
+
+    @property
+    def has_failures(self) -> bool:
+        return bool(self.failed or self.broken)
+
+    def _update_test_suite_status(self, file_path: Path, status: TestSuiteStatus):
+        """
+        A test suite is broken if any result is broken, otherwise it's failed if any test case failed.
+        """
+        previous_status = self._test_suite_statuses.get(file_path)
+        if previous_status is not None:
+            if (
+                TEST_SUITE_STATUS_PRIORITY[previous_status]
+                >= TEST_SUITE_STATUS_PRIORITY[status]
+            ):
+                return
+            self._test_suites_count_by_status[previous_status] -= 1
+
+        self._test_suite_statuses[file_path] = status
+        self._test_suites_count_by_status[status] += 1
+
+    def _update_test_suite_duration(
+        self, case_result: Union[PassedTestCase, FailedTestCase]
+    ):
+        file_path = case_result.file_path
+        self._test_suite_durations[file_path] += (
+            case_result.fork_duration + case_result.duration
+        )
+        if (
+            case_result.test_suite_timings is not None
+            and file_path not in self._timed_test_suites
+        ):
+            self._timed_test_suites.add(file_path)
+            self._test_suite_durations[
+                file_path
+            ] += case_result.test_suite_timings.total
+
+    # pylint: disable=too-many-arguments
     def log(
         self,
         logger: Logger,
         collected_test_cases_count: int,
         collected_test_suites_count: int,
+        slowest_count: int = 0,
+        show_execution_resources: bool = False,
     ):
+        if show_execution_resources and self.passed:
+            logger.info(
+                ExecutionResourcesReport.from_case_results(self.passed).format_table()
+            )
+        if slowest_count > 0:
+            self._log_slowest(logger, slowest_count)
+
         logger.info(
             log_color_provider.bold("Test suites: ")
             + self._get_test_suites_summary(collected_test_suites_count)
@@ -49,75 +114,70 @@ class TestingSummary:
             + self._get_test_cases_summary(collected_test_cases_count)
         )
 
+    def _log_slowest(self, logger: Logger, slowest_count: int):
+        slowest_test_suites = heapq.nlargest(
+            slowest_count,
+            self._test_suite_durations.items(),
+            key=lambda item: item[1],
+        )
+        slowest_test_cases = heapq.nlargest(
+            slowest_count,
+            [*self.passed, *self.failed],
+            key=lambda case_result: case_result.duration,
+        )
+
+        lines: List[str] = [log_color_provider.bold("Slowest test suites:")]
+        for file_path, duration in slowest_test_suites:
+            lines.append(
+                f"{duration:9.3f} s  {log_color_provider.colorize('GRAY', str(file_path))}"
+            )
+
+        lines.append(log_color_provider.bold("Slowest test cases:"))
+        for case_result in slowest_test_cases:
+            lines.append(
+                f"{case_result.duration:9.3f} s  "
+                f"{case_result.get_formatted_file_path()} {case_result.test_case_name}"
+            )
+
+        logger.info("\n".join(lines))
+
     def assert_all_passed(self):
-        if self.failed or self.broken:
+        if self.has_failures:
             raise ProtostarExceptionSilent("Not all test cases passed")
 
     def _get_test_cases_summary(self, collected_test_cases_count: int) -> str:
         failed_test_cases_count = len(self.failed)
         passed_test_cases_count = len(self.passed)
+        cached_test_cases_count = sum(
+            1 for case_result in self.passed if isinstance(case_result, CachedTestCase)
+        )
 
         return ", ".join(
             self._get_preprocessed_core_testing_summary(
                 failed_count=failed_test_cases_count,
                 passed_count=passed_test_cases_count,
+                cached_count=cached_test_cases_count,
                 total_count=collected_test_cases_count,
             )
         )
 
     def _get_test_suites_summary(self, collected_test_suites_count: int) -> str:
-        passed_test_suites_count = 0
-        failed_test_suites_count = 0
-        broken_test_suites_count = 0
-        total_test_suites_count = len(self.test_suites_mapping)
-        for suit_case_results in self.test_suites_mapping.values():
-            partial_summary = TestingSummary(suit_case_results)
-
-            if len(partial_summary.broken) > 0:
-                broken_test_suites_count += 1
-                continue
-
-            if len(partial_summary.failed) > 0:
-                failed_test_suites_count += 1
-                continue
-
-            if len(partial_summary.passed) > 0:
-                passed_test_suites_count += 1
-
-        test_suites_result: List[str] = []
-
-        if broken_test_suites_count > 0:
-            test_suites_result.append(
-                log_color_provider.colorize("RED", f"{broken_test_suites_count} broken")
-            )
-        if failed_test_suites_count > 0:
-            test_suites_result.append(
-                log_color_provider.colorize("RED", f"{failed_test_suites_count} failed")
-            )
-        if passed_test_suites_count > 0:
-            test_suites_result.append(
-                log_color_provider.colorize(
-                    "GREEN", f"{passed_test_suites_count} passed"
-                )
-            )
-        if total_test_suites_count > 0:
-            test_suites_result.append(f"{total_test_suites_count} total")
-
         return ", ".join(
             self._get_preprocessed_core_testing_summary(
-                broken_count=broken_test_suites_count,
-                failed_count=failed_test_suites_count,
-                passed_count=passed_test_suites_count,
+                broken_count=self._test_suites_count_by_status["broken"],
+                failed_count=self._test_suites_count_by_status["failed"],
+                passed_count=self._test_suites_count_by_status["passed"],
                 total_count=collected_test_suites_count,
             )
         )
 
-    # pylint: disable=no-self-use
+    # pylint: disable=no-self-use, too-many-arguments
     def _get_preprocessed_core_testing_summary(
         self,
         broken_count: int = 0,
         failed_count: int = 0,
         passed_count: int = 0,
+        cached_count: int = 0,
         total_count: int = 0,
     ) -> List[str]:
         skipped_count = total_count - (broken_count + failed_count + passed_count)
@@ -138,6 +198,11 @@ class TestingSummary:
         if passed_count > 0:
             test_suites_result.append(
                 log_color_provider.colorize("GREEN", f"{passed_count} passed")
+                + (
+                    log_color_provider.colorize("GRAY", f" ({cached_count} cached)")
+                    if cached_count > 0
+                    else ""
+                )
             )
         if total_count > 0:
             test_suites_result.append(f"{total_count} total")
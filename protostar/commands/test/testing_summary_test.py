@@ -0,0 +1,67 @@
+from pathlib import Path
+
+from protostar.commands.test.test_cases import (
+    BrokenTestSuite,
+    FailedTestCase,
+    PassedTestCase,
+)
+from protostar.commands.test.test_environment_exceptions import (
+    SimpleReportedException,
+)
+from protostar.commands.test.testing_summary import TestingSummary
+
+
+def test_counting_test_suites_by_the_worst_result():
+    testing_summary = TestingSummary(
+        [
+            PassedTestCase(file_path=Path("a"), test_case_name="test_a"),
+            PassedTestCase(file_path=Path("b"), test_case_name="test_a"),
+            FailedTestCase(
+                file_path=Path("b"),
+                test_case_name="test_b",
+                exception=SimpleReportedException("fail"),
+            ),
+            PassedTestCase(file_path=Path("b"), test_case_name="test_c"),
+        ]
+    )
+    testing_summary.extend(
+        [
+            BrokenTestSuite(
+                file_path=Path("c"),
+                test_case_names=["test_a"],
+                exception=SimpleReportedException("broken"),
+            )
+        ]
+    )
+
+    # pylint: disable=protected-access
+    assert testing_summary._test_suites_count_by_status == {
+        "passed": 1,
+        "failed": 1,
+        "broken": 1,
+    }
+    assert len(testing_summary.passed) == 3
+    assert testing_summary.has_failures
+
+
+def test_logging_slowest_test_cases(mocker):
+    logger = mocker.MagicMock()
+    testing_summary = TestingSummary(
+        [
+            PassedTestCase(file_path=Path("a"), test_case_name="test_a", duration=1),
+            PassedTestCase(file_path=Path("b"), test_case_name="test_b", duration=3),
+            PassedTestCase(file_path=Path("b"), test_case_name="test_c", duration=2),
+        ]
+    )
+
+    testing_summary.log(
+        logger,
+        collected_test_cases_count=3,
+        collected_test_suites_count=2,
+        slowest_count=1,
+    )
+
+    slowest_log = logger.info.call_args_list[0][0][0]
+    assert "test_b" in slowest_log
+    assert "test_a" not in slowest_log
+    assert "test_c" not in slowest_log
@@ -6,7 +6,6 @@ from protostar.cli import Command
 from protostar.commands.remove.remove_command import (
     INTERNAL_DEPENDENCY_REFERENCE_DESCRIPTION,
 )
-from protostar.commands.update.update_package import update_package
 from protostar.commands.update.updating_exceptions import (
     PackageAlreadyUpToDateException,
 )
@@ -53,6 +52,8 @@ class UpdateCommand(Command):
 
 
 def handle_update_command(args, project: Project) -> None:
+    # pylint: disable=import-outside-toplevel
+    from protostar.commands.update.update_package import update_package
 
     logger = getLogger()
 
@@ -6,7 +6,6 @@ from logging import getLogger
 from typing import List, Optional
 from urllib.request import urlretrieve
 
-import requests
 from packaging import version
 
 from protostar.cli.command import Command
@@ -150,6 +149,9 @@ class UpgradeManager:
 
     @classmethod
     def get_latest_release(cls):
+        # pylint: disable=import-outside-toplevel
+        import requests
+
         headers = {"Accept": "application/json"}
         response = requests.get(f"{PROTOSTAR_REPO}/releases/latest", headers=headers)
         return response.json()
@@ -7,15 +7,19 @@ from typing import Any
 from protostar.cli import CLIApp, Command
 from protostar.commands import (
     BuildCommand,
+    DaemonCommand,
     DeployCommand,
+    ExportJsonCommand,
     InitCommand,
     InstallCommand,
+    MergeTestResultsCommand,
     RemoveCommand,
     TestCommand,
     UpdateCommand,
     UpgradeCommand,
 )
 from protostar.protostar_exception import ProtostarException, ProtostarExceptionSilent
+from protostar.starkware_patches import apply_starkware_patches
 from protostar.utils import (
     Project,
     ProtostarDirectory,
@@ -70,13 +74,16 @@ class ProtostarCLI(CLIApp):
         super().__init__(
             commands=[
                 InitCommand(script_root, version_manager),
-                BuildCommand(project),
+                BuildCommand(project, version_manager),
+                ExportJsonCommand(),
                 InstallCommand(project),
                 RemoveCommand(project),
                 UpdateCommand(project),
                 UpgradeCommand(protostar_directory, version_manager),
-                TestCommand(project, protostar_directory),
+                TestCommand(project, protostar_directory, version_manager),
+                MergeTestResultsCommand(project),
                 DeployCommand(project),
+                DaemonCommand(),
             ],
             root_args=[
                 PROFILE_ARG,
@@ -128,6 +135,7 @@ class ProtostarCLI(CLIApp):
                 self.version_manager.print_current_version()
                 return
 
+            apply_starkware_patches()
             await super().run(args)
         except ProtostarExceptionSilent:
             sys.exit(1)
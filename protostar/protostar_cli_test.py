@@ -1,3 +1,5 @@
+import subprocess
+import sys
 from asyncio import Future
 from logging import Logger
 from pathlib import Path
@@ -22,8 +24,11 @@ def git_version_fixture() -> str:
 @pytest.fixture(name="version_manager")
 def version_manager_fixture(mocker: MockerFixture, git_version: str):
     version_manager: Any = VersionManager(mocker.MagicMock())
-    type(version_manager).git_version = mocker.PropertyMock(
-        return_value=VersionManager.parse(git_version)
+    mocker.patch.object(
+        VersionManager,
+        "git_version",
+        new_callable=mocker.PropertyMock,
+        return_value=VersionManager.parse(git_version),
     )
     return version_manager
 
@@ -153,3 +158,34 @@ def test_should_create_instance_of_protostar_cli(tmpdir):
         protostar_cli.version_manager._protostar_directory.protostar_binary_dir_path
         == script_root
     )
+
+
+def test_creating_parser_doesnt_import_command_implementations():
+    # A fresh interpreter is used, as other tests import cairo-lang modules
+    script = "\n".join(
+        [
+            "import sys",
+            "from pathlib import Path",
+            "from protostar.cli import ArgumentParserFacade",
+            "from protostar.protostar_cli import ProtostarCLI",
+            "ArgumentParserFacade(ProtostarCLI.create(Path()))",
+            "print('\\n'.join(sys.modules))",
+        ]
+    )
+    imported_modules = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        check=True,
+        cwd=Path(__file__).parent.parent,
+        encoding="utf-8",
+    ).stdout.splitlines()
+
+    heavy_modules = [
+        module
+        for module in imported_modules
+        if module.split(".")[0]
+        in ["crypto_cpp_py", "git", "requests", "starknet_py", "sympy"]
+        or module.startswith("starkware.cairo.lang.compiler")
+        or module.startswith("starkware.starknet")
+    ]
+    assert heavy_modules == []
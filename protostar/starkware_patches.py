@@ -0,0 +1,38 @@
+_are_starkware_patches_applied: bool = False
+
+
+def apply_starkware_patches() -> None:
+    """
+    Patches cairo-lang functions used by Protostar. It's called before running a command, instead of on importing
+    `protostar`, as patched modules take long to import, which would slow down commands which don't need them.
+    """
+    # pylint: disable=global-statement, import-outside-toplevel, invalid-name
+    global _are_starkware_patches_applied
+    if _are_starkware_patches_applied:
+        return
+    _are_starkware_patches_applied = True
+
+    from crypto_cpp_py.cpp_bindings import cpp_hash
+    from starkware.crypto.signature import fast_pedersen_hash
+
+    def patched_pedersen_hash(left: int, right: int) -> int:
+        return cpp_hash(left, right)
+
+    # This is a monkey-patch to improve the performance of the protostar tests
+    # We are using c++ code for calculating the pedersen hashes
+    # instead of python implementation from cairo-lang package
+    # It has to be applied before other cairo-lang modules are imported to make sure
+    # only the patched function is used
+    setattr(fast_pedersen_hash, "pedersen_hash", patched_pedersen_hash)
+
+    from starkware.cairo.lang.compiler import import_loader
+
+    from protostar.utils.parsed_module_cache import parsed_module_cache
+
+    # Parsed Cairo modules, e.g. from `starkware.cairo.common` or `lib`, are reused
+    # by all compilations instead of being parsed again for each contract and test suite
+    setattr(
+        import_loader,
+        "parse_file",
+        parsed_module_cache.parse_file,
+    )
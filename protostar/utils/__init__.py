@@ -1,6 +1,5 @@
 from protostar.utils.config import Project
 from protostar.utils.create_and_commit_sample_file import create_and_commit_sample_file
-from protostar.utils.data_transformer_facade import DataTransformerFacade
 from protostar.utils.log_color_provider import log_color_provider
 from protostar.utils.package_info import (
     extract_info_from_repo_id,
@@ -0,0 +1,82 @@
+import json
+import zlib
+from pathlib import Path
+from typing import Union
+
+from starkware.starknet.services.api.contract_class import ContractClass
+
+from protostar.protostar_exception import ProtostarException
+
+COMPACT_CONTRACT_SUFFIX = ".bin"
+
+_COMPACT_CONTRACT_MAGIC = b"PROTOSTAR_COMPACT_CONTRACT"
+_COMPACT_CONTRACT_VERSION = 2
+
+
+class CompactContractException(ProtostarException):
+    pass
+
+
+def dump_compact_contract(contract_class: ContractClass) -> bytes:
+    """
+    Serializes a contract class to the compact format, which is a header followed by the compressed,
+    minified JSON of the contract class. Unlike pickles, compact contracts received from other people
+    are safe to load, as they are deserialized with the marshmallow schema of the contract class.
+    """
+    header = json.dumps({"version": _COMPACT_CONTRACT_VERSION}, sort_keys=True)
+    payload = json.dumps(
+        contract_class.Schema().dump(contract_class),
+        separators=(",", ":"),
+        sort_keys=True,
+    )
+    return b"\n".join(
+        [
+            _COMPACT_CONTRACT_MAGIC,
+            header.encode("utf-8"),
+            zlib.compress(payload.encode("utf-8")),
+        ]
+    )
+
+
+def is_compact_contract(data: Union[str, bytes]) -> bool:
+    return isinstance(data, bytes) and data.startswith(_COMPACT_CONTRACT_MAGIC + b"\n")
+
+
+def load_compact_contract(data: bytes) -> ContractClass:
+    try:
+        _, raw_header, payload = data.split(b"\n", 2)
+        header = json.loads(raw_header)
+    except ValueError as err:
+        raise CompactContractException("The compact contract is corrupted") from err
+
+    if header.get("version") != _COMPACT_CONTRACT_VERSION:
+        raise CompactContractException(
+            "The compact contract was saved by a different version of Protostar. "
+            "Build the contract again."
+        )
+
+    try:
+        return ContractClass.Schema().load(json.loads(zlib.decompress(payload)))
+    except Exception as err:  # pylint: disable=broad-except
+        raise CompactContractException("The compact contract is corrupted") from err
+
+
+def parse_contract_class(data: Union[str, bytes]) -> ContractClass:
+    """
+    Parses a contract class saved either in the compact or in the standard JSON format.
+    """
+    if is_compact_contract(data):
+        return load_compact_contract(data)  # type: ignore
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    return ContractClass.loads(data)
+
+
+def load_contract_class(path: Path) -> ContractClass:
+    return parse_contract_class(path.read_bytes())
+
+
+def dump_contract_json(contract_class: ContractClass) -> str:
+    return json.dumps(
+        contract_class.Schema().dump(contract_class), indent=4, sort_keys=True
+    )
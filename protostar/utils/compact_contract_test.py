@@ -0,0 +1,82 @@
+import pickle
+from pathlib import Path
+
+import pytest
+from starkware.starknet.compiler.compile import compile_starknet_codes
+from starkware.starknet.services.api.contract_class import ContractClass
+
+from protostar.utils.compact_contract import (
+    CompactContractException,
+    dump_compact_contract,
+    dump_contract_json,
+    is_compact_contract,
+    parse_contract_class,
+)
+
+CODE = """
+%lang starknet
+
+@external
+func add(a: felt, b: felt) -> (res: felt):
+    return (a + b)
+end
+"""
+
+
+@pytest.fixture(name="contract_class", scope="module")
+def contract_class_fixture() -> ContractClass:
+    return compile_starknet_codes([(CODE, "add.cairo")], debug_info=True)
+
+
+def test_loading_compact_contract(contract_class: ContractClass):
+    compact_contract = dump_compact_contract(contract_class)
+
+    assert is_compact_contract(compact_contract)
+    assert parse_contract_class(compact_contract) == contract_class
+
+
+def test_loading_json_contract(contract_class: ContractClass):
+    contract_json = dump_contract_json(contract_class)
+
+    assert not is_compact_contract(contract_json)
+    assert parse_contract_class(contract_json) == contract_class
+    assert parse_contract_class(contract_json.encode("utf-8")) == contract_class
+
+
+def test_exporting_compact_contract_to_json(contract_class: ContractClass):
+    compact_contract = dump_compact_contract(contract_class)
+
+    assert dump_contract_json(parse_contract_class(compact_contract)) == (
+        dump_contract_json(contract_class)
+    )
+
+
+class _Payload:
+    def __init__(self, marker_path: Path):
+        self.marker_path = marker_path
+
+    def __reduce__(self):
+        return (self.marker_path.touch, ())
+
+
+def test_not_unpickling_compact_contracts(
+    contract_class: ContractClass, tmp_path: Path
+):
+    marker_path = tmp_path / "unpickled"
+    magic, header, _ = dump_compact_contract(contract_class).split(b"\n", 2)
+    forged_contract = b"\n".join([magic, header, pickle.dumps(_Payload(marker_path))])
+
+    with pytest.raises(CompactContractException, match="corrupted"):
+        parse_contract_class(forged_contract)
+    assert not marker_path.exists()
+
+
+def test_rejecting_contract_saved_in_other_format_version(
+    contract_class: ContractClass,
+):
+    compact_contract = dump_compact_contract(contract_class).replace(
+        b'{"version": 2}', b'{"version": 1}', 1
+    )
+
+    with pytest.raises(CompactContractException, match="Build the contract again"):
+        parse_contract_class(compact_contract)
@@ -0,0 +1,154 @@
+import os
+import pickle
+import socket
+import stat
+import struct
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from starkware.cairo.lang.version import __version__ as cairo_lang_version
+
+from protostar.protostar_exception import ProtostarException
+
+COMPILE_DAEMON_SOCKET_ENV = "PROTOSTAR_DAEMON_SOCKET"
+
+_MESSAGE_LENGTH_FORMAT = "!Q"
+
+
+def get_compile_daemon_socket_path() -> Path:
+    """
+    Messages are pickled, so by default the socket is kept in a directory accessible only to the current user:
+    `$XDG_RUNTIME_DIR` or a directory in the temporary directory, checked by `prepare_compile_daemon_socket_dir`.
+    """
+    socket_path = os.environ.get(COMPILE_DAEMON_SOCKET_ENV)
+    if socket_path:
+        return Path(socket_path)
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "protostar-daemon.sock"
+    return _get_temporary_socket_path()
+
+
+def prepare_compile_daemon_socket_dir(socket_path: Path) -> None:
+    socket_dir = socket_path.parent
+    socket_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if socket_path != _get_temporary_socket_path():
+        return
+    # The temporary directory is shared, so another user could have created the directory before
+    socket_dir_stat = os.lstat(socket_dir)
+    if (
+        not stat.S_ISDIR(socket_dir_stat.st_mode)
+        or socket_dir_stat.st_uid != os.getuid()
+        or socket_dir_stat.st_mode & 0o077
+    ):
+        raise ProtostarException(
+            f"{socket_dir} has to be a directory owned by the current user and accessible only to them"
+        )
+
+
+def _get_temporary_socket_path() -> Path:
+    return Path(tempfile.gettempdir()) / f"protostar-{os.getuid()}" / "daemon.sock"
+
+
+def is_owned_by_current_user(socket_path: Path) -> bool:
+    try:
+        socket_stat = os.lstat(socket_path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(socket_stat.st_mode) and socket_stat.st_uid == os.getuid()
+
+
+@dataclass(frozen=True)
+class CompileDaemonRequest:
+    method: str
+    kwargs: Dict[str, Any]
+    cwd: str
+    cairo_lang_version: str
+
+
+@dataclass(frozen=True)
+class CompileDaemonResponse:
+    result: Any = None
+    imported_module_paths: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+def send_message(connection: socket.socket, message: Any) -> None:
+    payload = pickle.dumps(message)
+    connection.sendall(struct.pack(_MESSAGE_LENGTH_FORMAT, len(payload)) + payload)
+
+
+def receive_message(connection: socket.socket) -> Any:
+    header = _receive_exactly(connection, struct.calcsize(_MESSAGE_LENGTH_FORMAT))
+    (payload_length,) = struct.unpack(_MESSAGE_LENGTH_FORMAT, header)
+    return pickle.loads(_receive_exactly(connection, payload_length))
+
+
+def _receive_exactly(connection: socket.socket, length: int) -> bytes:
+    chunks: List[bytes] = []
+    remaining_length = length
+    while remaining_length > 0:
+        chunk = connection.recv(min(remaining_length, 1 << 20))
+        if not chunk:
+            raise EOFError("Connection closed")
+        chunks.append(chunk)
+        remaining_length -= len(chunk)
+    return b"".join(chunks)
+
+
+class CompileDaemonClient:
+    """
+    Sends compilation requests to `protostar daemon`. Requests return None if the daemon isn't running
+    or fails, so callers compile by themselves, which also raises compilation errors as usual.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = hasattr(socket, "AF_UNIX") and hasattr(os, "getuid")
+
+    def is_running(self) -> bool:
+        if not self.enabled:
+            return False
+        socket_path = get_compile_daemon_socket_path()
+        if not is_owned_by_current_user(socket_path):
+            return False
+        try:
+            with socket.socket(
+                socket.AF_UNIX, socket.SOCK_STREAM  # type: ignore
+            ) as connection:
+                connection.connect(str(socket_path))
+            return True
+        except OSError:
+            return False
+
+    def request(self, method: str, **kwargs: Any) -> Optional[CompileDaemonResponse]:
+        if not self.enabled:
+            return None
+        socket_path = get_compile_daemon_socket_path()
+        # Responses are unpickled, so sockets created by other users are ignored
+        if not is_owned_by_current_user(socket_path):
+            return None
+        try:
+            with socket.socket(
+                socket.AF_UNIX, socket.SOCK_STREAM  # type: ignore
+            ) as connection:
+                connection.connect(str(socket_path))
+                send_message(
+                    connection,
+                    CompileDaemonRequest(
+                        method=method,
+                        kwargs=kwargs,
+                        cwd=os.getcwd(),
+                        cairo_lang_version=cairo_lang_version,
+                    ),
+                )
+                response = receive_message(connection)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError):
+            return None
+        if not isinstance(response, CompileDaemonResponse) or response.error:
+            return None
+        return response
+
+
+compile_daemon_client = CompileDaemonClient()
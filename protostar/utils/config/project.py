@@ -1,3 +1,4 @@
+import os
 from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -7,11 +8,16 @@ import flatdict
 import tomli
 import tomli_w
 
-from protostar.commands.test.expected_event import collect_immediate_subdirectories
 from protostar.protostar_exception import ProtostarException
 from protostar.utils.protostar_directory import VersionManager
 
 
+def collect_immediate_subdirectories(root_dir: Path) -> List[str]:
+    assert root_dir.is_dir(), f"{root_dir} is supposed to be a directory!"
+    (root, dirs, _) = next(os.walk(str(root_dir.resolve())))
+    return [str(Path(root, directory).resolve()) for directory in dirs]
+
+
 class NoProtostarProjectFoundException(ProtostarException):
     pass
 
@@ -58,6 +64,10 @@ class Project:
     def config_path(self) -> Path:
         return self.project_root / "protostar.toml"
 
+    @property
+    def cache_path(self) -> Path:
+        return self.project_root / ".protostar_cache"
+
     @property
     def ordered_dict(self):
         general = OrderedDict(**self.config.__dict__)
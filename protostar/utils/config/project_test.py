@@ -17,8 +17,11 @@ current_directory = Path(__file__).parent
 
 def make_mock_project(mocker, contracts, libs_path, pkg_root=None) -> Project:
     version_manager: Any = VersionManager(mocker.MagicMock())
-    type(version_manager).protostar_version = mocker.PropertyMock(
-        return_value=VersionManager.parse("0.1.0")
+    mocker.patch.object(
+        VersionManager,
+        "protostar_version",
+        new_callable=mocker.PropertyMock,
+        return_value=VersionManager.parse("0.1.0"),
     )
     pkg = Project(version_manager, pkg_root)
     mock_config = ProjectConfig(
@@ -33,8 +36,11 @@ def make_mock_project(mocker, contracts, libs_path, pkg_root=None) -> Project:
 @pytest.fixture(name="version_manager")
 def fixture_version_manager(mocker: MockerFixture) -> VersionManager:
     version_manager: Any = VersionManager(mocker.MagicMock())
-    type(version_manager).protostar_version = mocker.PropertyMock(
-        return_value=VersionManager.parse("0.1.0")
+    mocker.patch.object(
+        VersionManager,
+        "protostar_version",
+        new_callable=mocker.PropertyMock,
+        return_value=VersionManager.parse("0.1.0"),
     )
     return version_manager
 
@@ -1,9 +1,11 @@
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from git.repo import Repo
+if TYPE_CHECKING:
+    from git.repo import Repo
 
 
-def create_and_commit_sample_file(repo: Repo, directory: Path):
+def create_and_commit_sample_file(repo: "Repo", directory: Path):
     with open(directory / "foo.txt", "w", encoding="utf-8") as some_file:
         some_file.write("foo")
         some_file.close()
@@ -0,0 +1,134 @@
+import os
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, List, Optional, Set
+
+from starkware.cairo.lang.compiler.cairo_compile import get_module_reader
+from starkware.cairo.lang.compiler.module_reader import ModuleReader
+from starkware.cairo.lang.compiler.scoped_name import ScopedName
+
+# Directories modified so recently may change again within the mtime resolution of the filesystem
+_RACY_MTIME_WINDOW_NS = 2 * 10**9
+
+
+@dataclass(frozen=True)
+class _DirectoryListing:
+    mtime_ns: int
+    file_names: FrozenSet[str]
+    directory_names: FrozenSet[str]
+    is_racy: bool
+
+    @classmethod
+    def scan(cls, path: str, mtime_ns: int) -> "_DirectoryListing":
+        file_names: Set[str] = set()
+        directory_names: Set[str] = set()
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file():
+                            file_names.add(entry.name)
+                        elif entry.is_dir():
+                            directory_names.add(entry.name)
+                    except OSError:
+                        pass
+        except OSError:
+            pass
+        return cls(
+            mtime_ns=mtime_ns,
+            file_names=frozenset(file_names),
+            directory_names=frozenset(directory_names),
+            is_racy=time.time_ns() - mtime_ns < _RACY_MTIME_WINDOW_NS,
+        )
+
+
+_EMPTY_LISTING = _DirectoryListing(
+    mtime_ns=0, file_names=frozenset(), directory_names=frozenset(), is_racy=True
+)
+
+
+class ModuleIndex:
+    """
+    Listings of directories searched for Cairo modules, shared by all compilations in the process.
+    The module reader of cairo-lang checks if a file exists in each include path for every import,
+    while the index resolves modules with lookups in listings of directories read once.
+    Listings are validated against mtimes of their directories once per module reader,
+    as adding, removing or renaming a file changes the mtime of its directory.
+    """
+
+    def __init__(self) -> None:
+        self._listings: Dict[str, _DirectoryListing] = {}
+        self._validated_paths: Set[str] = set()
+
+    def create_module_reader(self, cairo_path: List[str]) -> ModuleReader:
+        self._validated_paths = set()
+        module_reader = get_module_reader(cairo_path=cairo_path)
+        return IndexedModuleReader(
+            paths=module_reader.paths,
+            cairo_suffix=module_reader.cairo_suffix,
+            index=self,
+        )
+
+    def find_module(
+        self, paths: List[str], module_name: str, cairo_suffix: str
+    ) -> Optional[str]:
+        """
+        Returns the same path as `ModuleReader.module_to_file_path`, or None if the module doesn't exist.
+        """
+        *package_path, module_filename = ScopedName.from_string(module_name).path
+        module_filename += cairo_suffix
+        for directory in paths:
+            if self._contains_file(directory, package_path, module_filename):
+                return os.path.join(directory, *package_path, module_filename)
+        return None
+
+    def clear(self) -> None:
+        self._listings = {}
+        self._validated_paths = set()
+
+    def _contains_file(
+        self, directory: str, package_path: List[str], filename: str
+    ) -> bool:
+        listing = self._get_listing(directory)
+        for package_name in package_path:
+            if package_name not in listing.directory_names:
+                return False
+            directory = os.path.join(directory, package_name)
+            listing = self._get_listing(directory)
+        return filename in listing.file_names
+
+    def _get_listing(self, path: str) -> _DirectoryListing:
+        listing = self._listings.get(path)
+        if listing is not None and path in self._validated_paths:
+            return listing
+
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            self._listings.pop(path, None)
+            return _EMPTY_LISTING
+        if listing is None or listing.is_racy or listing.mtime_ns != mtime_ns:
+            listing = _DirectoryListing.scan(path, mtime_ns)
+            self._listings[path] = listing
+        self._validated_paths.add(path)
+        return listing
+
+
+class IndexedModuleReader(ModuleReader):
+    def __init__(self, paths: List[str], cairo_suffix: str, index: ModuleIndex):
+        super().__init__(paths=paths, cairo_suffix=cairo_suffix)
+        self._module_index = index
+
+    def module_to_file_path(
+        self, module_name: str, isfile: Callable[[str], bool] = os.path.isfile
+    ) -> str:
+        filename = self._module_index.find_module(
+            self.paths, module_name, self.cairo_suffix
+        )
+        if filename is None:
+            # Raises the error listing searched paths
+            return super().module_to_file_path(module_name, isfile)
+        return filename
+
+
+module_index = ModuleIndex()
@@ -0,0 +1,79 @@
+import os
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+from starkware.cairo.lang.compiler.module_reader import (
+    ModuleNotFoundException,
+    ModuleReader,
+)
+
+from protostar.utils.module_index import ModuleIndex
+
+OLD_MTIME_NS = 10**18
+
+
+def make_module(path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("func f():\n    return ()\nend\n", "utf-8")
+
+
+def set_old_mtimes(root: Path) -> None:
+    # Listings of directories modified just now are scanned in each compilation
+    for directory, _, _ in os.walk(root):
+        os.utime(directory, ns=(OLD_MTIME_NS, OLD_MTIME_NS))
+
+
+@pytest.fixture(name="include_paths")
+def include_paths_fixture(tmp_path: Path):
+    make_module(tmp_path / "first" / "pkg" / "shared.cairo")
+    make_module(tmp_path / "second" / "pkg" / "shared.cairo")
+    make_module(tmp_path / "second" / "pkg" / "nested" / "only_second.cairo")
+    set_old_mtimes(tmp_path)
+    return [str(tmp_path / "first"), str(tmp_path / "second")]
+
+
+def test_finding_same_files_as_module_reader(include_paths):
+    module_reader = ModuleIndex().create_module_reader(include_paths)
+    cairo_lang_module_reader = ModuleReader(
+        paths=module_reader.paths, cairo_suffix=module_reader.cairo_suffix
+    )
+
+    for module_name in [
+        "pkg.shared",
+        "pkg.nested.only_second",
+        "starkware.cairo.common.math",
+    ]:
+        assert module_reader.module_to_file_path(
+            module_name
+        ) == cairo_lang_module_reader.module_to_file_path(module_name)
+    assert module_reader.module_to_file_path("pkg.shared").startswith(include_paths[0])
+
+
+def test_raising_error_for_missing_modules(include_paths):
+    module_reader = ModuleIndex().create_module_reader(include_paths)
+
+    with pytest.raises(ModuleNotFoundException, match="pkg.missing"):
+        module_reader.read("pkg.missing")
+
+
+def test_listing_unchanged_directories_once(mocker: MockerFixture, include_paths):
+    module_index = ModuleIndex()
+    module_index.create_module_reader(include_paths).read("pkg.nested.only_second")
+    scandir_spy = mocker.spy(os, "scandir")
+
+    module_index.create_module_reader(include_paths).read("pkg.nested.only_second")
+
+    scandir_spy.assert_not_called()
+
+
+def test_finding_modules_added_later(tmp_path: Path, include_paths):
+    module_index = ModuleIndex()
+    with pytest.raises(ModuleNotFoundException):
+        module_index.create_module_reader(include_paths).read("pkg.added")
+
+    make_module(tmp_path / "first" / "pkg" / "added.cairo")
+    os.utime(tmp_path / "first" / "pkg", ns=(OLD_MTIME_NS + 1, OLD_MTIME_NS + 1))
+
+    _, filename = module_index.create_module_reader(include_paths).read("pkg.added")
+    assert filename == str(tmp_path / "first" / "pkg" / "added.cairo")
@@ -4,8 +4,6 @@ from os import listdir
 from pathlib import Path
 from typing import Dict, Optional
 
-from git.repo import Repo
-
 from protostar.protostar_exception import ProtostarException
 
 
@@ -53,6 +51,9 @@ def retrieve_real_package_name(
 
 
 def load_normalized_to_real_name_map(repo_dir: Path, packages_dir: Path):
+    # pylint: disable=import-outside-toplevel
+    from git.repo import Repo
+
     repo = Repo(repo_dir, search_parent_directories=True)
 
     mapping: Dict["str", "str"] = {}
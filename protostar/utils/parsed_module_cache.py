@@ -0,0 +1,125 @@
+import hashlib
+import os
+import pickle
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+from starkware.cairo.lang.compiler.ast.module import CairoFile
+from starkware.cairo.lang.compiler.parser import parse_file
+from starkware.cairo.lang.compiler.parser_transformer import ParserContext
+from starkware.cairo.lang.version import __version__ as cairo_lang_version
+
+PARSED_MODULES_CACHE_DIRNAME = "parsed_modules"
+
+
+def get_parsed_modules_cache_dir() -> Path:
+    """
+    Parsed modules are unpickled, so they are kept in the cache directory of the user,
+    rather than in the project, which can contain files from other people.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    return (
+        (Path(cache_home) if cache_home else Path.home() / ".cache")
+        / "protostar"
+        / PARSED_MODULES_CACHE_DIRNAME
+    )
+
+
+class ParsedModuleCache:
+    """
+    Parsed Cairo files shared by all compilations in the process, keyed by the file path and content hash.
+    ASTs are kept pickled, so each compilation gets its own copy and can't affect other ones.
+    If `disk_cache_dir` is set, parsed files are also saved there to skip parsing them in the next runs.
+    Files on disk are also keyed by the Protostar version, as they are shared by all installations of the user.
+    """
+
+    def __init__(self) -> None:
+        self.disk_cache_dir: Optional[Path] = None
+        self._protostar_version = ""
+        self._pickled_files: Dict[str, bytes] = {}
+
+    def parse_file(
+        self,
+        code: str,
+        filename: str = "<string>",
+        parser_context: Optional[ParserContext] = None,
+    ) -> CairoFile:
+        if parser_context is not None:
+            return parse_file(code, filename, parser_context)
+
+        key = self._get_key(code, filename)
+        pickled_file = self._pickled_files.get(key) or self._load_from_disk(key)
+        if pickled_file is not None:
+            try:
+                cached_file = pickle.loads(pickled_file)
+                self._pickled_files[key] = pickled_file
+                return cached_file
+            except Exception:  # pylint: disable=broad-except
+                # A corrupted file only results in parsing the module again
+                pass
+
+        parsed_file = parse_file(code, filename)
+        try:
+            pickled_file = pickle.dumps(parsed_file)
+        except (pickle.PicklingError, TypeError, AttributeError, RecursionError):
+            return parsed_file
+        self._pickled_files[key] = pickled_file
+        self._save_to_disk(key, pickled_file)
+        return parsed_file
+
+    @contextmanager
+    def use_disk_cache(
+        self, disk_cache_dir: Path, protostar_version: str
+    ) -> Iterator[None]:
+        previous_disk_cache_dir = self.disk_cache_dir
+        previous_protostar_version = self._protostar_version
+        self.disk_cache_dir = disk_cache_dir
+        self._protostar_version = protostar_version
+        try:
+            yield
+        finally:
+            self.disk_cache_dir = previous_disk_cache_dir
+            self._protostar_version = previous_protostar_version
+
+    def clear(self) -> None:
+        self._pickled_files = {}
+
+    @staticmethod
+    def _get_key(code: str, filename: str) -> str:
+        return hashlib.sha256(
+            "\0".join([cairo_lang_version, filename, code]).encode("utf-8")
+        ).hexdigest()
+
+    def _get_disk_cache_path(self, key: str) -> Optional[Path]:
+        if self.disk_cache_dir is None:
+            return None
+        disk_key = hashlib.sha256(
+            "\0".join([self._protostar_version, key]).encode("utf-8")
+        ).hexdigest()
+        return self.disk_cache_dir / f"{disk_key}.pickle"
+
+    def _load_from_disk(self, key: str) -> Optional[bytes]:
+        path = self._get_disk_cache_path(key)
+        if path is None:
+            return None
+        try:
+            return path.read_bytes()
+        except OSError:
+            return None
+
+    def _save_to_disk(self, key: str, pickled_file: bytes) -> None:
+        path = self._get_disk_cache_path(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            # Many processes can save the same module at once
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(pickled_file)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+
+parsed_module_cache = ParsedModuleCache()
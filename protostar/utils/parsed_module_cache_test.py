@@ -0,0 +1,100 @@
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+from starkware.cairo.lang.compiler.parser import parse_file
+
+from protostar.utils.parsed_module_cache import (
+    ParsedModuleCache,
+    get_parsed_modules_cache_dir,
+)
+
+PROTOSTAR_VERSION = "0.4.0"
+
+CODE = """
+func add(a: felt, b: felt) -> (res: felt):
+    return (a + b)
+end
+"""
+
+
+def spy_parse_file(mocker: MockerFixture):
+    return mocker.patch(
+        "protostar.utils.parsed_module_cache.parse_file", side_effect=parse_file
+    )
+
+
+def test_parsing_file_once(mocker: MockerFixture):
+    parse_file_mock = spy_parse_file(mocker)
+    cache = ParsedModuleCache()
+
+    first_result = cache.parse_file(CODE, "add.cairo")
+    second_result = cache.parse_file(CODE, "add.cairo")
+
+    assert parse_file_mock.call_count == 1
+    assert first_result.format() == second_result.format()
+    assert first_result is not second_result
+
+
+def test_parsing_changed_file_again(mocker: MockerFixture):
+    parse_file_mock = spy_parse_file(mocker)
+    cache = ParsedModuleCache()
+
+    cache.parse_file(CODE, "add.cairo")
+    cache.parse_file(CODE + "\n", "add.cairo")
+    cache.parse_file(CODE, "other.cairo")
+
+    assert parse_file_mock.call_count == 3
+
+
+def test_reusing_parsed_files_from_disk(mocker: MockerFixture, tmp_path: Path):
+    parse_file_mock = spy_parse_file(mocker)
+    first_cache = ParsedModuleCache()
+    second_cache = ParsedModuleCache()
+
+    with first_cache.use_disk_cache(tmp_path, PROTOSTAR_VERSION):
+        first_result = first_cache.parse_file(CODE, "add.cairo")
+    with second_cache.use_disk_cache(tmp_path, PROTOSTAR_VERSION):
+        second_result = second_cache.parse_file(CODE, "add.cairo")
+
+    assert parse_file_mock.call_count == 1
+    assert first_result.format() == second_result.format()
+    assert first_cache.disk_cache_dir is None
+
+
+def test_ignoring_corrupted_files_on_disk(mocker: MockerFixture, tmp_path: Path):
+    parse_file_mock = spy_parse_file(mocker)
+    first_cache = ParsedModuleCache()
+    with first_cache.use_disk_cache(tmp_path, PROTOSTAR_VERSION):
+        first_cache.parse_file(CODE, "add.cairo")
+    for path in tmp_path.iterdir():
+        path.write_bytes(b"corrupted")
+
+    second_cache = ParsedModuleCache()
+    with second_cache.use_disk_cache(tmp_path, PROTOSTAR_VERSION):
+        second_cache.parse_file(CODE, "add.cairo")
+
+    assert parse_file_mock.call_count == 2
+
+
+def test_parsing_files_from_other_protostar_versions_again(
+    mocker: MockerFixture, tmp_path: Path
+):
+    parse_file_mock = spy_parse_file(mocker)
+    first_cache = ParsedModuleCache()
+    with first_cache.use_disk_cache(tmp_path, "0.4.0"):
+        first_cache.parse_file(CODE, "add.cairo")
+
+    second_cache = ParsedModuleCache()
+    with second_cache.use_disk_cache(tmp_path, "0.4.1"):
+        second_cache.parse_file(CODE, "add.cairo")
+
+    assert parse_file_mock.call_count == 2
+
+
+def test_keeping_parsed_files_in_user_cache_dir(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    assert get_parsed_modules_cache_dir() == tmp_path / "protostar" / "parsed_modules"
@@ -1,10 +1,13 @@
+import json
+import os
 import re
+import shutil
+import subprocess
 from logging import getLogger
 from pathlib import Path
 from typing import List, Optional, Union
 
 import tomli
-from git.cmd import Git
 from packaging import version
 from packaging.version import LegacyVersion
 from packaging.version import Version as PackagingVersion
@@ -32,6 +35,8 @@ class ProtostarDirectory:
 
 VersionType = Union[LegacyVersion, PackagingVersion]
 
+GIT_VERSION_CACHE_FILENAME = "git_version_cache.json"
+
 
 class VersionManager:
     @staticmethod
@@ -79,14 +84,57 @@ class VersionManager:
 
     @property
     def git_version(self) -> Optional[VersionType]:
-        output = Git().execute(["git", "--version"])
-        # pylint: disable=unidiomatic-typecheck
-        if type(output) is str:
+        output = self._get_git_version_output()
+        if output:
             result = re.search(r"\d*\.\d*.\d*", output)
             if result:
                 return version.parse(result.group())
         return None
 
+    def _get_git_version_output(self) -> Optional[str]:
+        """
+        `git --version` is checked on each run, so its output is cached until the git executable changes.
+        """
+        git_executable = shutil.which("git")
+        if git_executable is None:
+            return None
+        git_executable = os.path.realpath(git_executable)
+        git_executable_stat = os.stat(git_executable)
+        cache_key = [
+            git_executable,
+            git_executable_stat.st_mtime_ns,
+            git_executable_stat.st_size,
+        ]
+        cache_path = (
+            self._protostar_directory.directory_root_path / GIT_VERSION_CACHE_FILENAME
+        )
+
+        try:
+            with open(cache_path, "r", encoding="utf-8") as cache_file:
+                cache = json.load(cache_file)
+            if cache["key"] == cache_key:
+                return cache["output"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        try:
+            output = subprocess.run(
+                [git_executable, "--version"],
+                capture_output=True,
+                check=True,
+                encoding="utf-8",
+            ).stdout
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+        try:
+            with open(cache_path, "w", encoding="utf-8") as cache_file:
+                json.dump({"key": cache_key, "output": output}, cache_file)
+        except OSError:
+            # A read-only installation only results in running `git --version` each time
+            pass
+        return output
+
     def print_current_version(self) -> None:
         print(f"Protostar version: {self.protostar_version or 'unknown'}")
         print(f"Cairo-lang version: {self.cairo_version or 'unknown'}")
@@ -1,8 +1,13 @@
 from pathlib import Path
 
 import pytest
+from pytest_mock import MockerFixture
 
-from protostar.utils.protostar_directory import ProtostarDirectory
+from protostar.utils.protostar_directory import (
+    GIT_VERSION_CACHE_FILENAME,
+    ProtostarDirectory,
+    VersionManager,
+)
 
 
 @pytest.fixture(name="script_root")
@@ -29,3 +34,20 @@ def test_injecting_cairo_dir(script_root: Path):
     cairo_paths = protostar_directory.add_protostar_cairo_dir([foo_path])
 
     assert Path(script_root / "cairo") in cairo_paths
+
+
+def test_caching_git_version(tmpdir: str, mocker: MockerFixture):
+    script_root = Path(tmpdir) / "dist" / "protostar"
+    run_mock = mocker.patch(
+        "protostar.utils.protostar_directory.subprocess.run",
+        return_value=mocker.MagicMock(stdout="git version 2.35.1\n"),
+    )
+
+    assert VersionManager(ProtostarDirectory(script_root)).git_version == (
+        VersionManager.parse("2.35.1")
+    )
+    assert VersionManager(ProtostarDirectory(script_root)).git_version == (
+        VersionManager.parse("2.35.1")
+    )
+    run_mock.assert_called_once()
+    assert (Path(tmpdir) / GIT_VERSION_CACHE_FILENAME).exists()
@@ -0,0 +1,102 @@
+import cProfile
+import os
+import pstats
+import re
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+from protostar.cli.command import Command
+
+PROFILE_PYTHON_ARG = Command.Argument(
+    name="profile-python",
+    description=(
+        "Profile Protostar with cProfile and save the results to the given directory: "
+        "a `.pstats` file per process, and `combined.pstats` with `combined.txt` merging all of them."
+    ),
+    type="path",
+)
+
+COMBINED_PROFILE_NAME = "combined"
+PROCESS_PROFILE_NAME_REGEX = re.compile(r".+-\d+")
+
+
+class PythonProfiler:
+    """
+    Profiles the current process and saves stats to `<output_dir>/<process_name>-<pid>.pstats`.
+    Stats can be saved many times, e.g. after each task of a pool worker, which is terminated without cleanup.
+    """
+
+    def __init__(self, output_dir: Path, process_name: str) -> None:
+        self._output_dir = output_dir
+        self._process_name = process_name
+        self._profile = cProfile.Profile()
+
+    @property
+    def output_path(self) -> Path:
+        return self._output_dir / f"{self._process_name}-{os.getpid()}.pstats"
+
+    def start(self) -> None:
+        self._profile.enable()
+
+    def stop(self) -> None:
+        self._profile.disable()
+
+    def save(self) -> None:
+        self._output_dir.mkdir(parents=True, exist_ok=True)
+        # A worker killed while saving doesn't leave partially written stats
+        output_path = self.output_path
+        tmp_path = output_path.with_name(f"{output_path.name}.tmp")
+        self._profile.dump_stats(str(tmp_path))
+        os.replace(tmp_path, output_path)
+
+
+def remove_python_profiles(output_dir: Path) -> None:
+    for path in _find_process_profiles(output_dir):
+        path.unlink()
+
+
+def merge_python_profiles(output_dir: Path, lines_count: int = 50) -> Path:
+    """
+    Merges stats of all processes and writes them, sorted by the cumulative time, to a text report.
+    """
+    stats = pstats.Stats(*[str(path) for path in _find_process_profiles(output_dir)])
+    stats.dump_stats(str(output_dir / f"{COMBINED_PROFILE_NAME}.pstats"))
+
+    report_path = output_dir / f"{COMBINED_PROFILE_NAME}.txt"
+    with open(report_path, "w", encoding="utf-8") as report_file:
+        stats.stream = report_file  # type: ignore
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(lines_count)
+    return report_path
+
+
+@contextmanager
+def profile_python(
+    output_dir: Optional[Path], process_name: str = "main"
+) -> Iterator[None]:
+    """
+    Profiles the wrapped code, if `output_dir` is provided, and merges its stats
+    with stats saved by other processes, e.g. test runner workers, in the meantime.
+    """
+    if output_dir is None:
+        yield
+        return
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    remove_python_profiles(output_dir)
+    profiler = PythonProfiler(output_dir, process_name)
+    profiler.start()
+    try:
+        yield
+    finally:
+        profiler.stop()
+        profiler.save()
+        merge_python_profiles(output_dir)
+
+
+def _find_process_profiles(output_dir: Path) -> List[Path]:
+    return sorted(
+        path
+        for path in output_dir.glob("*.pstats")
+        if PROCESS_PROFILE_NAME_REGEX.fullmatch(path.stem)
+    )
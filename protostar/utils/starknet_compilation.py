@@ -1,9 +1,8 @@
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, List
+from typing import Any, Callable, List, Optional, Sequence, Tuple
 
 from starkware.cairo.lang.cairo_constants import DEFAULT_PRIME
-from starkware.cairo.lang.compiler.cairo_compile import get_module_reader
 from starkware.cairo.lang.compiler.constants import MAIN_SCOPE
 from starkware.cairo.lang.compiler.identifier_manager import IdentifierManager
 from starkware.cairo.lang.compiler.preprocessor.pass_manager import (
@@ -18,6 +17,8 @@ from starkware.starknet.compiler.starknet_preprocessor import (
 from starkware.starknet.services.api.contract_class import ContractClass
 
 from protostar.protostar_exception import ProtostarException
+from protostar.utils.compile_daemon_client import compile_daemon_client
+from protostar.utils.module_index import module_index
 
 
 @dataclass
@@ -27,9 +28,19 @@ class StarknetCompiler:
 
     include_paths: List[str]
     disable_hint_validation: bool
+    use_compile_daemon: bool = True
+
+    def get_starknet_pass_manager(
+        self, on_module_read: Optional[Callable[[str], None]] = None
+    ) -> PassManager:
+        module_reader = module_index.create_module_reader(self.include_paths)
+
+        def read_module(module_name: str) -> Tuple[str, str]:
+            code, path = module_reader.read(module_name)
+            if on_module_read:
+                on_module_read(path)
+            return code, path
 
-    def get_starknet_pass_manager(self) -> PassManager:
-        read_module = get_module_reader(cairo_path=self.include_paths).read
         return starknet_pass_manager(
             DEFAULT_PRIME,
             read_module,
@@ -37,9 +48,25 @@ class StarknetCompiler:
         )
 
     def preprocess_contract(
-        self, *cairo_file_paths: Path
+        self,
+        *cairo_file_paths: Path,
+        on_module_read: Optional[Callable[[str], None]] = None,
+    ) -> StarknetPreprocessedProgram:
+        preprocessed = self._request_compile_daemon(
+            "preprocess_contract", cairo_file_paths, on_module_read
+        )
+        if isinstance(preprocessed, StarknetPreprocessedProgram):
+            return preprocessed
+        return self._preprocess_contract(
+            *cairo_file_paths, on_module_read=on_module_read
+        )
+
+    def _preprocess_contract(
+        self,
+        *cairo_file_paths: Path,
+        on_module_read: Optional[Callable[[str], None]] = None,
     ) -> StarknetPreprocessedProgram:
-        pass_manager = self.get_starknet_pass_manager()
+        pass_manager = self.get_starknet_pass_manager(on_module_read)
 
         try:
             codes = [
@@ -60,6 +87,33 @@ class StarknetCompiler:
                 message=(f"Couldn't find file '{err.filename}'")
             ) from err
 
+    def get_imported_module_paths(self, *cairo_file_paths: Path) -> List[str]:
+        """
+        Returns paths of modules imported by the given files, directly or transitively.
+        Only the first stage of the compilation, which reads and parses modules, is run.
+        """
+        imported_module_paths: List[str] = []
+        pass_manager = self.get_starknet_pass_manager(imported_module_paths.append)
+        try:
+            context = PassManagerContext(
+                start_codes=[],
+                codes=[
+                    (cairo_file_path.read_text("utf-8"), str(cairo_file_path))
+                    for cairo_file_path in cairo_file_paths
+                ],
+                main_scope=MAIN_SCOPE,
+                identifiers=IdentifierManager(),
+            )
+            _, module_collector = pass_manager.stages[
+                pass_manager.get_stage_index("module_collector")
+            ]
+            module_collector.run(context)
+        except FileNotFoundError as err:
+            raise StarknetCompiler.FileNotFoundException(
+                message=(f"Couldn't find file '{err.filename}'")
+            ) from err
+        return imported_module_paths
+
     @staticmethod
     def compile_preprocessed_contract(
         preprocessed: StarknetPreprocessedProgram, add_debug_info: bool = False
@@ -76,12 +130,45 @@ class StarknetCompiler:
         return assembled
 
     def compile_contract(
-        self, *sources: Path, add_debug_info: bool = False
+        self,
+        *sources: Path,
+        add_debug_info: bool = False,
+        on_module_read: Optional[Callable[[str], None]] = None,
     ) -> ContractClass:
-        preprocessed = self.preprocess_contract(*sources)
+        compiled = self._request_compile_daemon(
+            "compile_contract", sources, on_module_read, add_debug_info=add_debug_info
+        )
+        if isinstance(compiled, ContractClass):
+            return compiled
+        preprocessed = self._preprocess_contract(
+            *sources, on_module_read=on_module_read
+        )
         assembled = self.compile_preprocessed_contract(preprocessed, add_debug_info)
         return assembled
 
+    def _request_compile_daemon(
+        self,
+        method: str,
+        sources: Sequence[Path],
+        on_module_read: Optional[Callable[[str], None]],
+        **kwargs: Any,
+    ) -> Any:
+        if not self.use_compile_daemon:
+            return None
+        response = compile_daemon_client.request(
+            method,
+            sources=[str(source) for source in sources],
+            include_paths=self.include_paths,
+            disable_hint_validation=self.disable_hint_validation,
+            **kwargs,
+        )
+        if response is None:
+            return None
+        if on_module_read:
+            for module_path in response.imported_module_paths:
+                on_module_read(module_path)
+        return response.result
+
     @staticmethod
     def get_function_names(
         preprocessed: StarknetPreprocessedProgram, predicate: Callable[[str], bool]
@@ -0,0 +1,32 @@
+from pathlib import Path
+
+import pytest
+
+from protostar.utils.starknet_compilation import StarknetCompiler
+
+
+def test_getting_imported_module_paths(tmp_path: Path):
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "nested.cairo").write_text(
+        "func g():\n    return ()\nend\n", "utf-8"
+    )
+    (tmp_path / "pkg" / "lib.cairo").write_text("from pkg.nested import g\n", "utf-8")
+    contract_path = tmp_path / "main.cairo"
+    contract_path.write_text("%lang starknet\nfrom pkg.lib import g\n", "utf-8")
+
+    imported_module_paths = StarknetCompiler(
+        include_paths=[str(tmp_path)],
+        disable_hint_validation=True,
+        use_compile_daemon=False,
+    ).get_imported_module_paths(contract_path)
+
+    assert str(tmp_path / "pkg" / "lib.cairo") in imported_module_paths
+    assert str(tmp_path / "pkg" / "nested.cairo") in imported_module_paths
+    assert str(contract_path) not in imported_module_paths
+
+
+def test_raising_error_for_missing_files(tmp_path: Path):
+    with pytest.raises(StarknetCompiler.FileNotFoundException):
+        StarknetCompiler(
+            include_paths=[], disable_hint_validation=True, use_compile_daemon=False
+        ).get_imported_module_paths(tmp_path / "missing.cairo")
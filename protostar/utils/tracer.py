@@ -0,0 +1,117 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from time import time
+from typing import Any, Dict, Iterator, List, Optional
+
+TraceEvent = Dict[str, Any]
+
+
+class Tracer:
+    """
+    Records spans in the Chrome trace event format (https://ui.perfetto.dev, chrome://tracing).
+    Each process records its own spans; child processes save them to `parts_dir`,
+    and the main process merges them into a single file with a track per process.
+    """
+
+    def __init__(self) -> None:
+        self.parts_dir: Optional[Path] = None
+        self._events: List[TraceEvent] = []
+
+    @property
+    def is_enabled(self) -> bool:
+        return self.parts_dir is not None
+
+    def start(self, parts_dir: Path, process_name: str) -> None:
+        self.parts_dir = parts_dir
+        self._events = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": os.getpid(),
+                "args": {"name": f"{process_name} ({os.getpid()})"},
+            }
+        ]
+
+    def stop(self) -> None:
+        self.parts_dir = None
+        self._events = []
+
+    @contextmanager
+    def span(self, name: str, **args: Any) -> Iterator[None]:
+        if not self.is_enabled:
+            yield
+            return
+        start_time = time()
+        try:
+            yield
+        finally:
+            self.add_span(name, start_time, time(), **args)
+
+    def add_span(
+        self, name: str, start_time: float, end_time: float, **args: Any
+    ) -> None:
+        if not self.is_enabled:
+            return
+        self._events.append(
+            {
+                "name": name,
+                "ph": "X",
+                "ts": start_time * 1e6,
+                "dur": (end_time - start_time) * 1e6,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": args,
+            }
+        )
+
+    def save_part(self) -> None:
+        """
+        Saves spans recorded so far. Pool workers call it after each task, as they are terminated without cleanup.
+        """
+        if self.parts_dir is None:
+            return
+        # A worker killed while saving doesn't leave a partially written part
+        part_path = self.parts_dir / f"{os.getpid()}.json"
+        tmp_path = part_path.with_name(f"{part_path.name}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(self._events, file)
+        os.replace(tmp_path, part_path)
+
+    def save(self, path: Path) -> None:
+        assert self.parts_dir is not None, "Tracer isn't started"
+        self.save_part()
+        events: List[TraceEvent] = []
+        for part_path in sorted(self.parts_dir.glob("*.json")):
+            with open(part_path, "r", encoding="utf-8") as file:
+                events.extend(json.load(file))
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
+
+
+tracer = Tracer()
+
+
+@contextmanager
+def trace(output_path: Optional[Path]) -> Iterator[None]:
+    """
+    Records spans of the main process and its workers, if `output_path` is provided.
+    """
+    if output_path is None:
+        yield
+        return
+
+    parts_dir = Path(tempfile.mkdtemp(prefix="protostar-trace-"))
+    tracer.start(parts_dir, "main")
+    try:
+        yield
+    finally:
+        tracer.save(output_path)
+        tracer.stop()
+        shutil.rmtree(parts_dir, ignore_errors=True)
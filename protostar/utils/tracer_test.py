@@ -0,0 +1,26 @@
+import json
+from pathlib import Path
+
+from protostar.utils.tracer import Tracer
+
+
+def test_saving_parts_and_merging_them(tmp_path: Path):
+    parts_dir = tmp_path / "parts"
+    parts_dir.mkdir()
+    tracer = Tracer()
+    tracer.start(parts_dir, "main")
+    with tracer.span("first"):
+        pass
+    tracer.save_part()
+    with tracer.span("second"):
+        pass
+
+    tracer.save(tmp_path / "trace.json")
+
+    assert not list(parts_dir.glob("*.tmp"))
+    trace = json.loads((tmp_path / "trace.json").read_text("utf-8"))
+    assert [event["name"] for event in trace["traceEvents"]] == [
+        "process_name",
+        "first",
+        "second",
+    ]
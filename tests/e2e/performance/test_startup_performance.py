@@ -0,0 +1,36 @@
+import statistics
+import time
+from os import path
+from subprocess import DEVNULL, run
+from typing import List
+
+import pytest
+
+from tests.e2e.conftest import ACTUAL_CWD
+
+# Commands load cairo-lang and GitPython only when they are run, so showing the version or the help
+# should take a fraction of the time needed to compile anything
+STARTUP_TIME_BUDGET = 1.0
+MEASUREMENTS_COUNT = 5
+
+
+def measure_startup_time(args: List[str]) -> float:
+    protostar_path = path.join(ACTUAL_CWD, "dist", "protostar", "protostar")
+    # The first run after a build is slower, as the OS has to load the binary from the disk
+    run([protostar_path, *args], stdout=DEVNULL, check=True)
+
+    durations: List[float] = []
+    for _ in range(MEASUREMENTS_COUNT):
+        start_time = time.perf_counter()
+        run([protostar_path, *args], stdout=DEVNULL, check=True)
+        durations.append(time.perf_counter() - start_time)
+    return statistics.median(durations)
+
+
+@pytest.mark.parametrize("args", [["--version"], ["--help"], ["build", "--help"]])
+def test_startup_time(args: List[str]):
+    startup_time = measure_startup_time(args)
+
+    assert (
+        startup_time < STARTUP_TIME_BUDGET
+    ), f"`protostar {' '.join(args)}` took {startup_time:.2f}s"
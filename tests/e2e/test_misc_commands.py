@@ -31,6 +31,7 @@ def test_init(project_name: str):
 
     assert "protostar.toml" in dirs
     assert ".git" in dirs
+    assert ".gitignore" in dirs
 
 
 def test_init_existing():
@@ -1,3 +1,4 @@
+import json
 import shutil
 from subprocess import CalledProcessError
 
@@ -12,6 +13,23 @@ def test_basic_contract(protostar):
     assert "1 passed" in result
 
 
+@pytest.mark.usefixtures("init")
+def test_listing_test_cases_as_json(protostar):
+    result = protostar(["test", "--collect-only", "--json", "tests"])
+
+    listing = json.loads(result[result.index("{") :])
+    assert listing["test_suites"] == [
+        {
+            "path": "tests/test_main.cairo",
+            "test_cases": [
+                "test_increase_balance",
+                "test_cannot_increase_balance_with_negative_value",
+            ],
+            "setup_hook": None,
+        }
+    ]
+
+
 @pytest.mark.usefixtures("init")
 def test_complex(protostar, copy_fixture):
     copy_fixture("basic.cairo", "./src")
@@ -0,0 +1,22 @@
+%lang starknet
+
+@contract_interface
+namespace BasicContract:
+    func increase_balance(amount : felt):
+    end
+end
+
+func add(a : felt, b : felt) -> (res : felt):
+    return (a + b)
+end
+
+@external
+func test_profiled{syscall_ptr : felt*, range_check_ptr}():
+    alloc_locals
+    local contract_address : felt
+    %{ ids.contract_address = deploy_contract("./tests/integration/cairo_profiler/basic_contract.cairo").contract_address %}
+    let (res) = add(1, 2)
+    assert res = 3
+    BasicContract.increase_balance(contract_address, res)
+    return ()
+end
@@ -0,0 +1,49 @@
+from pathlib import Path
+
+import pytest
+
+from protostar.commands.test.cairo_profiler import get_cairo_profile_path
+from protostar.commands.test.test_command import TestCommand
+from tests.integration.conftest import assert_cairo_test_cases
+
+
+@pytest.mark.asyncio
+async def test_cairo_profiler(mocker, tmp_path: Path):
+    test_suite_path = Path(__file__).parent / "cairo_profiler_test.cairo"
+
+    testing_summary = await TestCommand(
+        project=mocker.MagicMock(),
+        protostar_directory=mocker.MagicMock(),
+    ).test(
+        targets=[str(test_suite_path)],
+        lazy_debug_info=False,
+        cairo_profile_dir=tmp_path,
+    )
+
+    assert_cairo_test_cases(
+        testing_summary,
+        expected_passed_test_cases_names=["test_profiled"],
+        expected_failed_test_cases_names=[],
+    )
+    folded_stacks = (
+        get_cairo_profile_path(tmp_path, test_suite_path, "test_profiled")
+        .read_text()
+        .splitlines()
+    )
+    stacks = [line.rsplit(" ", 1)[0].split(";") for line in folded_stacks]
+    assert all(int(line.rsplit(" ", 1)[1]) > 0 for line in folded_stacks)
+    # Entry points start in wrappers generated for external functions
+    assert all(stack[0].startswith("__wrappers__.test_profiled") for stack in stacks)
+    assert not any(frame.startswith("pc=") for stack in stacks for frame in stack)
+    assert any(
+        len(stack) > 1
+        and stack[1].startswith("__main__.test_profiled")
+        and stack[-1].startswith("__main__.add")
+        for stack in stacks
+    )
+    assert any(
+        len(stack) > 1
+        and stack[1].startswith("__main__.test_profiled")
+        and any(frame.startswith("__main__.increase_balance") for frame in stack)
+        for stack in stacks
+    )
@@ -0,0 +1,22 @@
+%lang starknet
+
+from starkware.cairo.common.cairo_builtins import HashBuiltin
+
+@storage_var
+func balance(account : felt) -> (res : felt):
+end
+
+@external
+func increase_balance{syscall_ptr : felt*, pedersen_ptr : HashBuiltin*, range_check_ptr}(
+        account : felt, amount : felt):
+    let (res) = balance.read(account)
+    balance.write(account, res + amount)
+    return ()
+end
+
+@view
+func get_balance{syscall_ptr : felt*, pedersen_ptr : HashBuiltin*, range_check_ptr}(
+        account : felt) -> (res : felt):
+    let (res) = balance.read(account)
+    return (res)
+end
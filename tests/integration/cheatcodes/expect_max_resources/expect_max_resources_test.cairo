@@ -0,0 +1,62 @@
+%lang starknet
+
+@contract_interface
+namespace BasicContract:
+    func increase_balance(account : felt, amount : felt):
+    end
+end
+
+func deploy_basic_contract() -> (contract_address : felt):
+    alloc_locals
+    local contract_address : felt
+    %{ ids.contract_address = deploy_contract("./tests/integration/cheatcodes/expect_max_resources/basic_contract.cairo").contract_address %}
+    return (contract_address)
+end
+
+@external
+func test_call_within_budget{syscall_ptr : felt*, range_check_ptr}():
+    let (contract_address) = deploy_basic_contract()
+    %{ expect_max_resources(steps=1000, builtins={"pedersen": 10}) %}
+    BasicContract.increase_balance(contract_address, 1, 5)
+    return ()
+end
+
+@external
+func test_call_exceeding_steps{syscall_ptr : felt*, range_check_ptr}():
+    let (contract_address) = deploy_basic_contract()
+    BasicContract.increase_balance(contract_address, 1, 5)
+    %{ expect_max_resources(steps=1) %}
+    BasicContract.increase_balance(contract_address, 1, 5)
+    return ()
+end
+
+@external
+func test_call_exceeding_builtins{syscall_ptr : felt*, range_check_ptr}():
+    let (contract_address) = deploy_basic_contract()
+    %{ expect_max_resources(builtins={"pedersen_builtin": 0}) %}
+    BasicContract.increase_balance(contract_address, 1, 5)
+    return ()
+end
+
+@external
+func test_missing_call{syscall_ptr : felt*, range_check_ptr}():
+    %{ expect_max_resources(steps=1000) %}
+    return ()
+end
+
+@external
+func test_test_case_within_budget{syscall_ptr : felt*, range_check_ptr}():
+    %{ expect_max_resources(steps=1000, scope="test_case") %}
+    let (contract_address) = deploy_basic_contract()
+    BasicContract.increase_balance(contract_address, 1, 5)
+    BasicContract.increase_balance(contract_address, 1, 5)
+    return ()
+end
+
+@external
+func test_test_case_exceeding_steps{syscall_ptr : felt*, range_check_ptr}():
+    %{ expect_max_resources(steps=1, scope="test_case") %}
+    let (contract_address) = deploy_basic_contract()
+    BasicContract.increase_balance(contract_address, 1, 5)
+    return ()
+end
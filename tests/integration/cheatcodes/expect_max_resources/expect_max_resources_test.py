@@ -0,0 +1,35 @@
+from pathlib import Path
+
+import pytest
+
+from protostar.commands.test.test_command import TestCommand
+from tests.integration.conftest import assert_cairo_test_cases
+
+
+@pytest.mark.asyncio
+async def test_expect_max_resources_cheatcode(mocker):
+    testing_summary = await TestCommand(
+        project=mocker.MagicMock(),
+        protostar_directory=mocker.MagicMock(),
+    ).test(targets=[f"{Path(__file__).parent}/expect_max_resources_test.cairo"])
+
+    assert_cairo_test_cases(
+        testing_summary,
+        expected_passed_test_cases_names=[
+            "test_call_within_budget",
+            "test_test_case_within_budget",
+        ],
+        expected_failed_test_cases_names=[
+            "test_call_exceeding_steps",
+            "test_call_exceeding_builtins",
+            "test_missing_call",
+            "test_test_case_exceeding_steps",
+        ],
+    )
+    failed_test_cases = {
+        failed_test_case.test_case_name: failed_test_case
+        for failed_test_case in testing_summary.failed
+    }
+    assert "pedersen_builtin: used 2, allowed 0" in str(
+        failed_test_cases["test_call_exceeding_builtins"].exception
+    )
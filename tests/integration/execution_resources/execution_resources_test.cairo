@@ -0,0 +1,20 @@
+%lang starknet
+
+@contract_interface
+namespace ProxyContract:
+    func increase_balance(basic_contract_address : felt, amount : felt):
+    end
+end
+
+@external
+func test_nested_call{syscall_ptr : felt*, range_check_ptr}():
+    alloc_locals
+    local basic_contract_address : felt
+    local proxy_contract_address : felt
+    %{
+        ids.basic_contract_address = deploy_contract("./tests/integration/execution_resources/basic_contract.cairo").contract_address
+        ids.proxy_contract_address = deploy_contract("./tests/integration/execution_resources/proxy_contract.cairo").contract_address
+    %}
+    ProxyContract.increase_balance(proxy_contract_address, basic_contract_address, 5)
+    return ()
+end
@@ -0,0 +1,23 @@
+from pathlib import Path
+
+import pytest
+
+from protostar.commands.test.test_command import TestCommand
+from tests.integration.conftest import assert_cairo_test_cases
+
+
+@pytest.mark.asyncio
+async def test_counting_resources_of_nested_calls_once(mocker):
+    testing_summary = await TestCommand(
+        project=mocker.MagicMock(),
+        protostar_directory=mocker.MagicMock(),
+    ).test(targets=[f"{Path(__file__).parent}/execution_resources_test.cairo"])
+
+    assert_cairo_test_cases(
+        testing_summary,
+        expected_passed_test_cases_names=["test_nested_call"],
+        expected_failed_test_cases_names=[],
+    )
+    execution_resources = testing_summary.passed[0].execution_resources
+    assert execution_resources is not None
+    assert execution_resources.n_steps == 155
@@ -0,0 +1,14 @@
+%lang starknet
+
+@contract_interface
+namespace BasicContract:
+    func increase_balance(amount : felt):
+    end
+end
+
+@external
+func increase_balance{syscall_ptr : felt*, range_check_ptr}(
+        basic_contract_address : felt, amount : felt):
+    BasicContract.increase_balance(basic_contract_address, amount)
+    return ()
+end
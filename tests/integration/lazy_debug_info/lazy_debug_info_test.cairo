@@ -0,0 +1,18 @@
+%lang starknet
+
+func check_value(value : felt):
+    assert value = 42
+    return ()
+end
+
+@external
+func test_passing():
+    check_value(42)
+    return ()
+end
+
+@external
+func test_failing():
+    check_value(41)
+    return ()
+end
@@ -0,0 +1,45 @@
+import queue
+from pathlib import Path
+from typing import List
+
+import pytest
+from pytest_mock import MockerFixture
+
+from protostar.commands.test.test_cases import (
+    FailedTestCase,
+    PassedTestCase,
+    TestCaseResult,
+)
+from protostar.commands.test.test_results_queue import TestResultsQueue
+from protostar.commands.test.test_runner import TestRunner
+from protostar.commands.test.test_suite import TestSuite
+from protostar.utils.starknet_compilation import StarknetCompiler
+
+TEST_SUITE_PATH = Path(__file__).parent / "lazy_debug_info_test.cairo"
+
+
+@pytest.mark.asyncio
+async def test_rerunning_failed_test_cases_with_debug_info(mocker: MockerFixture):
+    compile_spy = mocker.spy(StarknetCompiler, "compile_preprocessed_contract")
+    test_results_queue = TestResultsQueue(queue.Queue())
+
+    # The runner is used without worker processes, so its compilations can be spied on
+    await TestRunner(queue=test_results_queue, lazy_debug_info=True).run_test_suite(
+        TestSuite(
+            test_path=TEST_SUITE_PATH,
+            test_case_names=["test_passing", "test_failing"],
+        )
+    )
+    test_results_queue.flush()
+    results: List[TestCaseResult] = [test_results_queue.get() for _ in range(2)]
+
+    assert [call.kwargs["add_debug_info"] for call in compile_spy.call_args_list] == [
+        False,
+        True,
+    ]
+    passed_test_case, failed_test_case = results
+    assert isinstance(passed_test_case, PassedTestCase)
+    assert isinstance(failed_test_case, FailedTestCase)
+    error_message = str(failed_test_case.exception)
+    assert f"{TEST_SUITE_PATH}:4:5" in error_message
+    assert "assert value = 42" in error_message
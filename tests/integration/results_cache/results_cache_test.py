@@ -0,0 +1,91 @@
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from protostar.commands.test.test_cases import CachedTestCase
+from protostar.commands.test.test_command import TestCommand
+from protostar.commands.test.testing_summary import TestingSummary
+
+LIB_CODE = """
+func get_amount() -> (amount : felt):
+    return (AMOUNT)
+end
+"""
+
+CONTRACT_CODE = """
+%lang starknet
+from lib import get_amount
+
+@view
+func get_value() -> (value : felt):
+    let (amount) = get_amount()
+    return (amount)
+end
+"""
+
+TEST_SUITE_CODE = """
+%lang starknet
+
+@contract_interface
+namespace Contract:
+    func get_value() -> (value : felt):
+    end
+end
+
+@external
+func test_deployed_contract{syscall_ptr : felt*, range_check_ptr}():
+    alloc_locals
+    local contract_address : felt
+    %{ ids.contract_address = deploy_contract("CONTRACT_PATH").contract_address %}
+    let (value) = Contract.get_value(contract_address)
+    assert value = 1
+    return ()
+end
+"""
+
+
+@pytest.fixture(name="project_path")
+def project_path_fixture(tmp_path: Path) -> Path:
+    (tmp_path / "lib.cairo").write_text(LIB_CODE.replace("AMOUNT", "1"), "utf-8")
+    (tmp_path / "contract.cairo").write_text(CONTRACT_CODE, "utf-8")
+    (tmp_path / "test_contract.cairo").write_text(
+        TEST_SUITE_CODE.replace("CONTRACT_PATH", str(tmp_path / "contract.cairo")),
+        "utf-8",
+    )
+    return tmp_path
+
+
+async def run_test_command(mocker: MockerFixture, project_path: Path) -> TestingSummary:
+    protostar_directory = mocker.MagicMock()
+    protostar_directory.add_protostar_cairo_dir.side_effect = lambda paths: paths
+    return await TestCommand(
+        project=mocker.MagicMock(),
+        protostar_directory=protostar_directory,
+    ).test(
+        targets=[str(project_path / "test_contract.cairo")],
+        cairo_path=[project_path],
+        results_cache_path=project_path / "test_results.json",
+    )
+
+
+def get_cached_test_cases_count(testing_summary: TestingSummary) -> int:
+    return sum(
+        isinstance(case_result, CachedTestCase)
+        for case_result in testing_summary.passed
+    )
+
+
+@pytest.mark.asyncio
+async def test_running_test_cases_again_after_changing_modules_of_deployed_contracts(
+    mocker: MockerFixture, project_path: Path
+):
+    first_summary = await run_test_command(mocker, project_path)
+    second_summary = await run_test_command(mocker, project_path)
+    (project_path / "lib.cairo").write_text(LIB_CODE.replace("AMOUNT", "2"), "utf-8")
+    third_summary = await run_test_command(mocker, project_path)
+
+    assert len(first_summary.passed) == 1
+    assert get_cached_test_cases_count(first_summary) == 0
+    assert get_cached_test_cases_count(second_summary) == 1
+    assert len(third_summary.failed) == 1